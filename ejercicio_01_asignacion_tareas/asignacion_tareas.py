@@ -5,15 +5,1394 @@ Problema de Asignación - Modelo de Investigación de Operaciones
 Objetivo: Minimizar el tiempo total asignando 4 tareas a 4 programadores
 """
 
-import itertools
+import copy
+import heapq
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 
 try:
     import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
     from scipy.optimize import linear_sum_assignment
-    SCIPY_AVAILABLE = True
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import min_weight_full_bipartite_matching
+    SCIPY_AVAILABLE = NUMPY_AVAILABLE
 except ImportError:
     SCIPY_AVAILABLE = False
 
+# Tamaño a partir del cual la ruta vectorizada de Jonker-Volgenant compensa
+UMBRAL_NUMPY = 150
+
+
+def _camino_aumentante(costos, u, v, fila_de_columna, columna_de_fila, fila):
+    """
+    Agrega `fila` al emparejamiento mediante el camino aumentante más corto
+    (Dijkstra sobre costos reducidos), actualizando los potenciales duales.
+
+    Versión en Python puro. `costos` es una lista de listas y `u`, `v`,
+    `fila_de_columna` y `columna_de_fila` son listas que se modifican in situ.
+    Se usa como paso básico del método de Jonker-Volgenant.
+    """
+    m = len(v)
+    INF = float('inf')
+    distancia = [INF] * m
+    previo = [-1] * m
+    restantes = list(range(m))
+    filas_visitadas = []
+    columnas_visitadas = []
+    valor_min = 0
+    i = fila
+    sumidero = -1
+
+    while sumidero == -1:
+        filas_visitadas.append(i)
+        fila_costos = costos[i]
+        base = valor_min - u[i]
+        menor = INF
+        indice = -1
+        for k, j in enumerate(restantes):
+            r = base + fila_costos[j] - v[j]
+            if r < distancia[j]:
+                previo[j] = i
+                distancia[j] = r
+            # En empate se prefiere una columna libre para cerrar el camino antes
+            if distancia[j] < menor or (distancia[j] == menor and fila_de_columna[j] == -1):
+                menor = distancia[j]
+                indice = k
+
+        if menor == INF:
+            raise ValueError("El problema de asignación no tiene solución factible")
+
+        valor_min = menor
+        j = restantes[indice]
+        restantes[indice] = restantes[-1]
+        restantes.pop()
+        columnas_visitadas.append(j)
+        if fila_de_columna[j] == -1:
+            sumidero = j
+        else:
+            i = fila_de_columna[j]
+
+    # Actualizar potenciales duales
+    u[fila] += valor_min
+    for i in filas_visitadas[1:]:
+        u[i] += valor_min - distancia[columna_de_fila[i]]
+    for j in columnas_visitadas:
+        v[j] -= valor_min - distancia[j]
+
+    # Invertir el camino aumentante
+    j = sumidero
+    while True:
+        i = previo[j]
+        fila_de_columna[j] = i
+        columna_de_fila[i], j = j, columna_de_fila[i]
+        if i == fila:
+            break
+
+
+def _camino_aumentante_np(costos, u, v, fila_de_columna, columna_de_fila, fila):
+    """
+    Equivalente vectorizado de `_camino_aumentante`: cada paso de Dijkstra
+    actualiza todas las columnas restantes con una sola operación de NumPy.
+    """
+    m = costos.shape[1]
+    distancia = np.full(m, np.inf)
+    previo = np.full(m, -1, dtype=np.int64)
+    restantes = np.arange(m)
+    filas_visitadas = []
+    columnas_visitadas = []
+    valor_min = 0.0
+    i = fila
+    sumidero = -1
+
+    while sumidero == -1:
+        filas_visitadas.append(i)
+        r = valor_min - u[i] + costos[i, restantes] - v[restantes]
+        dist_rest = distancia[restantes]
+        mejora = r < dist_rest
+        if mejora.any():
+            columnas_mejoradas = restantes[mejora]
+            previo[columnas_mejoradas] = i
+            distancia[columnas_mejoradas] = r[mejora]
+            dist_rest = np.where(mejora, r, dist_rest)
+
+        menor = dist_rest.min()
+        if menor == np.inf:
+            raise ValueError("El problema de asignación no tiene solución factible")
+
+        # En empate se prefiere una columna libre para cerrar el camino antes
+        empates = np.flatnonzero(dist_rest == menor)
+        libres = empates[fila_de_columna[restantes[empates]] == -1]
+        indice = libres[0] if len(libres) else empates[0]
+
+        valor_min = menor
+        j = int(restantes[indice])
+        restantes[indice] = restantes[-1]
+        restantes = restantes[:-1]
+        columnas_visitadas.append(j)
+        if fila_de_columna[j] == -1:
+            sumidero = j
+        else:
+            i = int(fila_de_columna[j])
+
+    # Actualizar potenciales duales
+    u[fila] += valor_min
+    if len(filas_visitadas) > 1:
+        otras = np.array(filas_visitadas[1:])
+        u[otras] += valor_min - distancia[columna_de_fila[otras]]
+    columnas = np.array(columnas_visitadas)
+    v[columnas] -= valor_min - distancia[columnas]
+
+    # Invertir el camino aumentante
+    j = sumidero
+    while True:
+        i = int(previo[j])
+        fila_de_columna[j] = i
+        columna_de_fila[i], j = j, int(columna_de_fila[i])
+        if i == fila:
+            break
+
+
+def algoritmo_hungaro_jv(tiempos, usar_numpy=None):
+    """
+    Resuelve el problema de asignación con el método de caminos aumentantes
+    más cortos de Jonker-Volgenant (variante O(n³) del Algoritmo Húngaro).
+
+    No depende de scipy: funciona en Python puro y, si NumPy está instalado,
+    vectoriza el recorrido de columnas de cada paso de Dijkstra.
+
+    Args:
+        tiempos: Matriz (lista de listas o array numpy) de forma (n, m)
+                 tiempos[i][j] = tiempo que tarda el programador i en la tarea j.
+                 Si n != m se asignan min(n, m) pares.
+        usar_numpy: True/False para forzar la ruta; None usa NumPy si está
+                    disponible y la matriz es grande (en matrices pequeñas el
+                    costo por llamada de NumPy supera al de Python puro).
+
+    Returns:
+        filas_asignadas: Índices de programadores asignados (ordenados)
+        columnas_asignadas: Índices de tareas asignadas
+        tiempo_total: Tiempo total mínimo
+    """
+    if len(tiempos) == 0 or len(tiempos[0]) == 0:
+        return [], [], 0
+    if usar_numpy is None:
+        usar_numpy = NUMPY_AVAILABLE and min(len(tiempos), len(tiempos[0])) >= UMBRAL_NUMPY
+    if usar_numpy and not NUMPY_AVAILABLE:
+        raise ImportError("NumPy no está instalado. Instálalo con: pip install numpy")
+
+    if usar_numpy:
+        costos = np.asarray(tiempos, dtype=float)
+        transpuesta = costos.shape[0] > costos.shape[1]
+        if transpuesta:
+            costos = costos.T
+        n, m = costos.shape
+        u = np.zeros(n)
+        v = np.zeros(m)
+        fila_de_columna = np.full(m, -1, dtype=np.int64)
+        columna_de_fila = np.full(n, -1, dtype=np.int64)
+        for fila in range(n):
+            _camino_aumentante_np(costos, u, v, fila_de_columna, columna_de_fila, fila)
+        columna_de_fila = columna_de_fila.tolist()
+    else:
+        costos = [list(fila) for fila in tiempos]
+        transpuesta = len(costos) > len(costos[0]) if costos else False
+        if transpuesta:
+            costos = [list(columna) for columna in zip(*costos)]
+        n = len(costos)
+        m = len(costos[0]) if n else 0
+        u = [0] * n
+        v = [0] * m
+        fila_de_columna = [-1] * m
+        columna_de_fila = [-1] * n
+        for fila in range(n):
+            _camino_aumentante(costos, u, v, fila_de_columna, columna_de_fila, fila)
+
+    if transpuesta:
+        pares = sorted((j, i) for i, j in enumerate(columna_de_fila))
+    else:
+        pares = list(enumerate(columna_de_fila))
+    filas_asignadas = [i for i, _ in pares]
+    columnas_asignadas = [j for _, j in pares]
+    tiempo_total = sum(tiempos[i][j] for i, j in pares)
+
+    return filas_asignadas, columnas_asignadas, tiempo_total
+
+
+def asignacion_dispersa(filas, columnas, costos, forma=None, costo_no_asignado=None):
+    """
+    Resuelve una asignación rectangular a partir solo de los pares factibles
+    (programador, tarea, costo), sin construir la matriz densa n×m.
+
+    Usa el algoritmo LAPJVsp de scipy (`min_weight_full_bipartite_matching`)
+    sobre una matriz CSR, por lo que la memoria crece con el número de
+    aristas y no con n×m.
+
+    Args:
+        filas, columnas, costos: Secuencias paralelas con los triples factibles.
+                                 Los pares repetidos conservan el menor costo.
+        forma: (n_programadores, n_tareas); por defecto se infiere de los índices.
+        costo_no_asignado: Si se indica, cada elemento del lado menor puede
+                           quedar sin asignar pagando este costo (evita la
+                           infactibilidad cuando alguien no tiene pares compatibles).
+
+    Returns:
+        filas_asignadas: Índices de programadores asignados
+        columnas_asignadas: Índices de tareas asignadas
+        tiempo_total: Suma de costos de los pares asignados
+    """
+    if not SCIPY_AVAILABLE:
+        raise ImportError("scipy no está instalado. Instálalo con: pip install scipy numpy")
+
+    filas = np.asarray(filas, dtype=np.int64)
+    columnas = np.asarray(columnas, dtype=np.int64)
+    costos = np.asarray(costos, dtype=float)
+    if forma is None:
+        forma = (int(filas.max()) + 1 if len(filas) else 0,
+                 int(columnas.max()) + 1 if len(columnas) else 0)
+    n, m = forma
+
+    # Pares repetidos: quedarse con el de menor costo
+    orden = np.lexsort((costos, columnas, filas))
+    filas, columnas, costos = filas[orden], columnas[orden], costos[orden]
+    unicos = np.ones(len(filas), dtype=bool)
+    unicos[1:] = (filas[1:] != filas[:-1]) | (columnas[1:] != columnas[:-1])
+    filas, columnas, costos = filas[unicos], columnas[unicos], costos[unicos]
+
+    # Aristas ficticias "sin asignar": una por elemento del lado menor
+    n_total, m_total = n, m
+    if costo_no_asignado is not None:
+        if n <= m:
+            ficticias = np.arange(n)
+            filas = np.concatenate([filas, ficticias])
+            columnas = np.concatenate([columnas, m + ficticias])
+            m_total = m + n
+        else:
+            ficticias = np.arange(m)
+            filas = np.concatenate([filas, n + ficticias])
+            columnas = np.concatenate([columnas, ficticias])
+            n_total = n + m
+        costos = np.concatenate([costos, np.full(len(ficticias), float(costo_no_asignado))])
+
+    # Todo emparejamiento completo usa min(n, m) aristas, así que desplazar los
+    # costos a valores positivos no cambia el óptimo y evita que un costo 0
+    # se confunda con una arista inexistente en la matriz dispersa.
+    desplazamiento = 1.0 - costos.min() if len(costos) else 0.0
+    grafo = csr_matrix((costos + desplazamiento, (filas, columnas)),
+                       shape=(n_total, m_total))
+    try:
+        filas_asignadas, columnas_asignadas = min_weight_full_bipartite_matching(grafo)
+    except ValueError:
+        raise ValueError("No existe una asignación completa con los pares factibles dados")
+
+    reales = (filas_asignadas < n) & (columnas_asignadas < m)
+    filas_asignadas = filas_asignadas[reales]
+    columnas_asignadas = columnas_asignadas[reales]
+    tiempo_total = 0.0
+    if len(filas_asignadas):
+        tiempo_total = (np.asarray(grafo[filas_asignadas, columnas_asignadas]).ravel()
+                        - desplazamiento).sum()
+
+    return filas_asignadas, columnas_asignadas, tiempo_total
+
+
+def _resolver_bloque(bloque):
+    """
+    Resuelve una secuencia de matrices; unidad de trabajo de cada proceso.
+    Con o sin scipy cada resultado es (lista, lista, float).
+    """
+    resultados = []
+    for tiempos in bloque:
+        if SCIPY_AVAILABLE:
+            tiempos = np.asarray(tiempos)
+            filas, columnas = linear_sum_assignment(tiempos)
+            tiempo_total = tiempos[filas, columnas].sum()
+            filas, columnas = filas.tolist(), columnas.tolist()
+        else:
+            filas, columnas, tiempo_total = algoritmo_hungaro_jv(tiempos)
+        resultados.append((filas, columnas, float(tiempo_total)))
+    return resultados
+
+
+def resolver_lote_asignacion(matrices, procesos=None, tam_bloque=None):
+    """
+    Resuelve muchas instancias independientes de asignación en una sola llamada
+    (por ejemplo, una matriz por squad y sprint).
+
+    Las instancias se agrupan en bloques para amortizar el costo de llamada y
+    de serialización, y los bloques se reparten entre procesos.
+
+    Args:
+        matrices: Array 3-D de forma (k, n, m) o lista de k matrices
+                  (pueden tener tamaños distintos).
+        procesos: Número de procesos; 1 resuelve en el proceso actual y None
+                  usa os.cpu_count().
+        tam_bloque: Instancias por bloque; por defecto reparte en ~4 bloques
+                    por proceso.
+
+    Returns:
+        resultados: Lista de k tuplas (filas_asignadas, columnas_asignadas, tiempo_total)
+                    con listas de índices y el tiempo total como float
+        instancias_por_segundo: Rendimiento obtenido
+    """
+    k = len(matrices)
+    if procesos is None:
+        procesos = os.cpu_count() or 1
+    procesos = max(1, min(procesos, k))
+    if tam_bloque is None:
+        tam_bloque = max(1, -(-k // (4 * procesos)))
+
+    inicio = time.perf_counter()
+    bloques = [matrices[i:i + tam_bloque] for i in range(0, k, tam_bloque)]
+    resultados = []
+    if procesos == 1:
+        for bloque in bloques:
+            resultados.extend(_resolver_bloque(bloque))
+    else:
+        with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+            for parcial in ejecutor.map(_resolver_bloque, bloques):
+                resultados.extend(parcial)
+    duracion = time.perf_counter() - inicio
+
+    instancias_por_segundo = k / duracion if duracion > 0 else float('inf')
+    return resultados, instancias_por_segundo
+
+
+def _perturbar(tiempos, cantidad, esquema, amplitud, niveles, rng):
+    """Genera un tensor (cantidad, n, m) de matrices perturbadas según `esquema`."""
+    forma = (cantidad,) + tiempos.shape
+    if esquema == 'uniforme':
+        factores = rng.uniform(1 - amplitud, 1 + amplitud, size=forma)
+    elif esquema == 'normal':
+        factores = np.clip(rng.normal(1.0, amplitud, size=forma), 0.0, None)
+    elif esquema == 'grilla':
+        factores = 1.0 + rng.choice(np.asarray(niveles, dtype=float), size=forma)
+    else:
+        raise ValueError(f"Esquema de perturbación desconocido: {esquema}")
+    return tiempos * factores
+
+
+def _barrer_bloque(tiempos, base, cantidad, esquema, amplitud, niveles, semilla):
+    """
+    Resuelve un bloque de escenarios y devuelve solo sus agregados.
+    `base` = (filas, columnas) de la asignación óptima sin perturbar: con
+    n > m se comparan ambas, porque solo se asigna un subconjunto de filas.
+    """
+    filas_base, columnas_base = base
+    rng = np.random.default_rng(semilla)
+    tensor = _perturbar(tiempos, cantidad, esquema, amplitud, niveles, rng)
+    frecuencia = np.zeros(tiempos.shape, dtype=np.int64)
+    totales = np.empty(cantidad)
+    iguales = 0
+    for k, escenario in enumerate(tensor):
+        if SCIPY_AVAILABLE:
+            filas, columnas = linear_sum_assignment(escenario)
+            totales[k] = escenario[filas, columnas].sum()
+        else:
+            filas, columnas, totales[k] = algoritmo_hungaro_jv(escenario)
+        frecuencia[filas, columnas] += 1
+        iguales += (np.array_equal(filas, filas_base)
+                    and np.array_equal(columnas, columnas_base))
+    return frecuencia, totales, iguales
+
+
+def barrido_sensibilidad(tiempos, n_escenarios, esquema='uniforme', amplitud=0.2,
+                         niveles=(-0.3, -0.2, -0.1, 0.0, 0.1, 0.2, 0.3),
+                         semilla=None, procesos=None, tam_bloque=2000):
+    """
+    Análisis de sensibilidad masivo: resuelve `n_escenarios` perturbaciones de
+    `tiempos` y va entregando métricas de robustez agregadas.
+
+    Cada bloque de escenarios se genera como un único tensor NumPy dentro del
+    proceso que lo resuelve (solo viaja la semilla, no las matrices), y los
+    bloques se reparten en un pool de procesos.
+
+    Args:
+        tiempos: Matriz base (n, m)
+        n_escenarios: Número total de escenarios
+        esquema: 'uniforme' (factor U(1-a, 1+a) por celda), 'normal'
+                 (factor N(1, a) truncado en 0) o 'grilla' (cada celda varía
+                 un porcentaje elegido de `niveles`)
+        amplitud: Parámetro `a` de los esquemas uniforme y normal
+        niveles: Variaciones relativas del esquema 'grilla'
+        semilla: Semilla para reproducibilidad
+        procesos: Número de procesos (None = os.cpu_count(), 1 = sin pool)
+        tam_bloque: Escenarios por bloque
+
+    Yields:
+        Diccionario acumulado tras cada bloque con:
+            escenarios: Escenarios resueltos hasta el momento
+            frecuencia_pares: Matriz (n, m) con la fracción de escenarios en
+                              que se elige cada par programador-tarea
+            tiempo_medio, tiempo_desviacion, tiempo_min, tiempo_max
+            percentiles: {5, 25, 50, 75, 95} del tiempo total óptimo
+            estabilidad: Fracción de escenarios con la misma asignación que la base
+        El último diccionario entregado resume el barrido completo.
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError("NumPy no está instalado. Instálalo con: pip install numpy")
+
+    tiempos = np.asarray(tiempos, dtype=float)
+    if SCIPY_AVAILABLE:
+        filas_base, columnas_base = linear_sum_assignment(tiempos)
+    else:
+        filas_base, columnas_base, _ = algoritmo_hungaro_jv(tiempos)
+    base = (np.asarray(filas_base), np.asarray(columnas_base))
+
+    cantidades = [min(tam_bloque, n_escenarios - i) for i in range(0, n_escenarios, tam_bloque)]
+    semillas = np.random.SeedSequence(semilla).spawn(len(cantidades))
+    argumentos = [(tiempos, base, c, esquema, amplitud, niveles, sem)
+                  for c, sem in zip(cantidades, semillas)]
+
+    if procesos is None:
+        procesos = os.cpu_count() or 1
+    procesos = max(1, min(procesos, len(argumentos)))
+
+    frecuencia = np.zeros(tiempos.shape, dtype=np.int64)
+    totales = []
+    iguales = 0
+    ejecutor = ProcessPoolExecutor(max_workers=procesos) if procesos > 1 else None
+    try:
+        if ejecutor is None:
+            bloques = (_barrer_bloque(*args) for args in argumentos)
+        else:
+            bloques = ejecutor.map(_barrer_bloque, *zip(*argumentos))
+        for frecuencia_bloque, totales_bloque, iguales_bloque in bloques:
+            frecuencia += frecuencia_bloque
+            totales.append(totales_bloque)
+            iguales += iguales_bloque
+
+            todos = np.concatenate(totales)
+            resueltos = len(todos)
+            yield {
+                'escenarios': resueltos,
+                'frecuencia_pares': frecuencia / resueltos,
+                'tiempo_medio': todos.mean(),
+                'tiempo_desviacion': todos.std(),
+                'tiempo_min': todos.min(),
+                'tiempo_max': todos.max(),
+                'percentiles': dict(zip((5, 25, 50, 75, 95),
+                                        np.percentile(todos, [5, 25, 50, 75, 95]))),
+                'estabilidad': iguales / resueltos,
+            }
+    finally:
+        if ejecutor is not None:
+            ejecutor.shutdown(cancel_futures=True)
+
+
+def _ofertas_subasta(inicio, indices, beneficios, precios, personas, epsilon, salto_unico):
+    """
+    Ronda de subasta de Jacobi: todas las `personas` sin objeto pujan a la vez.
+
+    Returns:
+        objetos ganados, persona ganadora de cada uno y su nuevo precio
+    """
+    grados = inicio[personas + 1] - inicio[personas]
+    cortes = np.cumsum(grados) - grados
+    segmento = np.repeat(np.arange(len(personas)), grados)
+    posiciones = np.arange(grados.sum()) - cortes[segmento] + inicio[personas][segmento]
+    objetos = indices[posiciones]
+    valores = beneficios[posiciones] - precios[objetos]
+
+    # Mejor y segundo mejor valor por persona
+    mejor = np.maximum.reduceat(valores, cortes)
+    candidatos = np.flatnonzero(valores == mejor[segmento])
+    _, primero = np.unique(segmento[candidatos], return_index=True)
+    pos_mejor = candidatos[primero]
+    valores[pos_mejor] = -np.inf
+    segundo = np.maximum.reduceat(valores, cortes)
+    segundo = np.where(np.isneginf(segundo), mejor - salto_unico, segundo)
+
+    objeto = objetos[pos_mejor]
+    puja = precios[objeto] + (mejor - segundo) + epsilon
+
+    # Cada objeto se lo queda la puja más alta
+    orden = np.lexsort((-puja, objeto))
+    objeto, persona, puja = objeto[orden], personas[orden], puja[orden]
+    primeras = np.ones(len(objeto), dtype=bool)
+    primeras[1:] = objeto[1:] != objeto[:-1]
+    return objeto[primeras], persona[primeras], puja[primeras]
+
+
+def _beneficio_asignado(inicio, indices, beneficios, columna_de_fila):
+    """Beneficio del par asignado a cada fila (un único par por (fila, columna))."""
+    fila_de_arista = np.repeat(np.arange(len(inicio) - 1), np.diff(inicio))
+    return beneficios[indices == columna_de_fila[fila_de_arista]]
+
+
+def _brecha_dual(inicio, indices, beneficios, precios, columna_de_fila):
+    """Brecha entre la cota dual de los precios y el beneficio de la asignación."""
+    valores = beneficios - precios[indices]
+    dual = precios.sum() + np.maximum.reduceat(valores, inicio[:-1]).sum()
+    primal = _beneficio_asignado(inicio, indices, beneficios, columna_de_fila).sum()
+    return dual - primal
+
+
+def algoritmo_subasta(tiempos, epsilon=None, max_segundos=None, factor_escala=5.0):
+    """
+    Resuelve una asignación cuadrada con el algoritmo de subasta de Bertsekas
+    (subasta directa tipo Jacobi con escalamiento de epsilon).
+
+    Pensado para instancias muy grandes en las que se acepta una
+    subóptimalidad acotada a cambio de tiempo: la asignación final es
+    ε-óptima (tiempo_total ≤ óptimo + n·ε) y se informa la brecha dual real.
+
+    Args:
+        tiempos: Matriz densa (n, n) o tupla (filas, columnas, costos) con los
+                 pares factibles de una instancia dispersa n×n (los pares
+                 repetidos conservan el menor costo)
+        epsilon: ε final; por defecto 1/(n+1), que da el óptimo exacto con
+                 costos enteros
+        max_segundos: Límite de tiempo. Al agotarse se devuelve la última
+                      asignación completa (la primera fase siempre termina)
+        factor_escala: Divisor de ε entre fases
+
+    Returns:
+        filas_asignadas: Índices de programadores (0..n-1)
+        columnas_asignadas: Tarea asignada a cada programador
+        tiempo_total: Tiempo total de la asignación
+        brecha_dual: Diferencia con la cota inferior dual (0 = óptimo probado)
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError("NumPy no está instalado. Instálalo con: pip install numpy")
+
+    if isinstance(tiempos, tuple):
+        filas, columnas, costos = (np.asarray(x) for x in tiempos)
+        n = int(max(filas.max(), columnas.max())) + 1
+    else:
+        matriz = np.asarray(tiempos, dtype=float)
+        n = matriz.shape[0]
+        if matriz.shape[1] != n:
+            raise ValueError("La subasta requiere una matriz cuadrada; usa asignacion_dispersa")
+        filas, columnas = np.divmod(np.arange(n * n), n)
+        costos = matriz.ravel()
+
+    costos = np.asarray(costos, dtype=float)
+    orden = np.lexsort((costos, columnas, filas))
+    filas, columnas, costos = filas[orden], columnas[orden], costos[orden]
+    unicos = np.ones(len(filas), dtype=bool)
+    unicos[1:] = (filas[1:] != filas[:-1]) | (columnas[1:] != columnas[:-1])
+    indices = columnas[unicos].astype(np.int64)
+    beneficios = -costos[unicos]
+    inicio = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(filas[unicos], minlength=n), out=inicio[1:])
+    if (np.diff(inicio) == 0).any():
+        raise ValueError("Hay programadores sin ninguna tarea factible")
+
+    rango = beneficios.max() - beneficios.min()
+    if epsilon is None:
+        epsilon = 1.0 / (n + 1)
+    eps = max(rango / 2, epsilon)
+    salto_unico = rango + eps  # puja de quien tiene una sola opción
+    limite_precio = 2 * n * (rango + eps) + 1
+
+    limite = None if max_segundos is None else time.perf_counter() + max_segundos
+    precios = np.zeros(n)
+    mejor = None  # (columna_de_fila, precios) de la última fase completada
+
+    while True:
+        columna_de_fila = np.full(n, -1, dtype=np.int64)
+        fila_de_columna = np.full(n, -1, dtype=np.int64)
+        agotado = False
+        while True:
+            libres = np.flatnonzero(columna_de_fila == -1)
+            if len(libres) == 0:
+                break
+            if mejor is not None and limite is not None and time.perf_counter() > limite:
+                agotado = True
+                break
+            objeto, persona, puja = _ofertas_subasta(inicio, indices, beneficios, precios,
+                                                     libres, eps, salto_unico)
+            anteriores = fila_de_columna[objeto]
+            columna_de_fila[anteriores[anteriores >= 0]] = -1
+            fila_de_columna[objeto] = persona
+            columna_de_fila[persona] = objeto
+            precios[objeto] = puja
+            if puja.max() - precios.min() > limite_precio:
+                raise ValueError("No existe una asignación completa con los pares factibles dados")
+
+        if agotado:
+            break
+        mejor = (columna_de_fila, precios.copy())
+        if eps <= epsilon or (limite is not None and time.perf_counter() > limite):
+            break
+        eps = max(eps / factor_escala, epsilon)
+
+    columna_de_fila, precios_fase = mejor
+    brecha = _brecha_dual(inicio, indices, beneficios, precios_fase, columna_de_fila)
+    tiempo_total = -_beneficio_asignado(inicio, indices, beneficios, columna_de_fila).sum()
+
+    return np.arange(n), columna_de_fila, tiempo_total, brecha
+
+
+class AsignacionIncremental:
+    """
+    Asignación que conserva los potenciales duales (u, v) y el emparejamiento
+    actual para re-optimizar en O(n²) cuando cambia una celda, una fila o una
+    columna de `tiempos`, en lugar de resolver desde cero.
+
+    Pensada para las sesiones "what-if" del análisis de sensibilidad
+    (variaciones de ±10/20/30% y programadores no disponibles). Las matrices
+    rectangulares se completan con filas o columnas ficticias de costo 0; si
+    sobran programadores, las filas inactivas reciben un costo uniforme mayor
+    que cualquier ahorro posible, de modo que ocupan las columnas ficticias y
+    nunca le quitan una tarea real a un programador activo.
+
+    Ejemplo:
+        modelo = AsignacionIncremental(tiempos)
+        modelo.actualizar_celda(0, 2, 4)
+        modelo.desactivar_programador(1)
+        filas, columnas, total = modelo.solucion()
+    """
+
+    def __init__(self, tiempos, usar_numpy=None, estado=None):
+        """
+        Args:
+            tiempos: Matriz (n, m) de tiempos
+            usar_numpy: Igual que en `algoritmo_hungaro_jv`
+            estado: (u, v, fila_de_columna, columna_de_fila) de una solución
+                    óptima ya conocida para `tiempos` (ver `estado()`); si se
+                    indica, no se resuelve desde cero
+        """
+        n = len(tiempos)
+        m = len(tiempos[0])
+        N = max(n, m)
+        if usar_numpy is None:
+            usar_numpy = NUMPY_AVAILABLE and N >= UMBRAL_NUMPY
+
+        self.n_programadores = n
+        self.n_tareas = m
+        self.usar_numpy = usar_numpy
+        self.inactivos = {}  # fila -> costos originales del programador
+
+        if usar_numpy:
+            self.costos = np.zeros((N, N))
+            self.costos[:n, :m] = np.asarray(tiempos, dtype=float)
+            self.u = np.zeros(N)
+            self.v = np.zeros(N)
+            self.fila_de_columna = np.full(N, -1, dtype=np.int64)
+            self.columna_de_fila = np.full(N, -1, dtype=np.int64)
+            self._camino = _camino_aumentante_np
+        else:
+            self.costos = [list(fila) + [0] * (N - m) for fila in tiempos]
+            self.costos += [[0] * N for _ in range(N - n)]
+            self.u = [0] * N
+            self.v = [0] * N
+            self.fila_de_columna = [-1] * N
+            self.columna_de_fila = [-1] * N
+            self._camino = _camino_aumentante
+
+        if estado is not None:
+            self._restaurar(estado)
+            return
+        for fila in range(N):
+            self._camino(self.costos, self.u, self.v,
+                         self.fila_de_columna, self.columna_de_fila, fila)
+
+    def estado(self):
+        """Copia de los potenciales y el emparejamiento: O(n) en lugar de O(n²)."""
+        return (self.u.copy(), self.v.copy(),
+                self.fila_de_columna.copy(), self.columna_de_fila.copy())
+
+    def _restaurar(self, estado):
+        u, v, fila_de_columna, columna_de_fila = estado
+        self.u, self.v = u.copy(), v.copy()
+        self.fila_de_columna = fila_de_columna.copy()
+        self.columna_de_fila = columna_de_fila.copy()
+
+    def copiar(self):
+        """Copia independiente del modelo (costos, potenciales y emparejamiento)."""
+        nuevo = copy.copy(self)
+        if self.usar_numpy:
+            nuevo.costos = self.costos.copy()
+        else:
+            nuevo.costos = [fila[:] for fila in self.costos]
+        nuevo.u = self.u.copy()
+        nuevo.v = self.v.copy()
+        nuevo.fila_de_columna = self.fila_de_columna.copy()
+        nuevo.columna_de_fila = self.columna_de_fila.copy()
+        nuevo.inactivos = {i: fila[:] for i, fila in self.inactivos.items()}
+        return nuevo
+
+    def _reoptimizar_fila(self, fila):
+        """Libera la tarea de `fila` y la vuelve a insertar por el camino más corto."""
+        j = self.columna_de_fila[fila]
+        if j != -1:
+            self.fila_de_columna[j] = -1
+            self.columna_de_fila[fila] = -1
+        self._camino(self.costos, self.u, self.v,
+                     self.fila_de_columna, self.columna_de_fila, fila)
+
+    def _ajustar_inactivos(self):
+        """
+        Mantiene el costo de las filas inactivas por encima de la suma de los
+        rangos (máximo - mínimo) de las filas activas: así ningún camino
+        alternante abarata la solución cediéndoles una tarea real mientras
+        quede una columna ficticia libre. Solo aplica con más programadores
+        que tareas; si no, el costo 0 ya es neutro.
+        """
+        m = self.n_tareas
+        if not self.inactivos or self.n_programadores <= m:
+            return
+        # La fila completa incluye las columnas ficticias (costo 0)
+        rango = sum(max(self.costos[i]) - min(self.costos[i])
+                    for i in range(self.n_programadores) if i not in self.inactivos)
+        for i in self.inactivos:
+            if self.costos[i][0] > rango:
+                continue
+            self.costos[i][:m] = [rango + 1] * m
+            if self.columna_de_fila[i] < m:
+                self._reoptimizar_fila(i)
+
+    def actualizar_celda(self, i, j, valor):
+        """Cambia tiempos[i][j]; solo re-optimiza si se rompe la optimalidad."""
+        if i in self.inactivos:
+            self.inactivos[i][j] = valor
+            return
+        anterior = self.costos[i][j]
+        self.costos[i][j] = valor
+        if self.columna_de_fila[i] == j:
+            if valor <= anterior:
+                # Bajar u[i] mantiene la factibilidad dual y la holgura cero
+                self.u[i] += valor - anterior
+            else:
+                self._reoptimizar_fila(i)
+        elif valor - self.u[i] - self.v[j] < 0:
+            self._reoptimizar_fila(i)
+        if valor > anterior:
+            self._ajustar_inactivos()
+
+    def fijar_par(self, i, j):
+        """
+        Obliga al programador i a tomar la tarea j: el resto de su fila pasa
+        a tiempo infinito. Si ya tenía la tarea j no hace falta re-optimizar.
+        """
+        INF = float('inf')
+        if i in self.inactivos:
+            valor = self.inactivos[i][j]
+            self.inactivos[i] = [INF] * self.n_tareas
+            self.inactivos[i][j] = valor
+            return
+        valor = self.costos[i][j]
+        self.costos[i][:] = [INF] * len(self.costos[i])
+        self.costos[i][j] = valor
+        if self.columna_de_fila[i] != j:
+            self._reoptimizar_fila(i)
+
+    def actualizar_fila(self, i, valores):
+        """Reemplaza todos los tiempos del programador i."""
+        if i in self.inactivos:
+            self.inactivos[i] = list(valores)
+            return
+        self.costos[i][:self.n_tareas] = valores
+        self._reoptimizar_fila(i)
+        self._ajustar_inactivos()
+
+    def actualizar_columna(self, j, valores):
+        """Reemplaza los tiempos de la tarea j para todos los programadores."""
+        for i, valor in enumerate(valores):
+            if i in self.inactivos:
+                self.inactivos[i][j] = valor
+            else:
+                self.costos[i][j] = valor
+
+        # v[j] factible para todas las filas salvo la que tenía la tarea j,
+        # que se libera y se vuelve a insertar
+        fila = self.fila_de_columna[j]
+        self.fila_de_columna[j] = -1
+        self.columna_de_fila[fila] = -1
+        self.v[j] = min((self.costos[i][j] - self.u[i]
+                         for i in range(len(self.u)) if i != fila), default=self.v[j])
+        self._camino(self.costos, self.u, self.v,
+                     self.fila_de_columna, self.columna_de_fila, fila)
+        self._ajustar_inactivos()
+
+    def desactivar_programador(self, i):
+        """Marca al programador i como no disponible (su fila pasa a ser ficticia)."""
+        if i in self.inactivos:
+            return
+        self.inactivos[i] = list(self.costos[i][:self.n_tareas])
+        self.costos[i][:self.n_tareas] = [0] * self.n_tareas
+        self._reoptimizar_fila(i)
+        self._ajustar_inactivos()
+
+    def activar_programador(self, i):
+        """Devuelve al programador i al modelo con sus tiempos guardados."""
+        if i not in self.inactivos:
+            return
+        self.costos[i][:self.n_tareas] = self.inactivos.pop(i)
+        self._reoptimizar_fila(i)
+        self._ajustar_inactivos()
+
+    def escalar(self, factor):
+        """
+        Multiplica todos los tiempos por `factor` (> 0), p. ej. 1.1 para +10%.
+        La asignación óptima no cambia y los potenciales se escalan igual.
+        """
+        if self.usar_numpy:
+            self.costos *= factor
+            self.u *= factor
+            self.v *= factor
+        else:
+            self.costos = [[c * factor for c in fila] for fila in self.costos]
+            self.u = [x * factor for x in self.u]
+            self.v = [x * factor for x in self.v]
+        for i, fila in self.inactivos.items():
+            self.inactivos[i] = [c * factor for c in fila]
+
+    def solucion(self):
+        """
+        Returns:
+            filas_asignadas, columnas_asignadas, tiempo_total de la asignación
+            vigente (sin programadores inactivos ni tareas ficticias)
+        """
+        filas_asignadas = []
+        columnas_asignadas = []
+        tiempo_total = 0
+        for i in range(self.n_programadores):
+            j = int(self.columna_de_fila[i])
+            if i in self.inactivos or j >= self.n_tareas:
+                continue
+            filas_asignadas.append(i)
+            columnas_asignadas.append(j)
+            tiempo_total += self.costos[i][j]
+        return filas_asignadas, columnas_asignadas, tiempo_total
+
+
+def _asignacion_restringida(tiempos, forzados, prohibidos, estado, usar_numpy):
+    """
+    Reconstruye el modelo incremental de un subproblema de Murty a partir de
+    su solución guardada: cada par forzado deja su fila con una sola celda
+    finita y cada par prohibido pasa a tiempo infinito. No resuelve nada.
+    """
+    INF = float('inf')
+    restringida = [list(fila) for fila in tiempos]
+    for fila, columna in forzados:
+        restringida[fila] = [INF] * len(restringida[fila])
+        restringida[fila][columna] = tiempos[fila][columna]
+    for fila, columna in prohibidos:
+        restringida[fila][columna] = INF
+    return AsignacionIncremental(restringida, usar_numpy=usar_numpy, estado=estado)
+
+
+def k_mejores_asignaciones(tiempos, k=None, usar_numpy=None):
+    """
+    Genera las asignaciones en orden no decreciente de tiempo total
+    (1ª = óptima, 2ª, 3ª, ...) con el particionamiento de Murty.
+
+    La cola guarda por subproblema sus pares forzados y prohibidos y el
+    estado de su solución (potenciales y emparejamiento, memoria O(n) por
+    nodo en vez de una matriz). Al extraer un nodo su modelo se reconstruye
+    ya resuelto, y cada hijo parte de la solución del padre: prohibir un par
+    asignado libera una sola fila, por lo que cada hijo cuesta un camino
+    aumentante (O(n²)) con `AsignacionIncremental` en vez de una resolución
+    completa.
+
+    Args:
+        tiempos: Matriz (lista de listas o array numpy) de forma (n, m)
+        k: Número máximo de asignaciones a generar (None = todas)
+        usar_numpy: Igual que en `AsignacionIncremental`
+
+    Yields:
+        filas_asignadas, columnas_asignadas, tiempo_total
+    """
+    INF = float('inf')
+    n = len(tiempos)
+    m = len(tiempos[0])
+    transpuesta = n > m
+    if transpuesta:
+        # Particionar siempre sobre el lado menor evita repetir asignaciones
+        # que solo difieren en filas o columnas ficticias
+        tiempos = [list(columna) for columna in zip(*tiempos)]
+        n, m = m, n
+
+    try:
+        modelo = AsignacionIncremental(tiempos, usar_numpy=usar_numpy)
+    except ValueError:
+        return
+
+    contador = 0  # desempate estable en el heap
+    cola = [(modelo.solucion()[2], contador, [], [], modelo.estado(), list(range(n)))]
+    generadas = 0
+
+    while cola and (k is None or generadas < k):
+        tiempo_total, _, forzados, prohibidos, estado, libres = heapq.heappop(cola)
+        if generadas:
+            modelo = _asignacion_restringida(tiempos, forzados, prohibidos, estado, usar_numpy)
+        filas, columnas, _ = modelo.solucion()
+        if transpuesta:
+            pares = sorted(zip(columnas, filas))
+            yield [i for i, _ in pares], [j for _, j in pares], tiempo_total
+        else:
+            yield filas, columnas, tiempo_total
+        generadas += 1
+        if k is not None and generadas >= k:
+            break
+
+        # Hijo r: fija los pares de libres[:r] y prohíbe el par de libres[r].
+        # Cada hijo se evalúa sobre el modelo del padre y luego se deshace
+        for r, fila in enumerate(libres):
+            columna = columnas[fila]
+            padre = modelo.estado()
+            try:
+                modelo.actualizar_celda(fila, columna, INF)
+            except ValueError:
+                pass  # subproblema infactible
+            else:
+                contador += 1
+                heapq.heappush(cola, (modelo.solucion()[2], contador,
+                                      forzados + [(f, columnas[f]) for f in libres[:r]],
+                                      prohibidos + [(fila, columna)],
+                                      modelo.estado(), libres[r:]))
+            modelo.costos[fila][columna] = tiempos[fila][columna]
+            modelo._restaurar(padre)
+
+            if r + 1 < len(libres):
+                modelo.fijar_par(fila, columna)
+
+
+class AsignadorEnLinea:
+    """
+    Asignación en línea para tareas que llegan de forma continua.
+
+    Mantiene un pool vivo de programadores libres. Cada tarea nueva se asigna
+    al programador libre más rápido para ella (O(P) por evento, latencia
+    acotada) y, opcionalmente, cada `reoptimizar_cada` tareas se re-planifican
+    las últimas tareas de la ventana resolviendo una asignación óptima pequeña
+    con `algoritmo_hungaro_jv` entre sus programadores y los que estén libres.
+    Una tarea marcada con `iniciar` sale de la ventana y ya no se reasigna.
+
+    Ejemplo:
+        asignador = AsignadorEnLinea(4, reoptimizar_cada=8)
+        for tipo, tarea, programador in asignador.procesar_flujo(eventos):
+            ...
+        asignador.metricas_latencia()
+    """
+
+    def __init__(self, n_programadores, reoptimizar_cada=None):
+        self.libres = set(range(n_programadores))
+        self.programador_de = {}   # tarea -> programador
+        self.tarea_de = {}         # programador -> tarea
+        self.tiempos_de = {}       # tarea -> tiempos por programador
+        self.en_espera = deque()   # tareas sin programador libre
+        self.ventana = []          # tareas recientes aún no iniciadas
+        self.reoptimizar_cada = reoptimizar_cada
+        self.ultimas_reasignaciones = []
+        self.latencias = []
+
+    def _ocupar(self, tarea, programador):
+        self.libres.discard(programador)
+        self.programador_de[tarea] = programador
+        self.tarea_de[programador] = tarea
+
+    def asignar(self, tarea, tiempos):
+        """
+        Asigna una tarea recién llegada.
+
+        Args:
+            tarea: Identificador de la tarea
+            tiempos: Tiempo de la tarea para cada programador (índice = programador)
+
+        Returns:
+            Programador asignado, o None si no hay nadie libre (queda en espera).
+            Los cambios de una re-optimización quedan en `ultimas_reasignaciones`.
+        """
+        inicio = time.perf_counter()
+        self.tiempos_de[tarea] = tiempos
+        self.ultimas_reasignaciones = []
+
+        if self.libres:
+            programador = min(self.libres, key=tiempos.__getitem__)
+            self._ocupar(tarea, programador)
+            self.ventana.append(tarea)
+            if self.reoptimizar_cada and len(self.ventana) >= self.reoptimizar_cada:
+                self.ultimas_reasignaciones = self._reoptimizar_ventana()
+                programador = self.programador_de[tarea]
+        else:
+            programador = None
+            self.en_espera.append(tarea)
+
+        self.latencias.append(time.perf_counter() - inicio)
+        return programador
+
+    def _reoptimizar_ventana(self):
+        """Re-asigna óptimamente las tareas de la ventana; devuelve los cambios."""
+        tareas = [t for t in self.ventana if t in self.programador_de]
+        self.ventana = []
+        if len(tareas) < 2:
+            return []
+
+        programadores = sorted({self.programador_de[t] for t in tareas} | self.libres)
+        matriz = [[self.tiempos_de[t][p] for p in programadores] for t in tareas]
+        _, columnas, _ = algoritmo_hungaro_jv(matriz)
+
+        anteriores = {t: self.programador_de.pop(t) for t in tareas}
+        for t in tareas:
+            p = anteriores[t]
+            del self.tarea_de[p]
+            self.libres.add(p)
+
+        cambios = []
+        for t, j in zip(tareas, columnas):
+            programador = programadores[j]
+            self._ocupar(t, programador)
+            if programador != anteriores[t]:
+                cambios.append((t, programador))
+        return cambios
+
+    def iniciar(self, tarea):
+        """Marca la tarea como iniciada: conserva su programador en las re-optimizaciones."""
+        if tarea in self.ventana:
+            self.ventana.remove(tarea)
+
+    def liberar(self, programador):
+        """
+        Marca como terminada la tarea del programador y lo devuelve al pool.
+
+        Returns:
+            (tarea, programador) si se le asignó una tarea en espera, o None.
+        """
+        tarea = self.tarea_de.pop(programador, None)
+        if tarea is not None:
+            del self.programador_de[tarea]
+            del self.tiempos_de[tarea]
+            if tarea in self.ventana:
+                self.ventana.remove(tarea)
+        self.libres.add(programador)
+
+        if self.en_espera:
+            siguiente = self.en_espera.popleft()
+            self._ocupar(siguiente, programador)
+            return siguiente, programador
+        return None
+
+    def procesar_flujo(self, eventos):
+        """
+        Procesa un flujo de eventos y genera cada decisión tomada.
+
+        Args:
+            eventos: Iterable de ('tarea', id, tiempos), ('iniciar', id) o
+                ('liberar', programador)
+
+        Yields:
+            ('asignacion' | 'reasignacion' | 'espera', tarea, programador)
+        """
+        for evento in eventos:
+            if evento[0] == 'tarea':
+                _, tarea, tiempos = evento
+                programador = self.asignar(tarea, tiempos)
+                if programador is None:
+                    yield 'espera', tarea, None
+                    continue
+                yield 'asignacion', tarea, programador
+                for otra, nuevo in self.ultimas_reasignaciones:
+                    if otra != tarea:
+                        yield 'reasignacion', otra, nuevo
+            elif evento[0] == 'iniciar':
+                self.iniciar(evento[1])
+            elif evento[0] == 'liberar':
+                decision = self.liberar(evento[1])
+                if decision is not None:
+                    yield ('asignacion',) + decision
+            else:
+                raise ValueError(f"Evento desconocido: {evento[0]}")
+
+    def metricas_latencia(self):
+        """
+        Returns:
+            Diccionario con eventos, p50, p99 y máximo de la latencia de
+            decisión por tarea (en milisegundos).
+        """
+        if not self.latencias:
+            return {'eventos': 0, 'p50_ms': 0.0, 'p99_ms': 0.0, 'max_ms': 0.0}
+        ordenadas = sorted(self.latencias)
+        n = len(ordenadas)
+        return {
+            'eventos': n,
+            'p50_ms': ordenadas[(n - 1) // 2] * 1000,
+            'p99_ms': ordenadas[min(n - 1, int(0.99 * n))] * 1000,
+            'max_ms': ordenadas[-1] * 1000,
+        }
+
+
+def _arrepentimiento(deseabilidad, horas, holgura, j):
+    """Mejor opción factible de la tarea j y su arrepentimiento frente a la segunda."""
+    opciones = np.where(horas[:, j] <= holgura + 1e-9, deseabilidad[:, j], np.inf)
+    i = int(np.argmin(opciones))
+    mejor = opciones[i]
+    opciones[i] = np.inf
+    segunda = opciones.min()
+    if mejor == np.inf:
+        return -1, np.inf
+    return i, segunda - mejor
+
+
+def _insertar_por_arrepentimiento(deseabilidad, horas, holgura, asignacion, pendientes):
+    """
+    Inserta las tareas `pendientes` empezando por la de mayor arrepentimiento
+    (diferencia entre su mejor y segunda mejor opción factible), cada una en
+    su opción más deseable. Los arrepentimientos se recalculan de forma
+    perezosa: al sacar una tarea del heap se re-evalúa con la holgura actual y
+    solo se inserta si sigue siendo la más urgente.
+
+    Modifica `asignacion` y `holgura` in situ; devuelve False si alguna tarea
+    no cabe en nadie.
+    """
+    heap = []
+    for j in pendientes:
+        _, arrepentimiento = _arrepentimiento(deseabilidad, horas, holgura, j)
+        heap.append((-arrepentimiento, int(j)))
+    heapq.heapify(heap)
+
+    while heap:
+        _, j = heapq.heappop(heap)
+        i, arrepentimiento = _arrepentimiento(deseabilidad, horas, holgura, j)
+        if i == -1:
+            return False
+        if heap and -arrepentimiento > heap[0][0]:
+            heapq.heappush(heap, (-arrepentimiento, j))
+            continue
+        asignacion[j] = i
+        holgura[i] -= horas[i, j]
+    return True
+
+
+def _descargar_excedidos(costos, horas, capacidad, asignacion, carga):
+    """
+    Mueve tareas de cada programador excedido al destino con holgura de menor
+    aumento de costo por hora liberada (las tareas de 0 horas no liberan nada
+    y no se consideran). Modifica `asignacion` y `carga` in situ; devuelve
+    False si algún programador queda excedido.
+    """
+    for i in np.flatnonzero(carga > capacidad + 1e-9):
+        while carga[i] > capacidad[i] + 1e-9:
+            propias = np.flatnonzero(asignacion == i)
+            holgura = capacidad - carga
+            libera = horas[i, propias]
+            cabe = (horas[:, propias] <= holgura[:, None] + 1e-9) & (libera > 0)
+            cabe[i] = False
+            if not cabe.any():
+                return False
+            aumento = np.where(cabe, costos[:, propias] - costos[i, propias], np.inf)
+            aumento = aumento / np.where(libera > 0, libera, 1.0)
+            k, t = np.unravel_index(np.argmin(aumento), aumento.shape)
+            j = propias[t]
+            asignacion[j] = k
+            carga[i] -= horas[i, j]
+            carga[k] += horas[k, j]
+    return True
+
+
+def _reparar_generalizada(costos, horas, capacidad, asignacion, reducidos):
+    """
+    Convierte una asignación posiblemente sobrecargada en una factible.
+
+    Primero intenta mover tareas de los programadores excedidos una a una.
+    Si se traba, descarga a cada excedido (primero las tareas más baratas de
+    mover) y reinserta esas tareas por arrepentimiento sobre los costos
+    `reducidos` de la relajación lagrangiana; como último recurso rehace la
+    asignación completa, primero con esos costos y luego priorizando la
+    factibilidad (horas / capacidad, como en la heurística MTHG de Martello y
+    Toth). Termina con una pasada rápida de desplazamientos.
+
+    Returns:
+        asignacion factible (array) o None si la heurística no lo consigue
+    """
+    m, n = costos.shape
+    tareas = np.arange(n)
+    carga = np.bincount(asignacion, weights=horas[asignacion, tareas], minlength=m)
+    movida = asignacion.copy()
+    carga_movida = carga.copy()
+    if _descargar_excedidos(costos, horas, capacidad, movida, carga_movida):
+        asignacion, carga = movida, carga_movida
+    else:
+        asignacion = asignacion.copy()
+
+    pendientes = []
+    alternativa = np.partition(costos, 1, axis=0)[1] if m > 1 else costos[0]
+    for i in np.flatnonzero(carga > capacidad + 1e-9):
+        propias = np.flatnonzero(asignacion == i)
+        libera = horas[i, propias]
+        # Las tareas de 0 horas no descargan al programador: quedan al final
+        costo_mover = np.where(libera > 0, alternativa[propias] - costos[i, propias], np.inf)
+        costo_mover = costo_mover / np.where(libera > 0, libera, 1.0)
+        for j in propias[np.argsort(costo_mover)]:
+            if carga[i] <= capacidad[i] + 1e-9:
+                break
+            carga[i] -= horas[i, j]
+            pendientes.append(j)
+
+    if pendientes:
+        holgura = capacidad - carga
+        intentos = [
+            (reducidos, holgura, pendientes),
+            (reducidos, capacidad.astype(float), tareas),
+            (horas / capacidad[:, None], capacidad.astype(float), tareas),
+        ]
+        for deseabilidad, holgura_inicial, por_insertar in intentos:
+            intento = asignacion.copy()
+            if _insertar_por_arrepentimiento(deseabilidad, horas, holgura_inicial.copy(),
+                                             intento, por_insertar):
+                break
+        else:
+            return None
+        asignacion = intento
+        carga = np.bincount(asignacion, weights=horas[asignacion, tareas], minlength=m)
+
+    _mejorar_generalizada(costos, horas, capacidad, asignacion, carga,
+                          max_pasadas=1, intercambios=False)
+    return asignacion
+
+
+def _mejorar_generalizada(costos, horas, capacidad, asignacion, carga,
+                          max_pasadas=5, intercambios=True, limite=None):
+    """
+    Búsqueda local sobre una asignación factible: desplazamientos (mover una
+    tarea a quien tenga holgura) e intercambios (dos tareas de programadores
+    distintos cambian de dueño), evaluando cada tarea contra todas las demás
+    de forma vectorizada. Modifica `asignacion` y `carga` in situ.
+    """
+    tareas = np.arange(len(asignacion))
+    for _ in range(max_pasadas):
+        if limite is not None and time.perf_counter() > limite:
+            break
+        mejoro = False
+        for j in np.argsort(costos[asignacion, tareas] - costos.min(axis=0))[::-1]:
+            i = asignacion[j]
+
+            # Desplazamiento
+            holgura = capacidad - carga
+            holgura[i] += horas[i, j]
+            opciones = np.where(horas[:, j] <= holgura + 1e-9, costos[:, j], np.inf)
+            k = int(np.argmin(opciones))
+            if opciones[k] < costos[i, j] - 1e-9:
+                asignacion[j] = k
+                carga[i] -= horas[i, j]
+                carga[k] += horas[k, j]
+                mejoro = True
+                continue
+            if not intercambios:
+                continue
+
+            # Intercambio con la tarea t del programador k = asignacion[t]
+            k = asignacion
+            delta = (costos[k, j] + costos[i, tareas]
+                     - costos[i, j] - costos[k, tareas])
+            factible = ((carga[i] - horas[i, j] + horas[i, tareas] <= capacidad[i] + 1e-9)
+                        & (carga[k] - horas[k, tareas] + horas[k, j] <= capacidad[k] + 1e-9)
+                        & (k != i))
+            delta = np.where(factible, delta, np.inf)
+            t = int(np.argmin(delta))
+            if delta[t] < -1e-9:
+                k = asignacion[t]
+                carga[i] += horas[i, t] - horas[i, j]
+                carga[k] += horas[k, j] - horas[k, t]
+                asignacion[j], asignacion[t] = k, i
+                mejoro = True
+        if not mejoro:
+            break
+
+
+def asignacion_generalizada(costos, horas, capacidad, iteraciones=300, max_segundos=None):
+    """
+    Problema de asignación generalizada (GAP): cada programador puede recibir
+    varias tareas mientras la suma de sus horas no supere su capacidad.
+
+    Minimizar sum(costos[i][j] * x[i][j])
+    s.a.  cada tarea j se asigna a exactamente un programador
+          sum_j horas[i][j] * x[i][j] <= capacidad[i]   para cada programador i
+
+    Se resuelve por relajación lagrangiana de las capacidades con
+    subgradiente: cada iteración es un mínimo por columna (vectorizado) que
+    da una cota inferior, y periódicamente la solución relajada se repara
+    hasta hacerla factible para obtener una cota superior. La mejor solución
+    se pule al final con búsqueda local (desplazamientos e intercambios).
+
+    Args:
+        costos: Matriz (m programadores, n tareas)
+        horas: Matriz (m, n) de horas que consume cada tarea según quién la
+               haga, o vector (n,) si no depende del programador
+        capacidad: Vector (m,) de horas disponibles por programador
+        iteraciones: Máximo de iteraciones del subgradiente
+        max_segundos: Límite de tiempo opcional
+
+    Returns:
+        asignacion: Array (n,) con el programador de cada tarea (None si no se
+                    encontró solución factible)
+        costo_total: Costo de la asignación
+        cota_inferior: Mejor cota lagrangiana
+        brecha: (costo_total - cota_inferior) / costo_total
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError("NumPy no está instalado. Instálalo con: pip install numpy")
+
+    costos = np.asarray(costos, dtype=float)
+    m, n = costos.shape
+    horas = np.broadcast_to(np.asarray(horas, dtype=float), (m, n))
+    capacidad = np.asarray(capacidad, dtype=float)
+    tareas = np.arange(n)
+    limite = None if max_segundos is None else time.perf_counter() + max_segundos
+
+    # Solución inicial: cada tarea con su programador más barato, reparada
+    mejor_asignacion = None
+    mejor_costo = np.inf
+    inicial = np.argmin(costos, axis=0)
+    reparada = _reparar_generalizada(costos, horas, capacidad, inicial, costos)
+    if reparada is not None:
+        mejor_asignacion = reparada
+        mejor_costo = costos[reparada, tareas].sum()
+
+    multiplicadores = np.zeros(m)
+    cota_inferior = -np.inf
+    paso = 2.0
+    sin_mejora = 0
+    for iteracion in range(iteraciones):
+        reducidos = costos + multiplicadores[:, None] * horas
+        relajada = np.argmin(reducidos, axis=0)
+        valor = reducidos[relajada, tareas].sum() - multiplicadores @ capacidad
+        subgradiente = np.bincount(relajada, weights=horas[relajada, tareas],
+                                   minlength=m) - capacidad
+        if valor > cota_inferior + 1e-9:
+            cota_inferior = valor
+            sin_mejora = 0
+        else:
+            sin_mejora += 1
+            if sin_mejora >= 20:
+                paso /= 2
+                sin_mejora = 0
+
+        if iteracion % 10 == 0 or (subgradiente <= 1e-9).all():
+            reparada = _reparar_generalizada(costos, horas, capacidad, relajada, reducidos)
+            if reparada is not None:
+                costo = costos[reparada, tareas].sum()
+                if costo < mejor_costo:
+                    mejor_costo = costo
+                    mejor_asignacion = reparada
+
+        norma = subgradiente @ subgradiente
+        if norma == 0 or mejor_costo - cota_inferior <= 1e-9 * max(1.0, abs(mejor_costo)):
+            break
+        if limite is not None and time.perf_counter() > limite:
+            break
+        objetivo = mejor_costo if np.isfinite(mejor_costo) else 1.05 * abs(valor) + 1
+        t = paso * (objetivo - valor) / norma
+        multiplicadores = np.maximum(0.0, multiplicadores + t * subgradiente)
+
+    if mejor_asignacion is None:
+        return None, np.inf, cota_inferior, np.inf
+
+    carga = np.bincount(mejor_asignacion, weights=horas[mejor_asignacion, tareas], minlength=m)
+    _mejorar_generalizada(costos, horas, capacidad, mejor_asignacion, carga, limite=limite)
+    mejor_costo = costos[mejor_asignacion, tareas].sum()
+    brecha = (mejor_costo - cota_inferior) / mejor_costo if mejor_costo else 0.0
+    return mejor_asignacion, mejor_costo, cota_inferior, max(0.0, brecha)
+
 
 def resolver_asignacion():
     """
@@ -89,7 +1468,7 @@ def resolver_asignacion():
 def resolver_sin_dependencias():
     """
     Resuelve el problema usando solo la biblioteca estándar de Python.
-    Usa fuerza bruta con permutaciones (factible para problemas pequeños).
+    Usa el método de Jonker-Volgenant en Python puro (O(n³)).
     """
     # Matriz de tiempos estimados (en horas)
     # Filas: Matos, Tania, Valeria, Salvador
@@ -123,19 +1502,9 @@ def resolver_sin_dependencias():
         print()
     print("-" * 70)
     
-    # Generar todas las permutaciones posibles de asignaciones
-    # Cada permutación representa qué tarea hace cada programador
-    # (índice de permutación = programador, valor = tarea)
-    n = len(programadores)
-    mejor_asignacion = None
-    tiempo_minimo = float('inf')
-    
-    # Probar todas las permutaciones de [0, 1, 2, 3] que representan las tareas
-    for permutacion in itertools.permutations(range(n)):
-        tiempo_total = sum(tiempos[i][permutacion[i]] for i in range(n))
-        if tiempo_total < tiempo_minimo:
-            tiempo_minimo = tiempo_total
-            mejor_asignacion = permutacion
+    # Caminos aumentantes más cortos: una fila por iteración, O(n³) en total
+    # (mejor_asignacion[i] = tarea asignada al programador i)
+    _, mejor_asignacion, tiempo_minimo = algoritmo_hungaro_jv(tiempos, usar_numpy=False)
     
     print("\n" + "=" * 70)
     print("SOLUCIÓN ÓPTIMA")
@@ -6,14 +6,843 @@ Objetivo: Distribuir horas entre equipos para cubrir historias de usuario
 respetando capacidad.
 """
 
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flujo_costo_minimo import RedFlujoCostoMinimo
+
 try:
     import numpy as np
-    from scipy.optimize import linprog
-    SCIPY_AVAILABLE = True
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from modelo_disperso import (SCIPY_AVAILABLE, modelo_transporte, modelo_flujo_costo_minimo,
+                                 resolver_modelo, imprimir_estadisticas)
 except ImportError:
     SCIPY_AVAILABLE = False
 
 
+def _dos_primeros(orden, activa, desde):
+    """Posiciones en `orden` de los dos primeros elementos activos a partir de `desde`."""
+    primero = segundo = -1
+    for k in range(desde, len(orden)):
+        if activa[orden[k]]:
+            if primero == -1:
+                primero = k
+            else:
+                segundo = k
+                break
+    return primero, segundo
+
+
+def _penalizacion(costos_linea, orden, primero, segundo):
+    """Penalización de Vogel: diferencia entre el segundo y el primer costo activo."""
+    if primero == -1:
+        return -np.inf
+    if segundo == -1:
+        return costos_linea[orden[primero]]
+    return costos_linea[orden[segundo]] - costos_linea[orden[primero]]
+
+
+def metodo_vogel(oferta, demanda, costos):
+    """
+    Solución básica inicial por el Método de Aproximación de Vogel (VAM).
+
+    Cada fila y columna guarda la posición de sus dos costos activos más
+    bajos dentro de su orden de costos, por lo que eliminar una línea solo
+    recalcula las penalizaciones que dependían de ella.
+
+    Args:
+        oferta, demanda: Vectores balanceados (misma suma)
+        costos: Matriz (m, n)
+
+    Returns:
+        Lista de m + n - 1 celdas básicas (i, j, cantidad) que forman un árbol
+    """
+    costos = np.asarray(costos, dtype=float)
+    m, n = costos.shape
+    restante_f = np.array(oferta, dtype=float)
+    restante_c = np.array(demanda, dtype=float)
+    orden_f = np.argsort(costos, axis=1).astype(np.int32)
+    orden_c = np.argsort(costos.T, axis=1).astype(np.int32)
+    fila_activa = np.ones(m, dtype=bool)
+    col_activa = np.ones(n, dtype=bool)
+
+    primeros_f = [_dos_primeros(orden_f[i], col_activa, 0) for i in range(m)]
+    primeros_c = [_dos_primeros(orden_c[j], fila_activa, 0) for j in range(n)]
+    pen_f = np.array([_penalizacion(costos[i], orden_f[i], *primeros_f[i]) for i in range(m)])
+    pen_c = np.array([_penalizacion(costos[:, j], orden_c[j], *primeros_c[j]) for j in range(n)])
+    # Línea opuesta de los dos mínimos, para saber a quién afecta cada eliminación
+    ref_f = np.array([[orden_f[i][k] if k >= 0 else -1 for k in primeros_f[i]] for i in range(m)])
+    ref_c = np.array([[orden_c[j][k] if k >= 0 else -1 for k in primeros_c[j]] for j in range(n)])
+
+    basicas = []
+    filas_activas, cols_activas = m, n
+    while filas_activas and cols_activas:
+        i_max = int(np.argmax(pen_f))
+        j_max = int(np.argmax(pen_c))
+        if pen_f[i_max] >= pen_c[j_max]:
+            i = i_max
+            j = int(orden_f[i][primeros_f[i][0]])
+        else:
+            j = j_max
+            i = int(orden_c[j][primeros_c[j][0]])
+
+        cantidad = min(restante_f[i], restante_c[j])
+        basicas.append((i, j, cantidad))
+        restante_f[i] -= cantidad
+        restante_c[j] -= cantidad
+
+        # Se elimina una sola línea por paso (dos en el último) para obtener
+        # exactamente m + n - 1 celdas básicas
+        if filas_activas == 1 and cols_activas == 1:
+            break
+        eliminar_fila = cols_activas == 1 or (filas_activas > 1 and restante_f[i] <= restante_c[j])
+        if eliminar_fila:
+            fila_activa[i] = False
+            pen_f[i] = -np.inf
+            filas_activas -= 1
+            for k in np.flatnonzero((ref_c[:, 0] == i) | (ref_c[:, 1] == i)):
+                if col_activa[k]:
+                    primeros_c[k] = _dos_primeros(orden_c[k], fila_activa, primeros_c[k][0])
+                    ref_c[k] = [orden_c[k][p] if p >= 0 else -1 for p in primeros_c[k]]
+                    pen_c[k] = _penalizacion(costos[:, k], orden_c[k], *primeros_c[k])
+        else:
+            col_activa[j] = False
+            pen_c[j] = -np.inf
+            cols_activas -= 1
+            for k in np.flatnonzero((ref_f[:, 0] == j) | (ref_f[:, 1] == j)):
+                if fila_activa[k]:
+                    primeros_f[k] = _dos_primeros(orden_f[k], col_activa, primeros_f[k][0])
+                    ref_f[k] = [orden_f[k][p] if p >= 0 else -1 for p in primeros_f[k]]
+                    pen_f[k] = _penalizacion(costos[k], orden_f[k], *primeros_f[k])
+
+    return basicas
+
+
+class _ArbolTransporte:
+    """
+    Base del simplex de transporte: árbol generador sobre los nodos fila
+    (0..m-1) y columna (m..m+n-1) con potenciales u (filas) y v (columnas)
+    tales que u_i + v_j = c_ij en cada celda básica.
+    """
+
+    def __init__(self, costos, basicas):
+        self.costos = costos
+        m, n = costos.shape
+        self.m = m
+        total = m + n
+        self.padre = [-1] * total
+        self.flujo = [0.0] * total          # flujo de la celda que une al nodo con su padre
+        self.celda = [None] * total         # (i, j) de esa celda
+        self.profundidad = [0] * total
+        self.hijos = [set() for _ in range(total)]
+        self.potencial = np.zeros(total)
+
+        adyacencia = [[] for _ in range(total)]
+        for i, j, cantidad in basicas:
+            adyacencia[i].append((m + j, i, j, cantidad))
+            adyacencia[m + j].append((i, i, j, cantidad))
+
+        visitado = [False] * total
+        visitado[0] = True
+        pila = [0]
+        while pila:
+            nodo = pila.pop()
+            for vecino, i, j, cantidad in adyacencia[nodo]:
+                if not visitado[vecino]:
+                    visitado[vecino] = True
+                    self._colgar(vecino, nodo, (i, j), cantidad)
+                    self.potencial[vecino] = costos[i, j] - self.potencial[nodo]
+                    pila.append(vecino)
+        if not all(visitado):
+            raise ValueError("La solución inicial no forma un árbol generador")
+
+    def _colgar(self, nodo, padre, celda, cantidad):
+        self.padre[nodo] = padre
+        self.celda[nodo] = celda
+        self.flujo[nodo] = cantidad
+        self.profundidad[nodo] = self.profundidad[padre] + 1
+        self.hijos[padre].add(nodo)
+
+    def subarbol(self, raiz):
+        """Nodos del subárbol que cuelga de `raiz` (padres antes que hijos)."""
+        nodos = [raiz]
+        for nodo in nodos:
+            nodos.extend(self.hijos[nodo])
+        return nodos
+
+    def celdas_basicas(self):
+        """Celdas (i, j) de la base actual, para reutilizarla como arranque en caliente."""
+        return [self.celda[nodo] for nodo in range(1, len(self.padre))]
+
+    def recalcular_flujos(self, oferta, demanda):
+        """
+        Flujos de la base actual para nuevos vectores de oferta y demanda.
+
+        El arco de cada nodo hacia su padre transporta el desbalance de su
+        subárbol, así que basta recorrer el árbol de las hojas a la raíz. Los
+        flujos pueden quedar negativos (base primal infactible).
+        """
+        residuo = list(oferta) + list(demanda)
+        for nodo in reversed(self.subarbol(0)[1:]):
+            self.flujo[nodo] = residuo[nodo]
+            residuo[self.padre[nodo]] -= residuo[nodo]
+
+    def pivotear_dual(self, nodo):
+        """
+        Pivote del simplex dual: sale el arco de `nodo` (flujo negativo) y entra
+        la celda que cruza el corte en sentido opuesto con menor costo reducido,
+        lo que conserva la factibilidad dual (costos reducidos >= 0).
+        """
+        en_subarbol = np.zeros(len(self.padre), dtype=bool)
+        en_subarbol[self.subarbol(nodo)] = True
+        filas_s, cols_s = en_subarbol[:self.m], en_subarbol[self.m:]
+        if nodo < self.m:
+            filas, columnas = np.flatnonzero(~filas_s), np.flatnonzero(cols_s)
+        else:
+            filas, columnas = np.flatnonzero(filas_s), np.flatnonzero(~cols_s)
+        if len(filas) == 0 or len(columnas) == 0:
+            raise ValueError("El escenario no tiene solución factible")
+
+        reducidos = (self.costos[np.ix_(filas, columnas)]
+                     - self.potencial[filas][:, None]
+                     - self.potencial[self.m + columnas][None, :])
+        k = int(np.argmin(reducidos))
+        fila, columna = divmod(k, len(columnas))
+        self.pivotear(int(filas[fila]), int(columnas[columna]), reducidos[fila, columna],
+                      saliente=nodo, theta=-self.flujo[nodo])
+
+    def pivotear(self, i, j, reducido, saliente=None, theta=None):
+        """
+        Entra la celda (i, j) con costo reducido `reducido`. Sin `saliente`
+        se aplica la prueba de razón del simplex primal; el simplex dual indica
+        el arco que sale y la cantidad `theta` a mover por el ciclo.
+        """
+        a, b = i, self.m + j
+        camino_a, camino_b = [], []
+        x, y = a, b
+        while x != y:
+            if self.profundidad[x] >= self.profundidad[y]:
+                camino_a.append(x)
+                x = self.padre[x]
+            else:
+                camino_b.append(y)
+                y = self.padre[y]
+
+        # Aristas en posición par (desde cada extremo) pierden θ, las impares ganan θ
+        if saliente is None:
+            theta = float('inf')
+            for camino in (camino_b, camino_a):
+                for posicion in range(0, len(camino), 2):
+                    nodo = camino[posicion]
+                    if self.flujo[nodo] < theta:
+                        theta = self.flujo[nodo]
+                        saliente = nodo
+        for camino in (camino_a, camino_b):
+            for posicion, nodo in enumerate(camino):
+                self.flujo[nodo] += -theta if posicion % 2 == 0 else theta
+
+        # El subárbol que cuelga de la arista saliente se re-enraíza en el
+        # extremo de la celda entrante que contiene y se cuelga del otro
+        if saliente in camino_a:
+            x, y, delta = a, b, -reducido
+        else:
+            x, y, delta = b, a, reducido
+        self.hijos[self.padre[saliente]].discard(saliente)
+
+        nodo, anterior, celda, cantidad = x, y, (i, j), theta
+        while True:
+            siguiente = self.padre[nodo]
+            celda_siguiente, cantidad_siguiente = self.celda[nodo], self.flujo[nodo]
+            if anterior != y:
+                self.hijos[nodo].discard(anterior)
+            if nodo != saliente:
+                self.hijos[nodo].add(siguiente)
+            self.padre[nodo] = anterior
+            self.celda[nodo] = celda
+            self.flujo[nodo] = cantidad
+            if nodo == saliente:
+                break
+            anterior, nodo = nodo, siguiente
+            celda, cantidad = celda_siguiente, cantidad_siguiente
+        self.hijos[y].add(x)
+
+        # Profundidades y potenciales del subárbol movido
+        subarbol = self.subarbol(x)
+        profundidad, padre = self.profundidad, self.padre
+        for nodo in subarbol:
+            profundidad[nodo] = profundidad[padre[nodo]] + 1
+        subarbol = np.array(subarbol)
+        self.potencial[subarbol] += np.where(subarbol >= self.m, delta, -delta)
+
+    def solucion(self, n):
+        x = np.zeros((self.m, n))
+        for nodo in range(1, len(self.padre)):
+            i, j = self.celda[nodo]
+            x[i, j] = self.flujo[nodo]
+        return x
+
+
+def simplex_transporte(oferta, demanda, costos, max_iteraciones=None):
+    """
+    Resuelve el problema de transporte con un simplex de redes especializado:
+    solución inicial por Vogel y pivotes MODI (u-v / stepping-stone) sobre el
+    árbol de celdas básicas.
+
+    El precio de las celdas no básicas se calcula por bloques de filas con
+    NumPy (c_ij - u_i - v_j) y el ciclo de cada pivote se recorre sobre el
+    árbol, por lo que nunca se arma la matriz de restricciones.
+
+    Args:
+        oferta: Horas disponibles por equipo (m)
+        demanda: Horas requeridas por tarea (n)
+        costos: Matriz (m, n) de costo por hora
+        max_iteraciones: Límite opcional de pivotes
+
+    Returns:
+        x: Matriz (m, n) de horas asignadas
+        costo_total: Costo total mínimo
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError("NumPy no está instalado. Instálalo con: pip install numpy")
+
+    costos = np.asarray(costos, dtype=float)
+    oferta = np.asarray(oferta, dtype=float)
+    demanda = np.asarray(demanda, dtype=float)
+    m, n = costos.shape
+
+    # Balancear con una fila o columna ficticia de costo 0
+    diferencia = oferta.sum() - demanda.sum()
+    if diferencia > 1e-9:
+        costos = np.hstack([costos, np.zeros((m, 1))])
+        demanda = np.append(demanda, diferencia)
+    elif diferencia < -1e-9:
+        costos = np.vstack([costos, np.zeros((1, n))])
+        oferta = np.append(oferta, -diferencia)
+    m_total, n_total = costos.shape
+
+    arbol = _ArbolTransporte(costos, metodo_vogel(oferta, demanda, costos))
+    _optimizar_arbol(arbol, max_iteraciones)
+
+    x = arbol.solucion(n_total)[:m, :n]
+    costo_total = float((x * costos[:m, :n]).sum())
+    return x, costo_total
+
+
+def _optimizar_arbol(arbol, max_iteraciones=None):
+    """Pivotes primales con precio por bloques de filas hasta la optimalidad."""
+    costos = arbol.costos
+    m_total, n_total = costos.shape
+    tolerancia = 1e-9 * max(1.0, np.abs(costos).max())
+    filas_por_bloque = max(1, 200_000 // n_total)
+    bloques = [(s, min(s + filas_por_bloque, m_total)) for s in range(0, m_total, filas_por_bloque)]
+
+    iteracion = 0
+    bloque = 0
+    sin_entrante = 0
+    while sin_entrante < len(bloques):
+        if max_iteraciones is not None and iteracion >= max_iteraciones:
+            break
+        inicio, fin = bloques[bloque]
+        u = arbol.potencial[inicio:fin]
+        v = arbol.potencial[m_total:]
+        reducidos = costos[inicio:fin] - u[:, None] - v[None, :]
+        k = int(np.argmin(reducidos))
+        fila, columna = divmod(k, n_total)
+        if reducidos[fila, columna] < -tolerancia:
+            arbol.pivotear(inicio + fila, columna, reducidos[fila, columna])
+            iteracion += 1
+            sin_entrante = 0
+        else:
+            sin_entrante += 1
+            bloque = (bloque + 1) % len(bloques)
+    return iteracion
+
+
+def _reparar_dual(arbol):
+    """Simplex dual: elimina los flujos negativos de una base dual factible."""
+    tolerancia = 1e-9 * max(1.0, max(abs(f) for f in arbol.flujo))
+    pivotes = 0
+    while True:
+        nodo = min(range(1, len(arbol.flujo)), key=arbol.flujo.__getitem__)
+        if arbol.flujo[nodo] >= -tolerancia:
+            return pivotes
+        arbol.pivotear_dual(nodo)
+        pivotes += 1
+
+
+def _asignaciones_basicas(arbol, m, n):
+    """Celdas reales con flujo positivo: {(i, j): horas}."""
+    asignaciones = {}
+    for nodo in range(1, len(arbol.padre)):
+        i, j = arbol.celda[nodo]
+        if i < m and j < n and arbol.flujo[nodo] > 1e-9:
+            asignaciones[(i, j)] = arbol.flujo[nodo]
+    return asignaciones
+
+
+def _extremos_escenario(oferta, demanda):
+    """Oferta y demanda con la fila y la columna ficticias siempre presentes."""
+    oferta = np.asarray(oferta, dtype=float)
+    demanda = np.asarray(demanda, dtype=float)
+    diferencia = oferta.sum() - demanda.sum()
+    return (np.append(oferta, max(0.0, -diferencia)),
+            np.append(demanda, max(0.0, diferencia)))
+
+
+def _resolver_bloque_escenarios(costos, basicas, base, escenarios):
+    """
+    Resuelve una secuencia de escenarios arrancando cada uno desde la base
+    óptima del anterior; unidad de trabajo de cada proceso.
+    """
+    m, n = costos.shape[0] - 1, costos.shape[1] - 1
+    arbol = _ArbolTransporte(costos, [(i, j, 0.0) for i, j in basicas])
+    filas = []
+    for oferta, demanda in escenarios:
+        arbol.recalcular_flujos(*_extremos_escenario(oferta, demanda))
+        pivotes = _reparar_dual(arbol) + _optimizar_arbol(arbol)
+        asignaciones = _asignaciones_basicas(arbol, m, n)
+        cambios = {celda: (base.get(celda, 0.0), asignaciones.get(celda, 0.0))
+                   for celda in base.keys() | asignaciones.keys()
+                   if abs(base.get(celda, 0.0) - asignaciones.get(celda, 0.0)) > 1e-9}
+        costo_total = sum(costos[i, j] * horas for (i, j), horas in asignaciones.items())
+        filas.append({'costo_total': costo_total, 'cambios': cambios, 'pivotes': pivotes})
+    return filas
+
+
+def resolver_escenarios_transporte(oferta, demanda, costos, escenarios,
+                                   procesos=None, tam_bloque=None):
+    """
+    Resuelve muchas variantes de oferta/demanda (vacaciones, rotación,
+    cambios de alcance) sobre la misma matriz de costos.
+
+    La matriz se amplía una sola vez con fila y columna ficticias, así que
+    todas las variantes comparten estructura. Como los costos no cambian, la
+    base óptima de un escenario sigue siendo dual factible para el siguiente:
+    se recalculan sus flujos y unos pocos pivotes del simplex dual la
+    reparan. Los escenarios se agrupan en bloques que se reparten entre
+    procesos, y cada bloque arranca desde la base del plan base.
+
+    Args:
+        oferta, demanda: Vectores del plan base
+        costos: Matriz (m, n) fija
+        escenarios: Lista de tuplas (oferta, demanda)
+        procesos: Número de procesos; 1 resuelve en el proceso actual y None
+                  usa os.cpu_count().
+        tam_bloque: Escenarios por bloque; por defecto ~4 bloques por proceso.
+
+    Returns:
+        base: Diccionario {'costo_total', 'asignaciones'} del plan base
+        tabla: Lista con un diccionario por escenario:
+               {'escenario', 'costo_total', 'diferencia', 'cambios', 'pivotes'}
+               donde `cambios` es {(i, j): (horas_base, horas_escenario)} solo
+               para las celdas que cambian.
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError("NumPy no está instalado. Instálalo con: pip install numpy")
+
+    costos = np.asarray(costos, dtype=float)
+    m, n = costos.shape
+    ampliada = np.zeros((m + 1, n + 1))
+    ampliada[:m, :n] = costos
+
+    oferta_base, demanda_base = _extremos_escenario(oferta, demanda)
+    arbol = _ArbolTransporte(ampliada, metodo_vogel(oferta_base, demanda_base, ampliada))
+    _optimizar_arbol(arbol)
+    asignaciones_base = _asignaciones_basicas(arbol, m, n)
+    base = {
+        'costo_total': sum(costos[i, j] * horas for (i, j), horas in asignaciones_base.items()),
+        'asignaciones': asignaciones_base,
+    }
+    basicas = arbol.celdas_basicas()
+
+    k = len(escenarios)
+    if procesos is None:
+        procesos = os.cpu_count() or 1
+    procesos = max(1, min(procesos, k))
+    if tam_bloque is None:
+        tam_bloque = max(1, -(-k // (4 * procesos)))
+    bloques = [escenarios[i:i + tam_bloque] for i in range(0, k, tam_bloque)]
+
+    tabla = []
+    if procesos == 1:
+        for bloque in bloques:
+            tabla.extend(_resolver_bloque_escenarios(ampliada, basicas, asignaciones_base, bloque))
+    else:
+        with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+            futuros = [ejecutor.submit(_resolver_bloque_escenarios, ampliada, basicas,
+                                       asignaciones_base, bloque) for bloque in bloques]
+            for futuro in futuros:
+                tabla.extend(futuro.result())
+
+    for indice, fila in enumerate(tabla):
+        fila['escenario'] = indice
+        fila['diferencia'] = fila['costo_total'] - base['costo_total']
+    return base, tabla
+
+
+def imprimir_escenarios(equipos, tareas, base, tabla, nombres=None):
+    """Imprime la tabla compacta de escenarios con solo las asignaciones que cambian."""
+    print("\n" + "=" * 70)
+    print("ESCENARIOS DE OFERTA/DEMANDA")
+    print("=" * 70)
+    print(f"Costo del plan base: {base['costo_total']:.2f}")
+    print("-" * 70)
+    print(f"{'Escenario':<20} {'Costo':<12} {'Diferencia':<12} {'Pivotes':<8}")
+    print("-" * 70)
+    for fila in tabla:
+        nombre = nombres[fila['escenario']] if nombres else f"#{fila['escenario']}"
+        print(f"{nombre:<20} {fila['costo_total']:<12.2f} {fila['diferencia']:<+12.2f} {fila['pivotes']:<8}")
+        for (i, j), (antes, despues) in sorted(fila['cambios'].items()):
+            print(f"    {equipos[i]} -> {tareas[j]}: {antes:.2f} -> {despues:.2f}")
+    print("=" * 70)
+
+
+def transporte_multiperiodo(ofertas, demandas, costos, costo_arrastre, backlog_inicial=None,
+                            costo_no_atendido=None):
+    """
+    Planifica varios sprints a la vez con arrastre de horas no terminadas.
+
+    Se arma una sola red de flujo de costo mínimo dispersa:
+      - equipo (i, t) -> tarea (j, t) con costo c_ij (horas del sprint t)
+      - tarea (j, t+1) -> tarea (j, t) con costo `costo_arrastre`: horas de la
+        tarea j pendientes al cerrar el sprint t que se atienden después
+      - un nodo "no atendido" cubre lo que sigue pendiente al final del
+        horizonte y un nodo "ocioso" absorbe las horas de equipo sin usar
+
+    Por defecto lo no atendido se penaliza por encima de cualquier forma de
+    atenderlo, así que (como el nodo ficticio del modelo de un sprint) se
+    atiende todo lo que la capacidad permite; esa penalización no se suma
+    al costo reportado.
+
+    Args:
+        ofertas: Matriz (T, m) de horas por equipo y sprint
+        demandas: Matriz (T, n) de horas nuevas por tarea y sprint
+        costos: Matriz (m, n) fija o tensor (T, m, n) por sprint
+        costo_arrastre: Penalización por hora pendiente y sprint (escalar o vector n)
+        backlog_inicial: Horas pendientes por tarea al iniciar el primer sprint
+        costo_no_atendido: Penalización por hora pendiente al final del horizonte
+
+    Returns:
+        Diccionario con:
+          'x': tensor (T, m, n) de horas asignadas
+          'arrastre': matriz (T, n) de horas pendientes al cerrar cada sprint
+                      (la última fila es lo no atendido)
+          'costo_total': costo de asignación más penalización por arrastre
+          'modelo': modelo disperso (tiempos de construcción y resolución)
+    """
+    if not SCIPY_AVAILABLE:
+        raise ImportError("SciPy no está instalado. Instálalo con: pip install scipy numpy")
+
+    ofertas = np.asarray(ofertas, dtype=float)
+    demandas = np.array(demandas, dtype=float)
+    T, m = ofertas.shape
+    n = demandas.shape[1]
+    costos = np.broadcast_to(np.asarray(costos, dtype=float), (T, m, n))
+    arrastre = np.broadcast_to(np.asarray(costo_arrastre, dtype=float), (n,))
+    if backlog_inicial is not None:
+        demandas[0] += np.asarray(backlog_inicial, dtype=float)
+    if costo_no_atendido is None:
+        costo_no_atendido = costos.max(initial=0.0) + arrastre.max(initial=0.0) * T + 1.0
+
+    # Nodos: equipos (t, i), tareas (t, j), no atendido, ocioso
+    equipo = np.arange(T * m).reshape(T, m)
+    tarea = T * m + np.arange(T * n).reshape(T, n)
+    no_atendido = T * (m + n)
+    ocioso = no_atendido + 1
+    oferta_total, demanda_total = ofertas.sum(), demandas.sum()
+
+    balance = np.concatenate([ofertas.ravel(), -demandas.ravel(), [demanda_total, -oferta_total]])
+
+    # Arcos en bloques: asignación, arrastre, no atendido, ocioso
+    t_idx, i_idx, j_idx = np.indices((T, m, n)).reshape(3, -1)
+    origenes = [equipo[t_idx, i_idx], tarea[1:].ravel(), np.full(n, no_atendido),
+                equipo.ravel(), [no_atendido]]
+    destinos = [tarea[t_idx, j_idx], tarea[:-1].ravel(), tarea[-1],
+                np.full(T * m, ocioso), [ocioso]]
+    costos_arco = [costos.ravel(), np.tile(arrastre, T - 1), np.full(n, float(costo_no_atendido)),
+                   np.zeros(T * m), [0.0]]
+
+    modelo = modelo_flujo_costo_minimo(ocioso + 1, np.concatenate(origenes), np.concatenate(destinos),
+                                       np.concatenate(costos_arco), balance)
+    resultado = resolver_modelo(modelo)
+    if not resultado.success:
+        raise ValueError(f"No se encontró solución óptima: {resultado.message}")
+
+    flujo = resultado.x
+    x = flujo[:T * m * n].reshape(T, m, n)
+    pendientes = np.zeros((T, n))
+    pendientes[:-1] = flujo[T * m * n:T * m * n + (T - 1) * n].reshape(T - 1, n)
+    pendientes[-1] = flujo[T * m * n + (T - 1) * n:T * m * n + T * n]
+
+    return {
+        'x': x,
+        'arrastre': pendientes,
+        'costo_total': float(resultado.fun) - costo_no_atendido * pendientes[-1].sum(),
+        'modelo': modelo,
+    }
+
+
+def replanificar_multiperiodo(plan, k, ofertas, demandas, costos, costo_arrastre,
+                              horas_reales=None, costo_no_atendido=None):
+    """
+    Re-planifica después de cerrar el sprint k sin tocar los sprints 0..k.
+
+    Solo se resuelve el sub-horizonte k+1..T-1: el backlog que entra al
+    sprint k+1 es el arrastre del plan (o el que resulta de las horas
+    realmente ejecutadas en el sprint k), y los sprints cerrados se copian
+    del plan anterior.
+
+    Args:
+        plan: Resultado de transporte_multiperiodo
+        k: Índice del último sprint cerrado
+        ofertas, demandas, costos, costo_arrastre: Datos del horizonte completo
+            (pueden traer cambios para los sprints k+1 en adelante)
+        horas_reales: Matriz (m, n) opcional con las horas ejecutadas en el
+            sprint k; si se indica, reemplaza a plan['x'][k]
+        costo_no_atendido: Igual que en transporte_multiperiodo
+
+    Returns:
+        Nuevo plan con la misma estructura que transporte_multiperiodo
+    """
+    ofertas = np.asarray(ofertas, dtype=float)
+    demandas = np.asarray(demandas, dtype=float)
+    T = ofertas.shape[0]
+    costos = np.asarray(costos, dtype=float)
+
+    x = plan['x'].copy()
+    arrastre = plan['arrastre'].copy()
+    if horas_reales is not None:
+        x[k] = np.asarray(horas_reales, dtype=float)
+        backlog_previo = arrastre[k - 1] if k > 0 else np.zeros(demandas.shape[1])
+        arrastre[k] = np.maximum(0.0, backlog_previo + demandas[k] - x[k].sum(axis=0))
+
+    costos_cerrados = costos[:k + 1] if costos.ndim == 3 else costos
+    costo_cerrado = (float((x[:k + 1] * costos_cerrados).sum())
+                     + float((arrastre[:min(k + 1, T - 1)] * np.asarray(costo_arrastre, dtype=float)).sum()))
+    if k + 1 >= T:
+        return {'x': x, 'arrastre': arrastre, 'costo_total': costo_cerrado, 'modelo': None}
+
+    resto = transporte_multiperiodo(ofertas[k + 1:], demandas[k + 1:],
+                                    costos[k + 1:] if costos.ndim == 3 else costos,
+                                    costo_arrastre, backlog_inicial=arrastre[k],
+                                    costo_no_atendido=costo_no_atendido)
+    x[k + 1:] = resto['x']
+    arrastre[k + 1:] = resto['arrastre']
+    return {
+        'x': x,
+        'arrastre': arrastre,
+        'costo_total': costo_cerrado + resto['costo_total'],
+        'modelo': resto['modelo'],
+    }
+
+
+def _entero(valor):
+    """Convierte horas a entero exigiendo que no tengan parte fraccionaria."""
+    entero = int(round(valor))
+    if abs(entero - valor) > 1e-9:
+        raise ValueError(f"El flujo de costo mínimo requiere horas enteras (recibido {valor})")
+    return entero
+
+
+def flujo_costo_minimo_transporte(oferta, demanda, costos):
+    """
+    Resuelve el modelo de transporte como flujo de costo mínimo en Python puro.
+
+    Red: fuente -> equipo i (capacidad oferta_i), equipo i -> tarea j (costo
+    c_ij), tarea j -> sumidero (capacidad demanda_j). Se envía el máximo flujo
+    posible, lo que equivale a agregar la fila o columna ficticia de costo 0.
+
+    Args:
+        oferta: Horas enteras disponibles por equipo (m)
+        demanda: Horas enteras requeridas por tarea (n)
+        costos: Matriz (m, n) de costo por hora (lista de listas o array)
+
+    Returns:
+        x: Lista de listas (m, n) de horas enteras asignadas
+        costo_total: Costo total mínimo
+    """
+    m, n = len(oferta), len(demanda)
+    fuente, sumidero = m + n, m + n + 1
+    red = RedFlujoCostoMinimo(m + n + 2)
+    for i in range(m):
+        red.agregar_arco(fuente, i, _entero(oferta[i]), 0)
+    arcos = []
+    for i in range(m):
+        fila = costos[i]
+        arcos.append([red.agregar_arco(i, m + j, _entero(demanda[j]),
+                                       int(c) if float(c).is_integer() else float(c))
+                      for j, c in enumerate(fila)])
+    for j in range(n):
+        red.agregar_arco(m + j, sumidero, _entero(demanda[j]), 0)
+
+    _, costo_total = red.resolver(fuente, sumidero)
+    x = [[red.flujo(e) for e in fila] for fila in arcos]
+    return x, costo_total
+
+
+def transbordo(oferta, demanda, arcos, capacidad_nodos=None, metodo=None):
+    """
+    Modelo de transbordo: las horas de los equipos llegan a las tareas pasando
+    por nodos intermedios (tech leads, sub-equipos) con topes de throughput.
+
+    Se resuelve como flujo de costo mínimo capacitado sobre la lista de arcos,
+    sin matriz densa. Un nodo con tope se divide en entrada -> salida con ese
+    tope como capacidad. Igual que en el modelo de transporte, se atiende
+    toda la demanda que la red permite y el resto queda como no atendido.
+
+    Args:
+        oferta: Diccionario {equipo: horas disponibles}
+        demanda: Diccionario {tarea: horas requeridas}
+        arcos: Lista de tuplas (origen, destino, costo) o
+               (origen, destino, costo, capacidad); capacidad None = sin tope
+        capacidad_nodos: Diccionario opcional {nodo: horas máximas que pasan por él}
+        metodo: 'lp' (linprog disperso), 'flujo' (Python puro, horas enteras)
+                o None para elegir 'lp' si SciPy está disponible
+
+    Returns:
+        flujos: Lista de horas por arco, en el mismo orden que `arcos`
+        costo_total: Costo total mínimo
+        no_atendido: Diccionario {tarea: horas sin cubrir}
+    """
+    capacidad_nodos = capacidad_nodos or {}
+    if metodo is None:
+        metodo = 'lp' if SCIPY_AVAILABLE else 'flujo'
+
+    # Índices de nodos; los nodos con tope tienen entrada y salida separadas
+    entrada, salida = {}, {}
+    num_nodos = 0
+    nombres = list(oferta) + list(demanda) + [extremo for arco in arcos for extremo in arco[:2]]
+    for nombre in nombres:
+        if nombre not in entrada:
+            entrada[nombre] = salida[nombre] = num_nodos
+            num_nodos += 1
+            if nombre in capacidad_nodos:
+                salida[nombre] = num_nodos
+                num_nodos += 1
+
+    origenes = [salida[arco[0]] for arco in arcos]
+    destinos = [entrada[arco[1]] for arco in arcos]
+    costos = [arco[2] for arco in arcos]
+    capacidades = [arco[3] if len(arco) > 3 else None for arco in arcos]
+    for nombre, tope in capacidad_nodos.items():
+        if nombre in entrada:
+            origenes.append(entrada[nombre])
+            destinos.append(salida[nombre])
+            costos.append(0)
+            capacidades.append(tope)
+    num_arcos = len(arcos)
+    tareas = list(demanda)
+
+    if metodo == 'flujo':
+        oferta_total = sum(_entero(h) for h in oferta.values())
+        fuente, sumidero = num_nodos, num_nodos + 1
+        red = RedFlujoCostoMinimo(num_nodos + 2)
+        indices = [red.agregar_arco(o, d, oferta_total if cap is None else _entero(cap), c)
+                   for o, d, c, cap in zip(origenes, destinos, costos, capacidades)]
+        for equipo, horas in oferta.items():
+            red.agregar_arco(fuente, salida[equipo], _entero(horas), 0)
+        llegadas = [red.agregar_arco(entrada[tarea], sumidero, _entero(demanda[tarea]), 0)
+                    for tarea in tareas]
+        _, costo_total = red.resolver(fuente, sumidero)
+        flujos = [red.flujo(e) for e in indices[:num_arcos]]
+        no_atendido = {tarea: demanda[tarea] - red.flujo(e) for tarea, e in zip(tareas, llegadas)}
+        return flujos, costo_total, no_atendido
+
+    if metodo != 'lp':
+        raise ValueError(f"Método de transbordo desconocido: {metodo}")
+    if not SCIPY_AVAILABLE:
+        raise ImportError("SciPy no está instalado. Instálalo con: pip install scipy numpy")
+
+    # Nodos auxiliares: "no atendido" cubre la demanda que la red no alcanza
+    # (con una penalización mayor que cualquier camino) y "ocioso" absorbe
+    # las horas de equipo sin usar
+    no_atendido_nodo, ocioso = num_nodos, num_nodos + 1
+    oferta_total = float(sum(oferta.values()))
+    demanda_total = float(sum(demanda.values()))
+    penalizacion = max((abs(c) for c in costos), default=0) * (num_nodos + 1) + 1.0
+
+    balance = np.zeros(num_nodos + 2)
+    for equipo, horas in oferta.items():
+        balance[salida[equipo]] += horas
+    for tarea, horas in demanda.items():
+        balance[entrada[tarea]] -= horas
+    balance[no_atendido_nodo] = demanda_total
+    balance[ocioso] = -oferta_total
+
+    equipos = list(oferta)
+    origenes += [no_atendido_nodo] * len(tareas) + [salida[e] for e in equipos] + [no_atendido_nodo]
+    destinos += [entrada[t] for t in tareas] + [ocioso] * len(equipos) + [ocioso]
+    costos += [penalizacion] * len(tareas) + [0] * (len(equipos) + 1)
+    capacidades += [None] * (len(tareas) + len(equipos) + 1)
+    topes = np.array([np.inf if cap is None else cap for cap in capacidades], dtype=float)
+
+    modelo = modelo_flujo_costo_minimo(num_nodos + 2, origenes, destinos, costos, balance, topes)
+    resultado = resolver_modelo(modelo)
+    if not resultado.success:
+        raise ValueError(f"No se encontró solución óptima: {resultado.message}")
+
+    inicio_no_atendido = len(costos) - len(tareas) - len(equipos) - 1
+    faltante = resultado.x[inicio_no_atendido:inicio_no_atendido + len(tareas)]
+    no_atendido = dict(zip(tareas, faltante))
+    costo_total = float(resultado.fun - penalizacion * faltante.sum())
+    return list(resultado.x[:num_arcos]), costo_total, no_atendido
+
+
+def resolver_transbordo():
+    """
+    Ejemplo de transbordo: las horas de los equipos pasan por dos tech leads
+    con tope de horas de revisión antes de llegar a las tareas.
+    """
+    oferta = {'Equipo A': 40, 'Equipo B': 50, 'Equipo C': 30}
+    demanda = {'Tarea 1': 30, 'Tarea 2': 35, 'Tarea 3': 25, 'Tarea 4': 30}
+    capacidad_nodos = {'Lead Backend': 70, 'Lead Frontend': 60}
+
+    arcos = [
+        ('Equipo A', 'Lead Backend', 1), ('Equipo A', 'Lead Frontend', 2),
+        ('Equipo B', 'Lead Backend', 2), ('Equipo B', 'Lead Frontend', 1),
+        ('Equipo C', 'Lead Frontend', 1, 25),
+        ('Lead Backend', 'Tarea 1', 1), ('Lead Backend', 'Tarea 2', 2),
+        ('Lead Backend', 'Tarea 4', 1),
+        ('Lead Frontend', 'Tarea 2', 1), ('Lead Frontend', 'Tarea 3', 1),
+        ('Lead Frontend', 'Tarea 4', 2),
+        ('Equipo C', 'Tarea 3', 3),
+    ]
+
+    print("=" * 70)
+    print("PLANIFICACIÓN DE SPRINT - MODELO DE TRANSBORDO")
+    print("=" * 70)
+    print("\nTopes de nodos intermedios:")
+    for nodo, tope in capacidad_nodos.items():
+        print(f"  {nodo}: {tope} horas")
+
+    flujos, costo_total, no_atendido = transbordo(oferta, demanda, arcos, capacidad_nodos)
+
+    print("\n" + "=" * 70)
+    print("SOLUCIÓN ÓPTIMA")
+    print("=" * 70)
+    print(f"{'Origen':<18} {'Destino':<18} {'Costo':<8} {'Horas':<10}")
+    print("-" * 70)
+    for arco, horas in zip(arcos, flujos):
+        if horas > 1e-6:
+            print(f"{arco[0]:<18} {arco[1]:<18} {arco[2]:<8} {horas:<10.2f}")
+    print("-" * 70)
+    for tarea, horas in no_atendido.items():
+        if horas > 1e-6:
+            print(f"⚠ {tarea}: {horas:.2f} horas sin cubrir")
+    print(f"\nCosto total mínimo: {costo_total:.2f}")
+    print("=" * 70)
+
+    return flujos, costo_total, no_atendido
+
+
 def resolver_transporte():
     """
     Resuelve el problema de transporte para planificación de sprint.
@@ -83,11 +912,60 @@ def resolver_transporte():
             oferta.append(demanda_total - oferta_total)
             costos.append([0] * len(tareas))
     
-    # Resolver con programación lineal
-    if SCIPY_AVAILABLE:
+    # Resolver con el simplex de transporte (o programación lineal genérica)
+    if NUMPY_AVAILABLE:
+        resolver_con_simplex_transporte(equipos, tareas, oferta, demanda, costos)
+    elif SCIPY_AVAILABLE:
         resolver_con_scipy(equipos, tareas, oferta, demanda, costos)
     else:
-        resolver_con_pulp(equipos, tareas, oferta, demanda, costos)
+        resolver_con_flujo_costo_minimo(equipos, tareas, oferta, demanda, costos)
+
+
+def imprimir_asignaciones(equipos, tareas, x, costo_total):
+    """Imprime la matriz de horas asignadas con totales por fila y columna."""
+    m = len(equipos)
+    n = len(tareas)
+
+    print("\n" + "=" * 70)
+    print("SOLUCIÓN ÓPTIMA")
+    print("=" * 70)
+
+    print("\nAsignaciones (horas):")
+    print("-" * 70)
+    print(f"{'Equipo\\Tarea':<15}", end="")
+    for tarea in tareas:
+        print(f"{tarea[:10]:<12}", end="")
+    print("Total")
+    print("-" * 70)
+
+    for i, equipo in enumerate(equipos):
+        print(f"{equipo:<15}", end="")
+        total_fila = 0
+        for j in range(n):
+            valor = x[i][j]
+            if valor > 1e-6:  # Solo mostrar valores significativos
+                print(f"{valor:<12.2f}", end="")
+                total_fila += valor
+            else:
+                print(f"{'0.00':<12}", end="")
+        print(f"{total_fila:.2f}")
+
+    print("-" * 70)
+    print(f"{'Total':<15}", end="")
+    for j in range(n):
+        total_col = sum(x[i][j] for i in range(m))
+        print(f"{total_col:<12.2f}", end="")
+    print()
+    print("-" * 70)
+    print(f"\nCosto total mínimo: {costo_total:.2f}")
+    print("=" * 70)
+
+
+def resolver_con_simplex_transporte(equipos, tareas, oferta, demanda, costos):
+    """Resuelve usando Vogel + simplex de transporte (MODI)"""
+    x, costo_total = simplex_transporte(oferta, demanda, costos)
+    imprimir_asignaciones(equipos, tareas, x, costo_total)
+    return x, costo_total
 
 
 def resolver_con_scipy(equipos, tareas, oferta, demanda, costos):
@@ -95,139 +973,69 @@ def resolver_con_scipy(equipos, tareas, oferta, demanda, costos):
     m = len(equipos)
     n = len(tareas)
     
-    # Vector de costos (aplanar matriz)
-    c = [costos[i][j] for i in range(m) for j in range(n)]
+    # Restricciones de oferta (<=) y demanda (==) en formato disperso
+    modelo = modelo_transporte(oferta, demanda, costos)
+    resultado = resolver_modelo(modelo)
     
-    # Restricciones de oferta: suma por fila <= oferta
-    A_ub = []
-    b_ub = []
+    if resultado.success:
+        x = resultado.x.reshape(m, n)
+        imprimir_asignaciones(equipos, tareas, x, resultado.fun)
+        imprimir_estadisticas(modelo)
+    else:
+        print("\nNo se encontró solución óptima.")
+
+
+def transporte_pulp(oferta, demanda, costos):
+    """
+    Resuelve el modelo de transporte con PuLP (CBC).
+
+    Returns:
+        x: Lista de listas (m, n) de horas asignadas, o None si no es óptimo
+        costo_total: Costo total mínimo, o None
+    """
+    import pulp
+    
+    m = len(oferta)
+    n = len(demanda)
+    
+    # Crear problema
+    problema = pulp.LpProblem("Transporte_Sprint", pulp.LpMinimize)
+    
+    # Variables: x[i][j] = horas asignadas del equipo i a la tarea j
+    x = {}
     for i in range(m):
-        row = [0] * (m * n)
         for j in range(n):
-            row[i * n + j] = 1
-        A_ub.append(row)
-        b_ub.append(oferta[i])
+            x[(i, j)] = pulp.LpVariable(f"x_{i}_{j}", lowBound=0)
     
-    # Restricciones de demanda: suma por columna == demanda
-    A_eq = []
-    b_eq = []
-    for j in range(n):
-        row = [0] * (m * n)
-        for i in range(m):
-            row[i * n + j] = 1
-        A_eq.append(row)
-        b_eq.append(demanda[j])
+    # Función objetivo: minimizar costo total
+    problema += pulp.lpSum([costos[i][j] * x[(i, j)] 
+                           for i in range(m) for j in range(n)])
     
-    # Límites: x >= 0
-    bounds = [(0, None)] * (m * n)
+    # Restricciones de oferta
+    for i in range(m):
+        problema += pulp.lpSum([x[(i, j)] for j in range(n)]) <= oferta[i]
+    
+    # Restricciones de demanda
+    for j in range(n):
+        problema += pulp.lpSum([x[(i, j)] for i in range(m)]) == demanda[j]
     
     # Resolver
-    resultado = linprog(c, A_ub=A_ub, b_ub=b_ub, A_eq=A_eq, b_eq=b_eq, 
-                       bounds=bounds, method='highs')
+    problema.solve(pulp.PULP_CBC_CMD(msg=0))
     
-    if resultado.success:
-        print("\n" + "=" * 70)
-        print("SOLUCIÓN ÓPTIMA")
-        print("=" * 70)
-        
-        x = resultado.x.reshape(m, n)
-        costo_total = resultado.fun
-        
-        print("\nAsignaciones (horas):")
-        print("-" * 70)
-        print(f"{'Equipo\\Tarea':<15}", end="")
-        for tarea in tareas:
-            print(f"{tarea[:10]:<12}", end="")
-        print("Total")
-        print("-" * 70)
-        
-        for i, equipo in enumerate(equipos):
-            print(f"{equipo:<15}", end="")
-            total_fila = 0
-            for j in range(n):
-                valor = x[i][j]
-                if valor > 1e-6:  # Solo mostrar valores significativos
-                    print(f"{valor:<12.2f}", end="")
-                    total_fila += valor
-                else:
-                    print(f"{'0.00':<12}", end="")
-            print(f"{total_fila:.2f}")
-        
-        print("-" * 70)
-        print(f"{'Total':<15}", end="")
-        for j in range(n):
-            total_col = sum(x[i][j] for i in range(m))
-            print(f"{total_col:<12.2f}", end="")
-        print()
-        print("-" * 70)
-        print(f"\nCosto total mínimo: {costo_total:.2f}")
-        print("=" * 70)
-    else:
-        print("\nNo se encontró solución óptima.")
+    if problema.status != pulp.LpStatusOptimal:
+        return None, None
+    
+    asignacion = [[pulp.value(x[(i, j)]) or 0.0 for j in range(n)] for i in range(m)]
+    costo_total = sum(costos[i][j] * asignacion[i][j] for i in range(m) for j in range(n))
+    return asignacion, costo_total
 
 
 def resolver_con_pulp(equipos, tareas, oferta, demanda, costos):
     """Resuelve usando PuLP"""
     try:
-        import pulp
-        
-        m = len(equipos)
-        n = len(tareas)
-        
-        # Crear problema
-        problema = pulp.LpProblem("Transporte_Sprint", pulp.LpMinimize)
-        
-        # Variables: x[i][j] = horas asignadas del equipo i a la tarea j
-        x = {}
-        for i in range(m):
-            for j in range(n):
-                x[(i, j)] = pulp.LpVariable(f"x_{i}_{j}", lowBound=0)
-        
-        # Función objetivo: minimizar costo total
-        problema += pulp.lpSum([costos[i][j] * x[(i, j)] 
-                               for i in range(m) for j in range(n)])
-        
-        # Restricciones de oferta
-        for i in range(m):
-            problema += pulp.lpSum([x[(i, j)] for j in range(n)]) <= oferta[i]
-        
-        # Restricciones de demanda
-        for j in range(n):
-            problema += pulp.lpSum([x[(i, j)] for i in range(m)]) == demanda[j]
-        
-        # Resolver
-        problema.solve(pulp.PULP_CBC_CMD(msg=0))
-        
-        if problema.status == pulp.LpStatusOptimal:
-            print("\n" + "=" * 70)
-            print("SOLUCIÓN ÓPTIMA")
-            print("=" * 70)
-            
-            print("\nAsignaciones (horas):")
-            print("-" * 70)
-            print(f"{'Equipo\\Tarea':<15}", end="")
-            for tarea in tareas:
-                print(f"{tarea[:10]:<12}", end="")
-            print("Total")
-            print("-" * 70)
-            
-            costo_total = 0
-            for i, equipo in enumerate(equipos):
-                print(f"{equipo:<15}", end="")
-                total_fila = 0
-                for j in range(n):
-                    valor = pulp.value(x[(i, j)])
-                    if valor and valor > 1e-6:
-                        print(f"{valor:<12.2f}", end="")
-                        total_fila += valor
-                        costo_total += costos[i][j] * valor
-                    else:
-                        print(f"{'0.00':<12}", end="")
-                print(f"{total_fila:.2f}")
-            
-            print("-" * 70)
-            print(f"\nCosto total mínimo: {costo_total:.2f}")
-            print("=" * 70)
+        x, costo_total = transporte_pulp(oferta, demanda, costos)
+        if x is not None:
+            imprimir_asignaciones(equipos, tareas, x, costo_total)
         else:
             print("\nNo se encontró solución óptima.")
             
@@ -236,6 +1044,66 @@ def resolver_con_pulp(equipos, tareas, oferta, demanda, costos):
         print("O instala scipy: pip install scipy numpy")
 
 
+def resolver_con_flujo_costo_minimo(equipos, tareas, oferta, demanda, costos):
+    """Resuelve con flujo de costo mínimo en Python puro (sin dependencias)"""
+    x, costo_total = flujo_costo_minimo_transporte(oferta, demanda, costos)
+    imprimir_asignaciones(equipos, tareas, x, costo_total)
+    return x, costo_total
+
+
+def comparar_metodos_transporte(tamanos=((20, 100), (50, 250), (100, 500)), semilla=0):
+    """
+    Compara tiempos del flujo de costo mínimo en Python puro contra el
+    simplex de transporte, linprog (HiGHS) y PuLP (CBC) en instancias
+    aleatorias con horas enteras. Los métodos no instalados se omiten.
+
+    Args:
+        tamanos: Tuplas (equipos, tareas) a probar
+        semilla: Semilla del generador aleatorio
+
+    Returns:
+        Lista de diccionarios {'tamano', 'metodo', 'segundos', 'costo_total'}
+    """
+    import random
+    try:
+        import pulp  # noqa: F401
+        pulp_disponible = True
+    except ImportError:
+        pulp_disponible = False
+
+    metodos = [('Flujo costo mínimo (Python)', flujo_costo_minimo_transporte)]
+    if NUMPY_AVAILABLE:
+        metodos.append(('Simplex de transporte', simplex_transporte))
+    if SCIPY_AVAILABLE:
+        metodos.append(('linprog (HiGHS)',
+                        lambda a, b, c: (None, resolver_modelo(modelo_transporte(a, b, c)).fun)))
+    if pulp_disponible:
+        metodos.append(('PuLP (CBC)', transporte_pulp))
+
+    generador = random.Random(semilla)
+    filas = []
+    print("=" * 70)
+    print("COMPARACIÓN DE MÉTODOS - MODELO DE TRANSPORTE")
+    print("=" * 70)
+    print(f"{'Tamaño':<14} {'Método':<30} {'Tiempo (s)':<12} {'Costo':<12}")
+    print("-" * 70)
+    for m, n in tamanos:
+        demanda = [generador.randint(1, 100) for _ in range(n)]
+        oferta = [generador.randint(10, 100) for _ in range(m)]
+        factor = 1.05 * sum(demanda) / sum(oferta)
+        oferta = [int(h * factor) + 1 for h in oferta]
+        costos = [[generador.randint(1, 100) for _ in range(n)] for _ in range(m)]
+        for nombre, metodo in metodos:
+            inicio = time.perf_counter()
+            _, costo_total = metodo(oferta, demanda, costos)
+            segundos = time.perf_counter() - inicio
+            filas.append({'tamano': (m, n), 'metodo': nombre,
+                          'segundos': segundos, 'costo_total': costo_total})
+            print(f"{f'{m}x{n}':<14} {nombre:<30} {segundos:<12.4f} {costo_total:<12.2f}")
+    print("=" * 70)
+    return filas
+
+
 if __name__ == "__main__":
     resolver_transporte()
 
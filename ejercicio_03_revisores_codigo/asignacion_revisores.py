@@ -6,12 +6,32 @@ Objetivo: Asignar revisores a pull requests considerando compatibilidad
 y carga de trabajo.
 """
 
+import bisect
+import heapq
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flujo_costo_minimo import RedFlujoCostoMinimo
+from tabla_costos import agrupar_por_columna, matriz_costos, pares_explicitos
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 try:
     import pulp
     PULP_AVAILABLE = True
 except ImportError:
     PULP_AVAILABLE = False
 
+COSTO_POR_DEFECTO = 999  # penalización de un par (revisor, PR) sin costo definido
+_COSTO_SIN_REVISOR = 10 ** 12  # PR sin revisor en ModeloRevisores (muy por encima de cualquier cadena)
+
 
 def resolver_asignacion_revisores():
     """
@@ -76,22 +96,36 @@ def resolver_asignacion_revisores():
     if PULP_AVAILABLE:
         resolver_con_pulp(revisores, pull_requests, costos, capacidad_maxima)
     else:
-        resolver_con_fuerza_bruta(revisores, pull_requests, costos, capacidad_maxima)
+        resolver_con_flujo_costo_minimo(revisores, pull_requests, costos, capacidad_maxima)
 
 
-def resolver_con_pulp(revisores, pull_requests, costos, capacidad_maxima):
-    """Resuelve usando programación lineal entera con PuLP"""
+def asignar_revisores_pulp(revisores, pull_requests, costos, capacidad_maxima):
+    """
+    Asignación óptima con programación lineal entera (PuLP/CBC).
+
+    Args:
+        revisores: Lista de revisores
+        pull_requests: Lista de PRs
+        costos: Diccionario {(revisor, pr): costo} o TablaCostos
+        capacidad_maxima: Diccionario {revisor: máximo de PRs}
+
+    Returns:
+        asignaciones: Diccionario {revisor: [prs]}, o None si no hay
+                      solución factible
+        costo_total: Costo total mínimo
+    """
+    # Costos de todos los pares (diccionario o TablaCostos) como matriz NumPy
+    matriz = matriz_costos(costos, revisores, pull_requests, 999)
+    
     # Crear problema
     problema = pulp.LpProblem("Asignacion_Revisores", pulp.LpMinimize)
     
     # Variables de decisión binarias
-    x = pulp.LpVariable.dicts("Asignacion",
-                              [(r, pr) for r in revisores for pr in pull_requests],
-                              cat='Binary')
+    pares = [(r, pr) for r in revisores for pr in pull_requests]
+    x = pulp.LpVariable.dicts("Asignacion", pares, cat='Binary')
     
-    # Función objetivo: minimizar costo total
-    problema += pulp.lpSum([costos.get((r, pr), 999) * x[(r, pr)]
-                           for r in revisores for pr in pull_requests])
+    # Función objetivo: minimizar costo total (coeficientes en el orden de `pares`)
+    problema += pulp.LpAffineExpression(zip((x[par] for par in pares), matriz.ravel().tolist()))
     
     # Restricción: Cada PR debe ser asignado a exactamente un revisor
     for pr in pull_requests:
@@ -104,21 +138,27 @@ def resolver_con_pulp(revisores, pull_requests, costos, capacidad_maxima):
     # Resolver
     problema.solve(pulp.PULP_CBC_CMD(msg=0))
     
-    if problema.status == pulp.LpStatusOptimal:
+    if problema.status != pulp.LpStatusOptimal:
+        return None, None
+    
+    elegidos = np.array([pulp.value(x[par]) == 1 for par in pares],
+                        dtype=bool).reshape(matriz.shape)
+    asignaciones = {r: [] for r in revisores}
+    for i, j in zip(*np.nonzero(elegidos)):
+        asignaciones[revisores[i]].append(pull_requests[j])
+    return asignaciones, matriz[elegidos].sum().item()
+
+
+def resolver_con_pulp(revisores, pull_requests, costos, capacidad_maxima):
+    """Resuelve usando programación lineal entera con PuLP"""
+    asignaciones, costo_total = asignar_revisores_pulp(revisores, pull_requests,
+                                                       costos, capacidad_maxima)
+    
+    if asignaciones is not None:
         print("\n" + "=" * 70)
         print("SOLUCIÓN ÓPTIMA")
         print("=" * 70)
         
-        asignaciones = {}
-        costo_total = 0
-        
-        for r in revisores:
-            asignaciones[r] = []
-            for pr in pull_requests:
-                if pulp.value(x[(r, pr)]) == 1:
-                    asignaciones[r].append(pr)
-                    costo_total += costos.get((r, pr), 999)
-        
         print("\nAsignaciones:")
         print("-" * 70)
         for r in revisores:
@@ -130,51 +170,151 @@ def resolver_con_pulp(revisores, pull_requests, costos, capacidad_maxima):
         
         print("-" * 70)
         print(f"\nCosto total mínimo: {costo_total}")
-        print(f"Estado: {pulp.LpStatus[problema.status]}")
+        print(f"Estado: {pulp.LpStatus[pulp.LpStatusOptimal]}")
         print("=" * 70)
     else:
         print("\nNo se encontró solución factible.")
 
 
-def resolver_con_fuerza_bruta(revisores, pull_requests, costos, capacidad_maxima):
-    """Resuelve usando fuerza bruta (para problemas pequeños)"""
-    from itertools import product
-    
-    print("\n⚠ PuLP no está instalado. Usando método de fuerza bruta...")
-    print("   Instala PuLP para mejor rendimiento: pip install pulp")
+def asignar_revisores_flujo(revisores, pull_requests, costos, capacidad_maxima,
+                            costo_por_defecto=COSTO_POR_DEFECTO):
+    """
+    Asignación exacta de revisores como flujo de costo mínimo (en proceso).
+
+    Red: PR -> revisor con el costo de `costos` (capacidad 1) y revisor ->
+    sumidero con capacidad `capacidad_maxima`; cada PR aporta una unidad de
+    flujo desde la fuente. Los pares sin costo explícito valen
+    `costo_por_defecto`: en lugar de agregar un arco por cada par (R x P
+    arcos) pasan por un único nodo "por defecto" (PR -> por defecto con ese
+    costo, por defecto -> revisor con costo 0), lo que es equivalente
+    mientras ningún costo explícito supere al de defecto.
+
+    Args:
+        revisores: Lista de revisores
+        pull_requests: Lista de PRs
+        costos: Diccionario {(revisor, pr): costo} o TablaCostos
+        capacidad_maxima: Diccionario {revisor: máximo de PRs}
+        costo_por_defecto: Costo de los pares ausentes en `costos`
+
+    Returns:
+        asignaciones: Diccionario {revisor: [prs]}, o None si no hay
+                      capacidad para revisar todos los PRs
+        costo_total: Costo total mínimo
+    """
+    R, P = len(revisores), len(pull_requests)
+    por_defecto = R + P
+    fuente, sumidero = por_defecto + 1, por_defecto + 2
+    red = RedFlujoCostoMinimo(por_defecto + 3)
+
+    # Arcos PR -> revisor armados como vectores: el arco k queda en
+    # primero + 2·k de la red
+    filas, columnas, valores = pares_explicitos(costos, revisores, pull_requests)
+    usar_nodo_defecto = not len(valores) or valores.max() <= costo_por_defecto
+    if not usar_nodo_defecto:
+        # Algún costo explícito supera al de defecto: arcos completos
+        sin_costo = np.ones((R, P), dtype=bool)
+        sin_costo[filas, columnas] = False
+        filas_defecto, columnas_defecto = np.nonzero(sin_costo)
+        filas = np.concatenate([filas, filas_defecto])
+        columnas = np.concatenate([columnas, columnas_defecto])
+        valores = np.concatenate([valores, np.full(len(filas_defecto), costo_por_defecto)])
+    cantidad = len(valores)
+    primero = red.agregar_arcos((R + columnas).tolist(), filas.tolist(), [1] * cantidad,
+                                valores.tolist())
+    arcos = primero + 2 * np.arange(cantidad)
+    if usar_nodo_defecto:
+        defecto_pr = [red.agregar_arco(pr, por_defecto, 1, costo_por_defecto)
+                      for pr in range(R, R + P)]
+        defecto = [red.agregar_arco(por_defecto, r, P, 0) for r in range(R)]
+    else:
+        defecto = []
+    origen = [red.agregar_arco(fuente, pr, 1, 0) for pr in range(R, R + P)]
+    salida = [red.agregar_arco(r, sumidero, capacidad_maxima[revisor], 0)
+              for r, revisor in enumerate(revisores)]
+
+    # Arranque goloso: cada PR va a su opción más barata si esa opción tiene
+    # cupo. Con potenciales -costo_mínimo en los PRs y 0 en el resto, ningún
+    # arco residual queda con costo reducido negativo, así que los caminos
+    # mínimos sucesivos solo reubican los PRs que quedaron sin asignar.
+    # La opción más barata de cada PR es el primer arco de su grupo ordenado
+    # por costo (en empate, el primero agregado); el nodo por defecto gana
+    # los empates con los arcos explícitos.
+    mejor_costo = [costo_por_defecto] * P
+    mejor_arco = [None] * P
+    if cantidad:
+        orden = np.lexsort((arcos, valores, columnas))
+        primeros = orden[np.r_[True, columnas[orden[1:]] != columnas[orden[:-1]]]]
+        if usar_nodo_defecto:
+            primeros = primeros[valores[primeros] < costo_por_defecto]
+        for p, c, arco in zip(columnas[primeros].tolist(), valores[primeros].tolist(),
+                              arcos[primeros].tolist()):
+            mejor_costo[p], mejor_arco[p] = c, arco
+    cupo = [capacidad_maxima[revisor] for revisor in revisores]
+    libres = [r for r in range(R) if cupo[r] > 0]
+    enviados = 0
+    for k, arco in enumerate(mejor_arco):
+        if arco is None:
+            # La opción más barata es el nodo por defecto (cualquier revisor)
+            while libres and cupo[libres[-1]] == 0:
+                libres.pop()
+            if not usar_nodo_defecto or not libres:
+                continue
+            r = libres[-1]
+            red.enviar(defecto_pr[k], 1)
+            red.enviar(defecto[r], 1)
+        else:
+            r = red.destino[arco]
+            if cupo[r] == 0:
+                continue
+            red.enviar(arco, 1)
+        cupo[r] -= 1
+        red.enviar(origen[k], 1)
+        red.enviar(salida[r], 1)
+        enviados += 1
+
+    potencial = [0] * (por_defecto + 3)
+    potencial[R:R + P] = [-c for c in mejor_costo]
+    if not usar_nodo_defecto and None in mejor_arco:
+        potencial = None
+
+    flujo_total, _ = red.resolver(fuente, sumidero, potencial=potencial)
+    if enviados + flujo_total < P:
+        return None, None
+
+    # Reconstruir: primero los arcos explícitos (flujo leído en bloque de los
+    # inversos), luego los que pasaron por el nodo por defecto (cualquier PR
+    # sin arco explícito usado hacia cualquier revisor con flujo desde ese nodo)
+    usados = np.flatnonzero(red.capacidad[primero + 1:primero + 2 * cantidad:2])
+    asignaciones = {revisor: [] for revisor in revisores}
+    for r, p in zip(filas[usados].tolist(), columnas[usados].tolist()):
+        asignaciones[revisores[r]].append(pull_requests[p])
+    costo_total = valores[usados].sum().item()
+    asignado = np.zeros(P, dtype=bool)
+    asignado[columnas[usados]] = True
+    pendientes = np.flatnonzero(~asignado).tolist()
+    for r, arco in enumerate(defecto):
+        for _ in range(red.flujo(arco)):
+            asignaciones[revisores[r]].append(pull_requests[pendientes.pop()])
+            costo_total += costo_por_defecto
+
+    orden = {pr: k for k, pr in enumerate(pull_requests)}
+    for lista in asignaciones.values():
+        lista.sort(key=orden.__getitem__)
+    return asignaciones, costo_total
+
+
+def resolver_con_flujo_costo_minimo(revisores, pull_requests, costos, capacidad_maxima):
+    """Resuelve con flujo de costo mínimo en Python puro (exacto, sin PuLP)"""
+    print("\n⚠ PuLP no está instalado. Usando flujo de costo mínimo en Python...")
     
-    # Generar todas las asignaciones posibles
-    mejor_costo = float('inf')
-    mejor_asignacion = None
+    asignaciones, costo_total = asignar_revisores_flujo(revisores, pull_requests,
+                                                        costos, capacidad_maxima)
     
-    # Cada PR puede ser asignado a cualquier revisor
-    for asignacion in product(revisores, repeat=len(pull_requests)):
-        # Verificar restricciones de capacidad
-        conteo = {r: 0 for r in revisores}
-        for pr_idx, revisor in enumerate(asignacion):
-            conteo[revisor] += 1
-        
-        # Verificar si cumple capacidad máxima
-        factible = all(conteo[r] <= capacidad_maxima[r] for r in revisores)
-        
-        if factible:
-            # Calcular costo
-            costo = sum(costos.get((asignacion[i], pull_requests[i]), 999)
-                       for i in range(len(pull_requests)))
-            
-            if costo < mejor_costo:
-                mejor_costo = costo
-                mejor_asignacion = asignacion
-    
-    if mejor_asignacion:
+    if asignaciones:
         print("\n" + "=" * 70)
         print("SOLUCIÓN ÓPTIMA")
         print("=" * 70)
         
-        asignaciones = {r: [] for r in revisores}
-        for i, revisor in enumerate(mejor_asignacion):
-            asignaciones[revisor].append(pull_requests[i])
-        
         print("\nAsignaciones:")
         print("-" * 70)
         for r in revisores:
@@ -185,8 +325,700 @@ def resolver_con_fuerza_bruta(revisores, pull_requests, costos, capacidad_maxima
                 print(f"{r:<15} -> (sin asignaciones)")
         
         print("-" * 70)
-        print(f"\nCosto total mínimo: {mejor_costo}")
+        print(f"\nCosto total mínimo: {costo_total}")
         print("=" * 70)
+    else:
+        print("\nNo se encontró solución factible.")
+    
+    return asignaciones, costo_total
+
+
+def asignar_revisores_estable(revisores, pull_requests, costos, capacidad_maxima,
+                              costo_por_defecto=COSTO_POR_DEFECTO):
+    """
+    Emparejamiento estable estilo hospitales/residentes (Gale-Shapley con
+    capacidades, propuesto por los PRs).
+
+    Cada PR ordena a los revisores por costo creciente y cada revisor
+    prefiere los PRs de menor costo (empates por orden en `pull_requests`).
+    Los PRs libres proponen en orden de preferencia; un revisor sin cupo solo
+    acepta un PR nuevo si lo prefiere a su peor PR aceptado, que queda libre
+    y sigue proponiendo. Cada PR propone a lo sumo una vez a cada revisor:
+    O(R·P) propuestas.
+
+    El resultado respeta `capacidad_maxima` y es estable (ningún revisor y
+    PR prefieren emparejarse entre sí antes que con su asignación actual),
+    pero no minimiza el costo total: la pérdida frente al óptimo se mide con
+    `comparar_estable_con_optimo`.
+
+    Args:
+        revisores: Lista de revisores
+        pull_requests: Lista de PRs
+        costos: Diccionario {(revisor, pr): costo} o TablaCostos
+        capacidad_maxima: Diccionario {revisor: máximo de PRs}
+        costo_por_defecto: Costo de los pares ausentes en `costos`. Con None
+                           solo son aceptables los pares listados
+
+    Returns:
+        asignaciones: Diccionario {revisor: [prs]}
+        costo_total: Costo total de la asignación
+        sin_asignar: PRs que no consiguieron revisor
+    """
+    R, P = len(revisores), len(pull_requests)
+    # Pares explícitos de cada PR ya ordenados por (costo, revisor)
+    inicio, filas, valores = agrupar_por_columna(
+        *pares_explicitos(costos, revisores, pull_requests), P)
+    inicio, filas, valores = inicio.tolist(), filas.tolist(), valores.tolist()
+
+    def preferencias(p):
+        # Explícitos hasta el costo por defecto, luego los pares sin costo
+        # (en orden de `revisores`) y por último los explícitos más caros
+        a, b = inicio[p], inicio[p + 1]
+        k = b if costo_por_defecto is None else bisect.bisect_right(valores, costo_por_defecto, a, b)
+        yield from zip(valores[a:k], filas[a:k])
+        if costo_por_defecto is not None:
+            con_costo = set(filas[a:b])
+            for r in range(R):
+                if r not in con_costo:
+                    yield costo_por_defecto, r
+            yield from zip(valores[k:b], filas[k:b])
+
+    cupo = [capacidad_maxima[revisor] for revisor in revisores]
+    aceptados = [[] for _ in range(R)]   # montículo de (-costo, -pr): peor PR arriba
+    elegido = [None] * P                  # pr -> (costo, revisor)
+    propuestas = [preferencias(p) for p in range(P)]
+    libres = list(range(P - 1, -1, -1))
+    while libres:
+        p = libres.pop()
+        for c, r in propuestas[p]:
+            cola = aceptados[r]
+            if len(cola) < cupo[r]:
+                heapq.heappush(cola, (-c, -p))
+            elif cola and (c, p) < (-cola[0][0], -cola[0][1]):
+                _, q = heapq.heapreplace(cola, (-c, -p))
+                elegido[-q] = None
+                libres.append(-q)
+            else:
+                continue
+            elegido[p] = (c, r)
+            break
+
+    asignaciones = {revisor: [] for revisor in revisores}
+    costo_total = 0
+    sin_asignar = []
+    for p, pr in enumerate(pull_requests):
+        if elegido[p] is None:
+            sin_asignar.append(pr)
+        else:
+            c, r = elegido[p]
+            asignaciones[revisores[r]].append(pr)
+            costo_total += c
+    return asignaciones, costo_total, sin_asignar
+
+
+def comparar_estable_con_optimo(tamanos=((10, 100), (20, 400), (50, 1000)),
+                                holgura=1.1, semilla=0):
+    """
+    Compara el emparejamiento estable contra la asignación óptima (flujo de
+    costo mínimo y, si está instalado, el modelo entero de PuLP) en
+    instancias aleatorias: pérdida de costo respecto del óptimo y latencia.
+
+    Args:
+        tamanos: Tuplas (revisores, PRs) a probar
+        holgura: Capacidad total sobre la cantidad de PRs
+        semilla: Semilla del generador aleatorio
+
+    Returns:
+        Lista de diccionarios {'tamano', 'metodo', 'segundos', 'costo_total',
+        'perdida'} (perdida = fracción sobre el costo óptimo)
+    """
+    import random
+
+    metodos = [('Estable (Gale-Shapley)', asignar_revisores_estable),
+               ('Flujo costo mínimo', asignar_revisores_flujo)]
+    if PULP_AVAILABLE:
+        metodos.append(('PuLP (CBC)', asignar_revisores_pulp))
+
+    generador = random.Random(semilla)
+    filas = []
+    print("=" * 70)
+    print("EMPAREJAMIENTO ESTABLE vs ASIGNACIÓN ÓPTIMA")
+    print("=" * 70)
+    print(f"{'Tamaño':<12} {'Método':<26} {'Tiempo (s)':<12} {'Costo':<10} {'Pérdida':<10}")
+    print("-" * 70)
+    for R, P in tamanos:
+        revisores = [f"R{i}" for i in range(R)]
+        pull_requests = [f"PR-{j}" for j in range(P)]
+        costos = {(r, pr): generador.randint(1, 50) for r in revisores for pr in pull_requests}
+        cupo = -(-int(holgura * P) // R)
+        capacidad_maxima = {r: cupo for r in revisores}
+
+        resultados = []
+        for nombre, metodo in metodos:
+            inicio = time.perf_counter()
+            costo_total = metodo(revisores, pull_requests, costos, capacidad_maxima)[1]
+            resultados.append((nombre, time.perf_counter() - inicio, costo_total))
+        optimo = min(costo for _, _, costo in resultados)
+        for nombre, segundos, costo_total in resultados:
+            perdida = (costo_total - optimo) / optimo if optimo else 0.0
+            filas.append({'tamano': (R, P), 'metodo': nombre, 'segundos': segundos,
+                          'costo_total': costo_total, 'perdida': perdida})
+            print(f"{f'{R}x{P}':<12} {nombre:<26} {segundos:<12.4f} {costo_total:<10} {perdida:<10.1%}")
+    print("=" * 70)
+    return filas
+
+
+def asignar_revisores_multiples(revisores, pull_requests, costos, capacidad_maxima,
+                                revisores_por_pr=2, propietarios=None,
+                                costo_por_defecto=COSTO_POR_DEFECTO):
+    """
+    b-matching exacto: k revisores distintos por PR, con al menos un code
+    owner entre ellos, respetando la capacidad de cada revisor.
+
+    La cobertura de owners no requiere restricciones laterales: cada PR con
+    owners se divide en un nodo "owner" (1 unidad, solo hacia sus owners) y
+    un nodo general (k - 1 unidades, hacia cualquier candidato). Los owners
+    pasan por un nodo par (PR, owner) de capacidad 1 al que llegan ambos
+    nodos, así ningún revisor se cuenta dos veces en el mismo PR. El modelo
+    queda como flujo de costo mínimo puro y se resuelve exacto:
+
+        fuente -> PR owner (1)   -> par (PR, owner) -> owner
+        fuente -> PR (k - 1)     -> par (PR, owner) / revisor -> sumidero
+
+    Args:
+        revisores: Lista de revisores
+        pull_requests: Lista de PRs
+        costos: Diccionario {(revisor, pr): costo} o TablaCostos
+        capacidad_maxima: Diccionario {revisor: máximo de PRs}
+        revisores_por_pr: k común o diccionario {pr: k}
+        propietarios: Diccionario {pr: conjunto de owners}; los PRs sin
+                      owners no tienen restricción de cobertura
+        costo_por_defecto: Costo de los pares ausentes en `costos`. Con None
+                           solo son candidatos los pares listados (necesario
+                           a gran escala: evita R x P arcos)
+
+    Returns:
+        asignaciones: Diccionario {pr: [revisores]}
+        costo_total: Costo total mínimo
+        incompletos: PRs con menos de k revisores o sin owner (vacío si el
+                     problema es factible)
+    """
+    propietarios = propietarios or {}
+    R, P = len(revisores), len(pull_requests)
+    indice_revisor = {r: k for k, r in enumerate(revisores)}
+    if isinstance(revisores_por_pr, dict):
+        requeridos = [revisores_por_pr[pr] for pr in pull_requests]
+    else:
+        requeridos = [revisores_por_pr] * P
+
+    # Candidatos por PR: [(costo, revisor)] ordenados por costo; los pares
+    # explícitos llegan ya agrupados y ordenados por PR
+    inicio, filas, valores = agrupar_por_columna(
+        *pares_explicitos(costos, revisores, pull_requests), P)
+    inicio, filas, valores = inicio.tolist(), filas.tolist(), valores.tolist()
+    candidatos = [list(zip(valores[inicio[p]:inicio[p + 1]], filas[inicio[p]:inicio[p + 1]]))
+                  for p in range(P)]
+    if costo_por_defecto is not None:
+        for p in range(P):
+            con_costo = set(filas[inicio[p]:inicio[p + 1]])
+            candidatos[p].extend((costo_por_defecto, r) for r in range(R) if r not in con_costo)
+            candidatos[p].sort()
+    es_owner = [{indice_revisor[r] for r in propietarios.get(pr, ()) if r in indice_revisor}
+                for pr in pull_requests]
+    con_owners = [bool(propietarios.get(pr)) for pr in pull_requests]
+
+    # Nodos: revisores 0..R-1, PRs R..R+P-1, luego nodos owner y pares
+    nodo_owner = {}
+    siguiente = R + P
+    for p in range(P):
+        if con_owners[p]:
+            nodo_owner[p] = siguiente
+            siguiente += 1
+    pares = sum(1 for p in range(P) for _, r in candidatos[p] if r in es_owner[p])
+    fuente, sumidero = siguiente + pares, siguiente + pares + 1
+    red = RedFlujoCostoMinimo(sumidero + 1)
+
+    origen_general, origen_owner = [], {}
+    arcos_pr = []   # por PR: {revisor: (arco general, arco owner, arco par -> revisor)}
+    for p in range(P):
+        k = requeridos[p]
+        origen_general.append(red.agregar_arco(fuente, R + p, k - 1 if con_owners[p] else k, 0))
+        if con_owners[p]:
+            origen_owner[p] = red.agregar_arco(fuente, nodo_owner[p], 1, 0)
+        arcos = {}
+        for c, r in candidatos[p]:
+            if r in es_owner[p]:
+                par = siguiente
+                siguiente += 1
+                arcos[r] = (red.agregar_arco(R + p, par, 1, c),
+                            red.agregar_arco(nodo_owner[p], par, 1, c),
+                            red.agregar_arco(par, r, 1, 0))
+            else:
+                arcos[r] = (red.agregar_arco(R + p, r, 1, c), None, None)
+        arcos_pr.append(arcos)
+    salida = [red.agregar_arco(r, sumidero, capacidad_maxima[revisor], 0)
+              for r, revisor in enumerate(revisores)]
+
+    # Arranque goloso: cada PR toma su conjunto óptimo aislado (owner más
+    # barato + los k - 1 candidatos más baratos restantes) si todos tienen
+    # cupo. Ese flujo parcial no tiene ciclos negativos fuera de la fuente,
+    # así que Bellman-Ford da potenciales válidos y los caminos mínimos
+    # sucesivos solo resuelven los PRs en conflicto.
+    cupo = [capacidad_maxima[revisor] for revisor in revisores]
+    for p in range(P):
+        k = requeridos[p]
+        elegidos = []
+        if con_owners[p]:
+            owner = next((r for _, r in candidatos[p] if r in es_owner[p]), None)
+            if owner is None:
+                continue
+            elegidos.append(owner)
+        elegidos.extend(r for _, r in candidatos[p] if r not in elegidos)
+        del elegidos[k:]
+        if len(elegidos) < k or any(cupo[r] == 0 for r in elegidos):
+            continue
+        for posicion, r in enumerate(elegidos):
+            general, por_owner, hacia_revisor = arcos_pr[p][r]
+            if posicion == 0 and con_owners[p]:
+                red.enviar(origen_owner[p], 1)
+                red.enviar(por_owner, 1)
+            else:
+                red.enviar(origen_general[p], 1)
+                red.enviar(general, 1)
+            if hacia_revisor is not None:
+                red.enviar(hacia_revisor, 1)
+            red.enviar(salida[r], 1)
+            cupo[r] -= 1
+
+    red.completar(fuente, sumidero)
+
+    asignaciones = {}
+    costo_total = 0
+    incompletos = []
+    for p, pr in enumerate(pull_requests):
+        elegidos = [r for r, (general, por_owner, hacia_revisor) in arcos_pr[p].items()
+                    if red.flujo(hacia_revisor if hacia_revisor is not None else general)]
+        asignaciones[pr] = [revisores[r] for r in sorted(elegidos)]
+        costo_total += sum(red.costo[arcos_pr[p][r][0]] for r in elegidos)
+        if len(elegidos) < requeridos[p] or (con_owners[p] and not es_owner[p] & set(elegidos)):
+            incompletos.append(pr)
+    return asignaciones, costo_total, incompletos
+
+
+def resolver_revisores_multiples():
+    """
+    Demostración: dos revisores por PR con al menos un code owner.
+    """
+    revisores = ['Alice', 'Bob', 'Charlie', 'Diana']
+    pull_requests = ['PR-001', 'PR-002', 'PR-003', 'PR-004', 'PR-005']
+    costos = {
+        ('Alice', 'PR-001'): 2, ('Alice', 'PR-002'): 5, ('Alice', 'PR-003'): 3,
+        ('Alice', 'PR-004'): 4, ('Alice', 'PR-005'): 2,
+        ('Bob', 'PR-001'): 4, ('Bob', 'PR-002'): 2, ('Bob', 'PR-003'): 5,
+        ('Bob', 'PR-004'): 3, ('Bob', 'PR-005'): 4,
+        ('Charlie', 'PR-001'): 3, ('Charlie', 'PR-002'): 4, ('Charlie', 'PR-003'): 2,
+        ('Charlie', 'PR-004'): 5, ('Charlie', 'PR-005'): 3,
+        ('Diana', 'PR-001'): 5, ('Diana', 'PR-002'): 3, ('Diana', 'PR-003'): 4,
+        ('Diana', 'PR-004'): 2, ('Diana', 'PR-005'): 5
+    }
+    capacidad_maxima = {'Alice': 3, 'Bob': 3, 'Charlie': 3, 'Diana': 3}
+    propietarios = {
+        'PR-001': {'Diana'}, 'PR-002': {'Bob', 'Charlie'}, 'PR-003': {'Alice'},
+        'PR-004': {'Diana'}, 'PR-005': {'Bob'}
+    }
+
+    print("=" * 70)
+    print("ASIGNACIÓN DE REVISORES - 2 REVISORES POR PR CON CODE OWNER")
+    print("=" * 70)
+    asignaciones, costo_total, incompletos = asignar_revisores_multiples(
+        revisores, pull_requests, costos, capacidad_maxima,
+        revisores_por_pr=2, propietarios=propietarios)
+
+    print(f"\n{'PR':<10} {'Owners':<20} {'Revisores asignados':<30}")
+    print("-" * 70)
+    for pr in pull_requests:
+        owners = ", ".join(sorted(propietarios[pr]))
+        print(f"{pr:<10} {owners:<20} {', '.join(asignaciones[pr]):<30}")
+    print("-" * 70)
+    print(f"\nCosto total mínimo: {costo_total}")
+    if incompletos:
+        print(f"PRs sin cobertura completa: {', '.join(incompletos)}")
+    print("=" * 70)
+    return asignaciones, costo_total, incompletos
+
+
+class ModeloRevisores:
+    """
+    Modelo persistente de asignación de revisores (un revisor por PR) para
+    llamadas repetidas, por ejemplo un bot que corre cada pocos minutos.
+
+    Conserva la red de flujo de `asignar_revisores_flujo`, su flujo y sus
+    potenciales duales entre llamadas. Agregar o retirar PRs y revisores y
+    cambiar costos o capacidades modifica la red en el lugar: los PRs
+    afectados se liberan y `resolver` solo busca caminos mínimos para ellos,
+    y el cupo liberado se re-optimiza localmente (`reparar_arco`). El trabajo
+    por llamada depende del cambio, no del tamaño de la matriz de costos.
+
+    Si el cupo no alcanza, cada PR tiene un arco directo al sumidero con un
+    costo enorme ("sin revisor"): la solución maximiza primero los PRs
+    asignados y luego minimiza el costo, y sigue siendo exacta.
+
+    Los costos explícitos deben ser <= `costo_por_defecto`: los pares sin
+    costo comparten el nodo "por defecto". `costos` puede ser un diccionario
+    {(revisor, pr): costo} o una TablaCostos.
+
+    Ejemplo:
+        modelo = ModeloRevisores(revisores, pull_requests, costos, capacidad_maxima)
+        modelo.agregar_pr('PR-006', {'Alice': 3, 'Bob': 1})
+        modelo.retirar_pr('PR-001')
+        modelo.actualizar_capacidad('Diana', 3)
+        asignaciones, costo_total, sin_asignar = modelo.resolver()
+    """
+
+    FUENTE, SUMIDERO, POR_DEFECTO = 0, 1, 2
+
+    def __init__(self, revisores, pull_requests, costos, capacidad_maxima,
+                 costo_por_defecto=COSTO_POR_DEFECTO):
+        self.costo_por_defecto = costo_por_defecto
+        self.red = RedFlujoCostoMinimo(3)
+        self.red.potencial = [0, 0, 0]
+        self.nodo_revisor = {}
+        self.salida = {}             # revisor -> arco revisor -> sumidero
+        self.desde_defecto = {}      # revisor -> arco por defecto -> revisor
+        self.arcos_revisor = {}      # revisor -> {pr: arco pr -> revisor}
+        self.nodo_pr = {}
+        self.origen = {}             # pr -> arco fuente -> pr
+        self.hacia_defecto = {}      # pr -> arco pr -> por defecto
+        self.sin_revisor = {}        # pr -> arco pr -> sumidero (sin asignar)
+        self.arcos_pr = {}           # pr -> {revisor: arco pr -> revisor}
+        self.pendientes = {}         # PRs sin flujo, en orden de llegada
+        self.arcos_muertos = 0
+
+        inicio, filas, valores = agrupar_por_columna(
+            *pares_explicitos(costos, revisores, pull_requests), len(pull_requests))
+        inicio, filas, valores = inicio.tolist(), filas.tolist(), valores.tolist()
+        costos_de_pr = [{revisores[r]: c for r, c in zip(filas[a:b], valores[a:b])}
+                        for a, b in zip(inicio, inicio[1:])]
+        # Los arcos revisor -> sumidero van primero en cada lista de
+        # adyacencia: Dijkstra los encuentra antes que los arcos de los PRs
+        for revisor in revisores:
+            self._agregar_nodo_revisor(revisor, capacidad_maxima[revisor])
+        for pr, costos_pr in zip(pull_requests, costos_de_pr):
+            self._agregar_nodo_pr(pr, costos_pr)
+        self.red.completar(self.FUENTE, self.SUMIDERO, potencial=None)
+        self.pendientes = {}
+
+    def _agregar_nodo_revisor(self, revisor, capacidad):
+        red = self.red
+        nodo = red.agregar_nodo()
+        self.nodo_revisor[revisor] = nodo
+        self.salida[revisor] = red.agregar_arco(nodo, self.SUMIDERO, capacidad, 0)
+        # Sin límite propio: el cupo lo controla el arco revisor -> sumidero
+        self.desde_defecto[revisor] = red.agregar_arco(self.POR_DEFECTO, nodo, 2 ** 31, 0)
+        self.arcos_revisor[revisor] = {}
+        return nodo
+
+    def _agregar_nodo_pr(self, pr, costos_pr):
+        red = self.red
+        nodo = red.agregar_nodo()
+        self.nodo_pr[pr] = nodo
+        self.origen[pr] = red.agregar_arco(self.FUENTE, nodo, 1, 0)
+        self.hacia_defecto[pr] = red.agregar_arco(nodo, self.POR_DEFECTO, 1, self.costo_por_defecto)
+        self.sin_revisor[pr] = red.agregar_arco(nodo, self.SUMIDERO, 1, _COSTO_SIN_REVISOR)
+        self.arcos_pr[pr] = {}
+        for revisor, c in costos_pr.items():
+            if revisor in self.nodo_revisor:
+                self._agregar_arco_par(revisor, pr, c)
+        red.elevar_potencial(nodo)
+        self.pendientes[pr] = None
+
+    def _agregar_arco_par(self, revisor, pr, costo):
+        if costo > self.costo_por_defecto:
+            raise ValueError(f"El costo de ({revisor}, {pr}) supera el costo por defecto")
+        arco = self.red.agregar_arco(self.nodo_pr[pr], self.nodo_revisor[revisor], 1, costo)
+        self.arcos_pr[pr][revisor] = arco
+        self.arcos_revisor[revisor][pr] = arco
+        return arco
+
+    def _desactivar(self, arco):
+        self.red.capacidad[arco] = self.red.capacidad[arco ^ 1] = 0
+        self.arcos_muertos += 1
+
+    def _revisor_de(self, pr):
+        """
+        Revisor asignado a `pr` y arco usado: (None, None) si está pendiente
+        y (None, arco sin revisor) si no cupo.
+        """
+        red = self.red
+        if not red.flujo(self.origen[pr]):
+            return None, None
+        if red.flujo(self.sin_revisor[pr]):
+            return None, self.sin_revisor[pr]
+        for revisor, arco in self.arcos_pr[pr].items():
+            if red.flujo(arco):
+                return revisor, arco
+        # Pasó por el nodo por defecto: cualquier revisor con flujo desde él
+        for revisor, arco in self.desde_defecto.items():
+            if red.flujo(arco):
+                return revisor, arco
+        return None, None
+
+    def _desasignar(self, pr, revisor=None, arco=None):
+        """Quita el flujo de `pr` y lo deja pendiente; devuelve su revisor anterior."""
+        if arco is None:
+            revisor, arco = self._revisor_de(pr)
+            if arco is None:
+                return None
+        red = self.red
+        red.enviar(self.origen[pr], -1)
+        red.enviar(arco, -1)
+        if revisor is not None:
+            if arco == self.desde_defecto[revisor]:
+                red.enviar(self.hacia_defecto[pr], -1)
+            red.enviar(self.salida[revisor], -1)
+        red.elevar_potencial(self.nodo_pr[pr])
+        self.pendientes[pr] = None
+        return revisor
+
+    def _liberar_cupo(self, revisor):
+        if revisor is not None:
+            self.red.reparar_arco(self.salida[revisor], self.FUENTE)
+
+    def agregar_pr(self, pr, costos_pr):
+        """
+        Agrega un PR nuevo.
+
+        Args:
+            pr: Identificador del PR
+            costos_pr: Diccionario {revisor: costo}; los revisores ausentes
+                       usan `costo_por_defecto`
+        """
+        self._agregar_nodo_pr(pr, costos_pr)
+
+    def retirar_pr(self, pr):
+        """Quita un PR (revisado o cerrado) y re-optimiza el cupo que libera."""
+        revisor = self._desasignar(pr)
+        self.pendientes.pop(pr, None)
+        self._desactivar(self.origen.pop(pr))
+        self._desactivar(self.hacia_defecto.pop(pr))
+        self._desactivar(self.sin_revisor.pop(pr))
+        for r, arco in self.arcos_pr.pop(pr).items():
+            del self.arcos_revisor[r][pr]
+            self._desactivar(arco)
+        del self.nodo_pr[pr]
+        self._liberar_cupo(revisor)
+        self._compactar_si_conviene()
+
+    def agregar_revisor(self, revisor, capacidad, costos_revisor=None):
+        """
+        Agrega un revisor; los PRs que lo prefieren se le reasignan.
+
+        Args:
+            revisor: Nombre del revisor
+            capacidad: Máximo de PRs
+            costos_revisor: Diccionario {pr: costo}; los PRs ausentes usan
+                            `costo_por_defecto`
+        """
+        red = self.red
+        nodo = self._agregar_nodo_revisor(revisor, capacidad)
+        for pr, c in (costos_revisor or {}).items():
+            if pr in self.nodo_pr:
+                self._agregar_arco_par(revisor, pr, c)
+        # Potencial más alto que deja válidos los arcos que entran al revisor;
+        # luego el cupo nuevo se re-optimiza como cupo liberado
+        potencial = red.potencial
+        potencial[nodo] = min([potencial[self.nodo_pr[pr]] + red.costo[arco]
+                               for pr, arco in self.arcos_revisor[revisor].items()]
+                              + [potencial[self.POR_DEFECTO]])
+        self._liberar_cupo(revisor)
+
+    def _quitar_revisiones(self, revisor, cantidad):
+        """Deja pendientes `cantidad` PRs del revisor."""
+        red = self.red
+        for pr, arco in list(self.arcos_revisor[revisor].items()):
+            if cantidad == 0:
+                return
+            if red.flujo(arco):
+                self._desasignar(pr, revisor, arco)
+                cantidad -= 1
+        arco = self.desde_defecto[revisor]
+        if cantidad and red.flujo(arco):
+            for pr, hacia in self.hacia_defecto.items():
+                if red.flujo(hacia):
+                    self._desasignar(pr, revisor, arco)
+                    cantidad -= 1
+                    if cantidad == 0 or not red.flujo(arco):
+                        return
+
+    def retirar_revisor(self, revisor):
+        """Quita un revisor; sus PRs quedan pendientes para `resolver`."""
+        self._quitar_revisiones(revisor, self.red.flujo(self.salida[revisor]))
+        self._desactivar(self.salida.pop(revisor))
+        self._desactivar(self.desde_defecto.pop(revisor))
+        for pr, arco in self.arcos_revisor.pop(revisor).items():
+            del self.arcos_pr[pr][revisor]
+            self._desactivar(arco)
+        del self.nodo_revisor[revisor]
+        self._compactar_si_conviene()
+
+    def actualizar_capacidad(self, revisor, capacidad):
+        """Cambia el máximo de PRs del revisor."""
+        red = self.red
+        arco = self.salida[revisor]
+        carga = red.flujo(arco)
+        if carga > capacidad:
+            self._quitar_revisiones(revisor, carga - capacidad)
+            carga = capacidad
+        red.capacidad[arco] = capacidad - carga
+        self._liberar_cupo(revisor)
+
+    def actualizar_costo(self, revisor, pr, costo):
+        """Cambia el costo del par (revisor, pr); solo re-optimiza ese PR si hace falta."""
+        red = self.red
+        arco = self.arcos_pr[pr].get(revisor)
+        if arco is None:
+            arco = self._agregar_arco_par(revisor, pr, costo)
+            usado = False
+        else:
+            if costo > self.costo_por_defecto:
+                raise ValueError(f"El costo de ({revisor}, {pr}) supera el costo por defecto")
+            usado = red.flujo(arco) > 0
+            if usado and costo <= red.costo[arco]:
+                # Bajar el costo del arco usado no rompe la optimalidad
+                red.fijar_costo(arco, costo)
+                return
+            red.fijar_costo(arco, costo)
+        potencial = red.potencial
+        if not usado and costo + potencial[self.nodo_pr[pr]] - potencial[self.nodo_revisor[revisor]] >= 0:
+            return
+        anterior = self._desasignar(pr)
+        if anterior is None:
+            red.elevar_potencial(self.nodo_pr[pr])
+        self._liberar_cupo(anterior)
+
+    def resolver(self):
+        """
+        Asigna los PRs pendientes partiendo de la solución vigente.
+
+        Returns:
+            asignaciones: Diccionario {revisor: [prs]}
+            costo_total: Costo total de la asignación vigente
+            sin_asignar: PRs que no caben en la capacidad disponible (la
+                         asignación del resto es de costo mínimo entre las
+                         que revisan la mayor cantidad de PRs)
+        """
+        red = self.red
+        if self.pendientes:
+            red.completar(self.FUENTE, self.SUMIDERO, potencial=red.potencial,
+                          arcos=[self.origen[pr] for pr in self.pendientes])
+            self.pendientes = {}
+
+        asignaciones = {revisor: [] for revisor in self.nodo_revisor}
+        por_defecto = []
+        sin_asignar = []
+        costo_total = 0
+        for pr, arcos in self.arcos_pr.items():
+            if red.flujo(self.sin_revisor[pr]):
+                sin_asignar.append(pr)
+                continue
+            for revisor, arco in arcos.items():
+                if red.flujo(arco):
+                    asignaciones[revisor].append(pr)
+                    costo_total += red.costo[arco]
+                    break
+            else:
+                por_defecto.append(pr)
+        for revisor, arco in self.desde_defecto.items():
+            for _ in range(red.flujo(arco)):
+                asignaciones[revisor].append(por_defecto.pop())
+                costo_total += self.costo_por_defecto
+        return asignaciones, costo_total, sin_asignar
+
+    def _compactar_si_conviene(self):
+        """Reconstruye la red cuando los arcos desactivados superan a los vivos."""
+        if self.arcos_muertos > len(self.red.destino) // 4:
+            self.compactar()
+
+    def compactar(self):
+        """
+        Reconstruye la red sin los arcos y nodos retirados, conservando flujo
+        y potenciales (la asignación no cambia).
+        """
+        anterior = self.red
+        red = RedFlujoCostoMinimo(3)
+        red.potencial = anterior.potencial[:3]
+        mapa = {0: 0, 1: 1, 2: 2}
+
+        def copiar(arco):
+            capacidad = anterior.capacidad[arco] + anterior.capacidad[arco ^ 1]
+            nuevo = red.agregar_arco(mapa[anterior.destino[arco ^ 1]], mapa[anterior.destino[arco]],
+                                     capacidad, anterior.costo[arco])
+            red.enviar(nuevo, anterior.flujo(arco))
+            return nuevo
+
+        for revisor, nodo in self.nodo_revisor.items():
+            mapa[nodo] = red.agregar_nodo()
+            red.potencial[mapa[nodo]] = anterior.potencial[nodo]
+            self.nodo_revisor[revisor] = mapa[nodo]
+            self.salida[revisor] = copiar(self.salida[revisor])
+            self.desde_defecto[revisor] = copiar(self.desde_defecto[revisor])
+        for pr, nodo in self.nodo_pr.items():
+            mapa[nodo] = red.agregar_nodo()
+            red.potencial[mapa[nodo]] = anterior.potencial[nodo]
+            self.nodo_pr[pr] = mapa[nodo]
+            self.origen[pr] = copiar(self.origen[pr])
+            self.hacia_defecto[pr] = copiar(self.hacia_defecto[pr])
+            self.sin_revisor[pr] = copiar(self.sin_revisor[pr])
+            for revisor, arco in self.arcos_pr[pr].items():
+                nuevo = copiar(arco)
+                self.arcos_pr[pr][revisor] = nuevo
+                self.arcos_revisor[revisor][pr] = nuevo
+        self.red = red
+        self.arcos_muertos = 0
+
+
+def resolver_revisores_incremental():
+    """
+    Demostración de `ModeloRevisores`: llega un PR, se cierra otro y un
+    revisor cambia su capacidad; cada paso re-optimiza solo lo afectado.
+    """
+    revisores = ['Alice', 'Bob', 'Charlie', 'Diana']
+    pull_requests = ['PR-001', 'PR-002', 'PR-003', 'PR-004', 'PR-005']
+    costos = {
+        ('Alice', 'PR-001'): 2, ('Alice', 'PR-002'): 5, ('Alice', 'PR-003'): 3,
+        ('Alice', 'PR-004'): 4, ('Alice', 'PR-005'): 2,
+        ('Bob', 'PR-001'): 4, ('Bob', 'PR-002'): 2, ('Bob', 'PR-003'): 5,
+        ('Bob', 'PR-004'): 3, ('Bob', 'PR-005'): 4,
+        ('Charlie', 'PR-001'): 3, ('Charlie', 'PR-002'): 4, ('Charlie', 'PR-003'): 2,
+        ('Charlie', 'PR-004'): 5, ('Charlie', 'PR-005'): 3,
+        ('Diana', 'PR-001'): 5, ('Diana', 'PR-002'): 3, ('Diana', 'PR-003'): 4,
+        ('Diana', 'PR-004'): 2, ('Diana', 'PR-005'): 5
+    }
+    capacidad_maxima = {'Alice': 2, 'Bob': 2, 'Charlie': 2, 'Diana': 2}
+
+    modelo = ModeloRevisores(revisores, pull_requests, costos, capacidad_maxima)
+    pasos = [
+        ("Asignación inicial", lambda: None),
+        ("Llega PR-006", lambda: modelo.agregar_pr('PR-006', {'Alice': 1, 'Bob': 3, 'Diana': 4})),
+        ("Se cierra PR-001", lambda: modelo.retirar_pr('PR-001')),
+        ("Alice baja a 1 PR", lambda: modelo.actualizar_capacidad('Alice', 1)),
+    ]
+
+    print("=" * 70)
+    print("ASIGNACIÓN DE REVISORES - MODELO PERSISTENTE")
+    print("=" * 70)
+    for descripcion, cambio in pasos:
+        cambio()
+        asignaciones, costo_total, sin_asignar = modelo.resolver()
+        print(f"\n{descripcion} (costo total: {costo_total})")
+        print("-" * 70)
+        for r in revisores:
+            prs_str = ", ".join(asignaciones[r]) or "(sin asignaciones)"
+            print(f"{r:<15} -> {prs_str}")
+        if sin_asignar:
+            print(f"Sin revisor: {', '.join(sin_asignar)}")
+    print("=" * 70)
+    return modelo
 
 
 if __name__ == "__main__":
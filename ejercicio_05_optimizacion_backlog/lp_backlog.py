@@ -6,10 +6,13 @@ Objetivo: Asignar proporciones de trabajo a features para maximizar valor
 útil en planificación a nivel épico.
 """
 
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 try:
-    from scipy.optimize import linprog
-    import numpy as np
-    SCIPY_AVAILABLE = True
+    from modelo_disperso import SCIPY_AVAILABLE, modelo_capacidad, resolver_modelo, imprimir_estadisticas
 except ImportError:
     SCIPY_AVAILABLE = False
 
@@ -56,19 +59,11 @@ def resolver_con_scipy(features, capacidad):
     """Resuelve usando scipy.optimize.linprog"""
     n = len(features)
     
-    # Vector de coeficientes (negativo porque linprog minimiza)
-    # Maximizar valor = Minimizar -valor
-    c = [-feat["valor"] for feat in features]
-    
-    # Restricción de capacidad: suma(esfuerzo_j * y_j) <= capacidad
-    A_ub = [[feat["esfuerzo"] for feat in features]]
-    b_ub = [capacidad]
-    
-    # Límites: 0 <= y_j <= 1
-    bounds = [(0, 1) for _ in range(n)]
-    
-    # Resolver
-    resultado = linprog(c, A_ub=A_ub, b_ub=b_ub, bounds=bounds, method='highs')
+    # Maximizar valor = Minimizar -valor, con suma(esfuerzo_j * y_j) <= capacidad
+    # y 0 <= y_j <= 1 (el modelo se arma en formato disperso)
+    modelo = modelo_capacidad([feat["valor"] for feat in features],
+                              [feat["esfuerzo"] for feat in features], capacidad)
+    resultado = resolver_modelo(modelo)
     
     if resultado.success:
         print("\n" + "=" * 70)
@@ -95,6 +90,7 @@ def resolver_con_scipy(features, capacidad):
         print(f"\nValor total máximo: {valor_total:.2f}")
         print(f"Esfuerzo total utilizado: {esfuerzo_total:.2f} horas")
         print(f"Esfuerzo restante: {capacidad - esfuerzo_total:.2f} horas")
+        imprimir_estadisticas(modelo)
         print("=" * 70)
     else:
         print("\nNo se encontró solución óptima.")
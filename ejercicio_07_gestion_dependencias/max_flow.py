@@ -6,12 +6,22 @@ Objetivo: Asignar capacidad de integración entre ramas y entornos para
 maximizar throughput de entregas.
 """
 
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 try:
     import networkx as nx
     NETWORKX_AVAILABLE = True
 except ImportError:
     NETWORKX_AVAILABLE = False
 
+try:
+    from modelo_disperso import SCIPY_AVAILABLE, modelo_flujo_maximo, resolver_modelo, imprimir_estadisticas
+except ImportError:
+    SCIPY_AVAILABLE = False
+
 
 def resolver_max_flow():
     """
@@ -27,6 +37,8 @@ def resolver_max_flow():
     
     if NETWORKX_AVAILABLE:
         resolver_con_networkx()
+    elif SCIPY_AVAILABLE:
+        resolver_con_scipy()
     else:
         resolver_con_pulp()
 
@@ -122,6 +134,49 @@ def resolver_con_networkx():
     return valor_flujo, flujo_dict
 
 
+def resolver_con_scipy():
+    """Resuelve con scipy.optimize.linprog sobre la matriz de incidencia dispersa"""
+    print("\n⚠ NetworkX no está instalado. Usando scipy (LP disperso)...")
+    print("   Instala NetworkX para mejor rendimiento: pip install networkx")
+    
+    # Definir red (mismo ejemplo)
+    nodos = ['source', 'branch_dev', 'branch_staging', 'env_test', 
+            'env_staging', 'env_prod', 'sink']
+    
+    arcos = [
+        ('source', 'branch_dev', 10),
+        ('source', 'branch_staging', 8),
+        ('branch_dev', 'env_test', 6),
+        ('branch_dev', 'env_staging', 5),
+        ('branch_staging', 'env_staging', 7),
+        ('env_test', 'env_staging', 4),
+        ('env_staging', 'env_prod', 8),
+        ('env_prod', 'sink', 10)
+    ]
+    
+    modelo = modelo_flujo_maximo(nodos, arcos, 'source', 'sink')
+    resultado = resolver_modelo(modelo)
+    
+    if resultado.success:
+        print("\n" + "=" * 70)
+        print("SOLUCIÓN: FLUJO MÁXIMO")
+        print("=" * 70)
+        
+        valor_flujo = -resultado.fun
+        print(f"\nValor del flujo máximo: {valor_flujo}")
+        
+        print("\nFlujo por arco:")
+        print("-" * 70)
+        for (origen, destino, capacidad), flujo in zip(arcos, resultado.x):
+            print(f"{origen} -> {destino}: {flujo:.2f} / {capacidad}")
+        
+        imprimir_estadisticas(modelo)
+        print("=" * 70)
+        return valor_flujo, resultado.x
+    else:
+        print("\nNo se encontró solución óptima.")
+
+
 def resolver_con_pulp():
     """Resuelve usando PuLP (formulación de programación lineal)"""
     try:
@@ -159,13 +214,18 @@ def resolver_con_pulp():
                                 for origen, destino, _ in arcos 
                                 if destino == 'sink'])
         
+        # Arcos entrantes y salientes por nodo (una sola pasada sobre los arcos)
+        entrantes = {nodo: [] for nodo in nodos}
+        salientes = {nodo: [] for nodo in nodos}
+        for origen, destino, _ in arcos:
+            salientes[origen].append(f[(origen, destino)])
+            entrantes[destino].append(f[(origen, destino)])
+        
         # Restricciones de conservación de flujo (para cada nodo intermedio)
         nodos_intermedios = [n for n in nodos if n not in ['source', 'sink']]
         for nodo in nodos_intermedios:
             # Flujo entrante = Flujo saliente
-            flujo_entrante = pulp.lpSum([f[(o, d)] for o, d, _ in arcos if d == nodo])
-            flujo_saliente = pulp.lpSum([f[(o, d)] for o, d, _ in arcos if o == nodo])
-            problema += flujo_entrante == flujo_saliente
+            problema += pulp.lpSum(entrantes[nodo]) == pulp.lpSum(salientes[nodo])
         
         # Resolver
         problema.solve(pulp.PULP_CBC_CMD(msg=0))
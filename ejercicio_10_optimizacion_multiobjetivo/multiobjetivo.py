@@ -6,6 +6,19 @@ Objetivo: Asignación de tareas donde además de tiempo se consideran costos
 (salarios por hora distintos) y se requiere equilibrio entre ambas métricas.
 """
 
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tabla_costos import matriz_costos
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 try:
     import pulp
     PULP_AVAILABLE = True
@@ -131,22 +144,28 @@ def generar_frente_pareto(programadores, tareas, tiempos, costos):
 
 
 def resolver_con_alpha(programadores, tareas, tiempos, costos, alpha):
-    """Resuelve el problema con un peso α dado"""
+    """
+    Resuelve el problema con un peso α dado.
+
+    `tiempos` y `costos` pueden ser diccionarios {(programador, tarea): valor}
+    o TablaCostos; en ambos casos se leen una sola vez como matrices NumPy y
+    la combinación α*T + (1-α)*C se calcula de forma vectorizada.
+    """
+    T = matriz_costos(tiempos, programadores, tareas)
+    C = matriz_costos(costos, programadores, tareas)
+    pares = [(p, t) for p in programadores for t in tareas]
+    
     # Crear problema
     problema = pulp.LpProblem("Multiobjetivo", pulp.LpMinimize)
     
     # Variables binarias
-    x = pulp.LpVariable.dicts("Asignacion",
-                              [(p, t) for p in programadores for t in tareas],
-                              cat='Binary')
-    
-    # Función objetivo combinada: α*Tiempo + (1-α)*Costo
-    tiempo_total = pulp.lpSum([tiempos[(p, t)] * x[(p, t)]
-                               for p in programadores for t in tareas])
-    costo_total = pulp.lpSum([costos[(p, t)] * x[(p, t)]
-                              for p in programadores for t in tareas])
+    x = pulp.LpVariable.dicts("Asignacion", pares, cat='Binary')
     
-    problema += alpha * tiempo_total + (1 - alpha) * costo_total
+    # Función objetivo combinada: α*Tiempo + (1-α)*Costo (coeficientes en el
+    # orden de `pares`)
+    combinada = alpha * T + (1 - alpha) * C
+    problema += pulp.LpAffineExpression(zip((x[par] for par in pares),
+                                            combinada.ravel().tolist()))
     
     # Restricciones: cada tarea a un programador, cada programador una tarea
     for t in tareas:
@@ -159,18 +178,10 @@ def resolver_con_alpha(programadores, tareas, tiempos, costos, alpha):
     problema.solve(pulp.PULP_CBC_CMD(msg=0))
     
     if problema.status == pulp.LpStatusOptimal:
-        asignaciones = []
-        tiempo_real = 0
-        costo_real = 0
-        
-        for p in programadores:
-            for t in tareas:
-                if pulp.value(x[(p, t)]) == 1:
-                    asignaciones.append((p, t))
-                    tiempo_real += tiempos[(p, t)]
-                    costo_real += costos[(p, t)]
-        
-        return tiempo_real, costo_real, asignaciones
+        elegidos = [pulp.value(x[par]) == 1 for par in pares]
+        asignaciones = [par for par, elegido in zip(pares, elegidos) if elegido]
+        elegidos = np.array(elegidos, dtype=bool).reshape(T.shape)
+        return T[elegidos].sum().item(), C[elegidos].sum().item(), asignaciones
     
     return None, None, []
 
@@ -0,0 +1,397 @@
+"""
+Flujo de costo mínimo en Python puro, compartido por los ejercicios.
+
+No depende de NumPy, SciPy ni de un solver externo, así que sirve como
+respaldo en entornos mínimos y para redes dispersas (transporte, transbordo,
+asignación de revisores) resueltas en el mismo proceso.
+
+Uso:
+    red = RedFlujoCostoMinimo(num_nodos)
+    arco = red.agregar_arco(origen, destino, capacidad, costo)
+    primero = red.agregar_arcos(origenes, destinos, capacidades, costos)
+    flujo_total, costo_total = red.resolver(fuente, sumidero)
+    red.flujo(arco)
+
+Tras un arranque goloso con pocas unidades pendientes, `red.completar` es
+más rápido que `red.resolver` en redes grandes. Los potenciales finales
+quedan en `red.potencial` para re-optimizar la misma red tras cambios
+pequeños (ver `reparar_arco` y `elevar_potencial`).
+"""
+
+import heapq
+from collections import deque
+
+
+class RedFlujoCostoMinimo:
+    """
+    Red de flujo de costo mínimo en Python puro (sin NumPy, SciPy ni CBC).
+
+    Los arcos se guardan en arreglos planos (destino, capacidad, costo) en
+    pares: el arco e y su residual inverso e ^ 1. Cada nodo guarda la lista de
+    índices de sus arcos salientes.
+
+    Se resuelve con caminos mínimos sucesivos en su variante primal-dual:
+    Dijkstra con potenciales sobre costos reducidos y, en cada fase, todos
+    los aumentos posibles sobre los arcos de costo reducido cero. Con
+    capacidades y ofertas enteras el flujo resultante es entero.
+    """
+
+    def __init__(self, num_nodos):
+        self.num_nodos = num_nodos
+        self.adyacencia = [[] for _ in range(num_nodos)]
+        self.destino = []
+        self.capacidad = []
+        self.costo = []
+        self.potencial = None
+        self._costos_enteros = True
+        self._escala = 0
+
+    def agregar_nodo(self):
+        """Agrega un nodo aislado y devuelve su índice."""
+        self.adyacencia.append([])
+        if self.potencial is not None:
+            self.potencial.append(0)
+        self.num_nodos += 1
+        return self.num_nodos - 1
+
+    def agregar_arco(self, origen, destino, capacidad, costo):
+        """Agrega el arco origen -> destino y devuelve su índice."""
+        indice = len(self.destino)
+        self.adyacencia[origen].append(indice)
+        self.adyacencia[destino].append(indice + 1)
+        self.destino.extend((destino, origen))
+        self.capacidad.extend((capacidad, 0))
+        self.costo.extend((costo, -costo))
+        self._registrar_costo(costo)
+        return indice
+
+    def agregar_arcos(self, origenes, destinos, capacidades, costos):
+        """
+        Agrega muchos arcos de una vez a partir de listas paralelas (por
+        ejemplo, vectores NumPy convertidos con `tolist()`).
+
+        Returns:
+            Índice del primer arco; el arco k queda en primero + 2·k
+        """
+        primero = len(self.destino)
+        cantidad = len(destinos)
+        intercalados = [0] * (2 * cantidad)
+        intercalados[::2], intercalados[1::2] = destinos, origenes
+        self.destino.extend(intercalados)
+        intercalados[::2], intercalados[1::2] = capacidades, [0] * cantidad
+        self.capacidad.extend(intercalados)
+        intercalados[::2], intercalados[1::2] = costos, [-c for c in costos]
+        self.costo.extend(intercalados)
+        adyacencia = self.adyacencia
+        for arco, origen, destino in zip(range(primero, primero + 2 * cantidad, 2),
+                                         origenes, destinos):
+            adyacencia[origen].append(arco)
+            adyacencia[destino].append(arco + 1)
+        if cantidad:
+            self._costos_enteros = self._costos_enteros and all(isinstance(c, int) for c in costos)
+            self._escala = max(self._escala, max(map(abs, costos)))
+        return primero
+
+    def _registrar_costo(self, costo):
+        self._costos_enteros = self._costos_enteros and isinstance(costo, int)
+        self._escala = max(self._escala, abs(costo))
+
+    def fijar_costo(self, arco, costo):
+        """Cambia el costo unitario de un arco (y el de su inverso)."""
+        self.costo[arco] = costo
+        self.costo[arco ^ 1] = -costo
+        self._registrar_costo(costo)
+
+    def _tolerancia(self):
+        return 0 if self._costos_enteros else 1e-9 * max(1, self._escala)
+
+    def flujo(self, arco):
+        """Flujo enviado por el arco (capacidad acumulada en su inverso)."""
+        return self.capacidad[arco ^ 1]
+
+    def enviar(self, arco, cantidad):
+        """Fija flujo inicial en un arco (por ejemplo, una solución golosa)."""
+        self.capacidad[arco] -= cantidad
+        self.capacidad[arco ^ 1] += cantidad
+
+    def _potenciales_iniciales(self, fuente):
+        """
+        Bellman-Ford (cola FIFO) solo si hay arcos con costo negativo. Igual
+        que en Dijkstra, se ignoran los arcos que entran a la fuente.
+        """
+        potencial = [0] * self.num_nodos
+        if all(c >= 0 for e, c in enumerate(self.costo) if self.capacidad[e] > 0):
+            return potencial
+        infinito = float('inf')
+        distancia = [infinito] * self.num_nodos
+        distancia[fuente] = 0
+        en_cola = [False] * self.num_nodos
+        cola = deque([fuente])
+        en_cola[fuente] = True
+        while cola:
+            u = cola.popleft()
+            en_cola[u] = False
+            for e in self.adyacencia[u]:
+                if self.capacidad[e] > 0:
+                    v = self.destino[e]
+                    if v != fuente and distancia[u] + self.costo[e] < distancia[v]:
+                        distancia[v] = distancia[u] + self.costo[e]
+                        if not en_cola[v]:
+                            en_cola[v] = True
+                            cola.append(v)
+        return [d if d < infinito else 0 for d in distancia]
+
+    def _dijkstra(self, fuente, sumidero, potencial, tolerancia, origen=None, limite=None):
+        """
+        Distancias con costos reducidos desde `origen` (por defecto la
+        fuente); se detiene al extraer el sumidero o un nodo a distancia >=
+        `limite`. Devuelve también los nodos extraídos, que son los únicos
+        con distancia final menor a la del corte.
+        """
+        infinito = float('inf')
+        distancia = [infinito] * self.num_nodos
+        padre = [-1] * self.num_nodos
+        origen = fuente if origen is None else origen
+        distancia[origen] = 0
+        cola = [(0, origen)]
+        extraidos = []
+        adyacencia, destino, capacidad, costo = self.adyacencia, self.destino, self.capacidad, self.costo
+        while cola:
+            d, u = heapq.heappop(cola)
+            if d > distancia[u]:
+                continue
+            if u == sumidero or (limite is not None and d >= limite):
+                break
+            extraidos.append(u)
+            base = d + potencial[u]
+            for e in adyacencia[u]:
+                if capacidad[e] > 0:
+                    v = destino[e]
+                    if v == fuente:
+                        continue
+                    nueva = base + costo[e] - potencial[v]
+                    if nueva < distancia[v] - tolerancia:
+                        distancia[v] = nueva
+                        padre[v] = e
+                        if v == sumidero and nueva <= d + tolerancia:
+                            # Ninguna etiqueta pendiente es menor: distancia final
+                            return distancia, padre, extraidos
+                        heapq.heappush(cola, (nueva, v))
+        return distancia, padre, extraidos
+
+    def _aumentar_fase(self, fuente, sumidero, potencial, tolerancia):
+        """
+        Aumenta por caminos de costo reducido cero (DFS con arco actual).
+        Tras cada aumento se retrocede solo hasta el primer arco saturado.
+        """
+        adyacencia, destino, capacidad, costo = self.adyacencia, self.destino, self.capacidad, self.costo
+        actual = [0] * self.num_nodos
+        muerto = [False] * self.num_nodos
+        en_camino = [False] * self.num_nodos
+        enviado = costo_fase = 0
+        nodos, arcos = [fuente], []
+        en_camino[fuente] = True
+        u = fuente
+        while True:
+            if u == sumidero:
+                delta = min(capacidad[e] for e in arcos)
+                corte = None
+                for posicion, e in enumerate(arcos):
+                    capacidad[e] -= delta
+                    capacidad[e ^ 1] += delta
+                    costo_fase += delta * costo[e]
+                    if corte is None and capacidad[e] == 0:
+                        corte = posicion
+                enviado += delta
+                for nodo in nodos[corte + 1:]:
+                    en_camino[nodo] = False
+                del nodos[corte + 1:]
+                del arcos[corte:]
+                u = nodos[-1]
+                continue
+
+            lista = adyacencia[u]
+            fin = len(lista)
+            k = actual[u]
+            pu = potencial[u]
+            while k < fin:
+                e = lista[k]
+                if capacidad[e] > 0:
+                    v = destino[e]
+                    if not muerto[v] and not en_camino[v]:
+                        reducido = costo[e] + pu - potencial[v]
+                        if -tolerancia <= reducido <= tolerancia:
+                            break
+                k += 1
+            actual[u] = k
+            if k == fin:
+                # Sin salida: se descarta el nodo y se retrocede
+                muerto[u] = True
+                en_camino[u] = False
+                if u == fuente:
+                    return enviado, costo_fase
+                nodos.pop()
+                arcos.pop()
+                u = nodos[-1]
+                actual[u] += 1
+                continue
+            arcos.append(lista[k])
+            nodos.append(v)
+            en_camino[v] = True
+            u = v
+
+    def resolver(self, fuente, sumidero, limite=None, potencial=None):
+        """
+        Envía el máximo flujo (hasta `limite`) de `fuente` a `sumidero` con
+        costo mínimo.
+
+        Si ya hay flujo inicial (ver `enviar`), `potencial` debe dejar costos
+        reducidos >= 0 en todos los arcos residuales que no entran a la
+        fuente; el resultado es óptimo cuando al final todos los arcos que
+        salen de la fuente quedan saturados.
+
+        Returns:
+            flujo_total, costo_total (solo del flujo agregado en esta llamada)
+        """
+        if potencial is None:
+            potencial = self._potenciales_iniciales(fuente)
+        else:
+            potencial = list(potencial)
+        tolerancia = self._tolerancia()
+        flujo_total = costo_total = 0
+        infinito = float('inf')
+        while limite is None or flujo_total < limite:
+            distancia, padre, _ = self._dijkstra(fuente, sumidero, potencial, tolerancia)
+            if distancia[sumidero] == infinito:
+                break
+            tope = distancia[sumidero]
+            for v in range(self.num_nodos):
+                potencial[v] += min(distancia[v], tope)
+
+            enviado, costo_fase = self._aumentar_fase(fuente, sumidero, potencial, tolerancia)
+            if enviado == 0:
+                # Respaldo: aumentar por el camino de Dijkstra
+                arcos, v = [], sumidero
+                while v != fuente:
+                    arcos.append(padre[v])
+                    v = self.destino[padre[v] ^ 1]
+                enviado = min(self.capacidad[e] for e in arcos)
+                for e in arcos:
+                    self.capacidad[e] -= enviado
+                    self.capacidad[e ^ 1] += enviado
+                    costo_fase += enviado * self.costo[e]
+            flujo_total += enviado
+            costo_total += costo_fase
+        self.potencial = potencial
+        return flujo_total, costo_total
+
+    def completar(self, fuente, sumidero, potencial=None, arcos=None):
+        """
+        Variante de `resolver` que satura los arcos de la fuente uno a uno:
+        cada unidad pendiente busca su camino mínimo desde su propio nodo
+        (Dijkstra con salida temprana) y solo se actualiza el potencial de
+        los nodos extraídos, como en el método de Jonker-Volgenant.
+
+        Conviene tras un arranque goloso que deja pocas unidades pendientes
+        en una red grande: las fases de `resolver` recorren toda la región
+        de costo reducido cero alcanzable desde la fuente aunque cada una
+        envíe una o dos unidades, mientras que aquí cada búsqueda se limita
+        al entorno de su nodo. El óptimo es el mismo cuando todos los arcos
+        de la fuente quedan saturados.
+
+        Args:
+            fuente, sumidero: Nodos extremos
+            potencial: Potenciales válidos del flujo actual (None = calcularlos)
+            arcos: Arcos de la fuente a saturar (None = todos)
+
+        Returns:
+            flujo_total, costo_total (solo del flujo agregado en esta llamada)
+        """
+        if potencial is None:
+            potencial = self._potenciales_iniciales(fuente)
+        else:
+            potencial = list(potencial)
+        tolerancia = self._tolerancia()
+        capacidad, destino, costo = self.capacidad, self.destino, self.costo
+        infinito = float('inf')
+        flujo_total = costo_total = 0
+        for inicial in self.adyacencia[fuente] if arcos is None else arcos:
+            while capacidad[inicial] > 0:
+                origen = destino[inicial]
+                distancia, padre, extraidos = self._dijkstra(fuente, sumidero, potencial,
+                                                             tolerancia, origen)
+                tope = distancia[sumidero]
+                if tope == infinito:
+                    break
+                # Desplazar por -tope: los nodos no extraídos no cambian
+                for v in extraidos:
+                    potencial[v] += distancia[v] - tope
+
+                arcos, v = [inicial], sumidero
+                while v != origen:
+                    arcos.append(padre[v])
+                    v = destino[padre[v] ^ 1]
+                enviado = min(capacidad[e] for e in arcos)
+                for e in arcos:
+                    capacidad[e] -= enviado
+                    capacidad[e ^ 1] += enviado
+                    costo_total += enviado * costo[e]
+                flujo_total += enviado
+        self.potencial = potencial
+        return flujo_total, costo_total
+
+    def elevar_potencial(self, nodo):
+        """
+        Da a `nodo` el menor potencial que deja costos reducidos >= 0 en sus
+        arcos residuales salientes. Es válido para nodos cuyo único arco
+        residual entrante viene de la fuente (p. ej. un nodo recién agregado
+        o uno al que se le acaba de quitar todo el flujo).
+        """
+        potencial, destino, capacidad, costo = self.potencial, self.destino, self.capacidad, self.costo
+        potencial[nodo] = max((potencial[destino[e]] - costo[e]
+                               for e in self.adyacencia[nodo] if capacidad[e] > 0),
+                              default=potencial[nodo])
+
+    def reparar_arco(self, arco, fuente):
+        """
+        Restablece la optimalidad después de dar capacidad residual a `arco`
+        (por ejemplo, al liberar cupo en el arco revisor -> sumidero) cuando
+        su costo reducido queda negativo.
+
+        Mientras el arco tenga capacidad y costo reducido negativo se busca el
+        camino mínimo desde su destino hasta su origen (Dijkstra acotado por
+        ese costo reducido): si existe, el ciclo camino + arco es negativo y
+        se envía flujo por él; si no, basta subir los potenciales de los
+        nodos cercanos al destino. El trabajo depende del entorno del arco,
+        no del tamaño de la red. Requiere `self.potencial` de una resolución
+        previa.
+
+        Returns:
+            Costo del flujo re-enrutado (<= 0)
+        """
+        potencial, destino, capacidad, costo = self.potencial, self.destino, self.capacidad, self.costo
+        tolerancia = self._tolerancia()
+        u, v = destino[arco ^ 1], destino[arco]
+        costo_total = 0
+        while capacidad[arco] > 0:
+            reducido = costo[arco] + potencial[u] - potencial[v]
+            if reducido >= -tolerancia:
+                break
+            distancia, padre, extraidos = self._dijkstra(fuente, u, potencial, tolerancia,
+                                                         origen=v, limite=-reducido)
+            tope = min(distancia[u], -reducido)
+            for w in extraidos:
+                potencial[w] += distancia[w] - tope
+            if distancia[u] >= -reducido:
+                # Sin ciclo negativo: el arco queda con costo reducido 0
+                break
+            arcos, w = [arco], u
+            while w != v:
+                arcos.append(padre[w])
+                w = destino[padre[w] ^ 1]
+            enviado = min(capacidad[e] for e in arcos)
+            for e in arcos:
+                capacidad[e] -= enviado
+                capacidad[e ^ 1] += enviado
+                costo_total += enviado * costo[e]
+        return costo_total
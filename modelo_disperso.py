@@ -0,0 +1,198 @@
+"""
+Constructor de modelos LP dispersos compartido por los ejercicios.
+
+Arma las matrices de restricciones directamente en formato scipy.sparse
+(COO -> CSR) a partir de los datos de oferta/demanda, arcos o pesos, en
+lugar de listas densas de filas [0] * (m * n). Cada modelo registra su tiempo
+de construcción y la memoria de sus matrices por separado del tiempo de
+resolución.
+
+Uso desde un ejercicio:
+    modelo = modelo_transporte(oferta, demanda, costos)
+    resultado = resolver_modelo(modelo)
+    imprimir_estadisticas(modelo)
+"""
+
+import time
+
+try:
+    import numpy as np
+    from scipy.optimize import linprog
+    from scipy.sparse import coo_matrix
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+
+def _memoria_matriz(matriz):
+    """Bytes ocupados por una matriz CSR (datos + índices + punteros)."""
+    if matriz is None:
+        return 0
+    return matriz.data.nbytes + matriz.indices.nbytes + matriz.indptr.nbytes
+
+
+def _nuevo_modelo(c, A_ub=None, b_ub=None, A_eq=None, b_eq=None, bounds=None, inicio=None):
+    """Empaqueta el modelo junto con sus métricas de construcción."""
+    modelo = {
+        'c': c,
+        'A_ub': A_ub,
+        'b_ub': b_ub,
+        'A_eq': A_eq,
+        'b_eq': b_eq,
+        'bounds': bounds,
+    }
+    modelo['tiempo_construccion'] = time.perf_counter() - inicio
+    modelo['memoria_bytes'] = (c.nbytes + _memoria_matriz(A_ub) + _memoria_matriz(A_eq)
+                               + sum(v.nbytes for v in (b_ub, b_eq) if v is not None)
+                               + (bounds.nbytes if isinstance(bounds, np.ndarray) else 0))
+    modelo['no_ceros'] = sum(A.nnz for A in (A_ub, A_eq) if A is not None)
+    return modelo
+
+
+def modelo_transporte(oferta, demanda, costos):
+    """
+    Modelo de transporte: min c·x, sum_j x_ij <= oferta_i, sum_i x_ij = demanda_j.
+
+    La variable x_ij ocupa la posición i * n + j, igual que el vector aplanado
+    de la formulación densa original.
+
+    Args:
+        oferta: Vector (m) de horas disponibles por equipo
+        demanda: Vector (n) de horas requeridas por tarea
+        costos: Matriz (m, n) de costos
+
+    Returns:
+        Diccionario del modelo (c, A_ub, b_ub, A_eq, b_eq, bounds y métricas)
+    """
+    inicio = time.perf_counter()
+    costos = np.asarray(costos, dtype=float)
+    m, n = costos.shape
+    variables = np.arange(m * n)
+    unos = np.ones(m * n)
+
+    A_ub = coo_matrix((unos, (variables // n, variables)), shape=(m, m * n)).tocsr()
+    A_eq = coo_matrix((unos, (variables % n, variables)), shape=(n, m * n)).tocsr()
+
+    return _nuevo_modelo(costos.ravel(), A_ub, np.asarray(oferta, dtype=float),
+                         A_eq, np.asarray(demanda, dtype=float), (0, None), inicio)
+
+
+def modelo_flujo_maximo(nodos, arcos, fuente, sumidero):
+    """
+    Modelo de flujo máximo sobre la matriz de incidencia nodo-arco.
+
+    Maximiza el flujo que entra al sumidero (se minimiza su negativo) con
+    conservación de flujo en los nodos intermedios y 0 <= f_a <= capacidad_a.
+
+    Args:
+        nodos: Lista de nombres de nodos
+        arcos: Lista de tuplas (origen, destino, capacidad)
+        fuente, sumidero: Nombres de los nodos extremos
+
+    Returns:
+        Diccionario del modelo (c, A_eq, b_eq, bounds y métricas)
+    """
+    inicio = time.perf_counter()
+    intermedios = [nodo for nodo in nodos if nodo not in (fuente, sumidero)]
+    fila_de_nodo = {nodo: k for k, nodo in enumerate(intermedios)}
+    num_arcos = len(arcos)
+
+    origenes = np.array([fila_de_nodo.get(o, -1) for o, _, _ in arcos])
+    destinos = np.array([fila_de_nodo.get(d, -1) for _, d, _ in arcos])
+    capacidades = np.array([capacidad for _, _, capacidad in arcos], dtype=float)
+    indice_arco = np.arange(num_arcos)
+
+    # Entrante (+1) menos saliente (-1) en cada nodo intermedio
+    sale, entra = origenes >= 0, destinos >= 0
+    filas = np.concatenate([destinos[entra], origenes[sale]])
+    columnas = np.concatenate([indice_arco[entra], indice_arco[sale]])
+    valores = np.concatenate([np.ones(entra.sum()), -np.ones(sale.sum())])
+    A_eq = coo_matrix((valores, (filas, columnas)), shape=(len(intermedios), num_arcos)).tocsr()
+
+    c = -np.array([1.0 if d == sumidero else 0.0 for _, d, _ in arcos])
+    bounds = np.column_stack([np.zeros(num_arcos), capacidades])
+
+    return _nuevo_modelo(c, A_eq=A_eq, b_eq=np.zeros(len(intermedios)), bounds=bounds, inicio=inicio)
+
+
+def modelo_flujo_costo_minimo(num_nodos, origenes, destinos, costos, balance, capacidades=None):
+    """
+    Modelo de flujo de costo mínimo: min c·f, (sale - entra) = balance en cada
+    nodo, 0 <= f_a <= capacidad_a.
+
+    Args:
+        num_nodos: Cantidad de nodos (numerados 0..num_nodos-1)
+        origenes, destinos: Vectores de nodos extremos de cada arco
+        costos: Costo unitario por arco
+        balance: Oferta (>0) o demanda (<0) neta por nodo; debe sumar 0
+        capacidades: Capacidad por arco (None = sin límite)
+
+    Returns:
+        Diccionario del modelo (c, A_eq, b_eq, bounds y métricas)
+    """
+    inicio = time.perf_counter()
+    origenes = np.asarray(origenes)
+    destinos = np.asarray(destinos)
+    num_arcos = len(origenes)
+    indice_arco = np.arange(num_arcos)
+
+    A_eq = coo_matrix((np.concatenate([np.ones(num_arcos), -np.ones(num_arcos)]),
+                       (np.concatenate([origenes, destinos]),
+                        np.concatenate([indice_arco, indice_arco]))),
+                      shape=(num_nodos, num_arcos)).tocsr()
+
+    if capacidades is None:
+        bounds = (0, None)
+    else:
+        bounds = np.column_stack([np.zeros(num_arcos), np.asarray(capacidades, dtype=float)])
+
+    return _nuevo_modelo(np.asarray(costos, dtype=float), A_eq=A_eq,
+                         b_eq=np.asarray(balance, dtype=float), bounds=bounds, inicio=inicio)
+
+
+def modelo_capacidad(valores, pesos, capacidad):
+    """
+    Modelo de mochila continua: max valor·y, pesos·y <= capacidad, 0 <= y <= 1.
+
+    Args:
+        valores: Vector de valores por item
+        pesos: Vector de esfuerzos por item
+        capacidad: Capacidad disponible
+
+    Returns:
+        Diccionario del modelo (c, A_ub, b_ub, bounds y métricas)
+    """
+    inicio = time.perf_counter()
+    pesos = np.asarray(pesos, dtype=float)
+    n = len(pesos)
+    A_ub = coo_matrix((pesos, (np.zeros(n, dtype=int), np.arange(n))), shape=(1, n)).tocsr()
+
+    return _nuevo_modelo(-np.asarray(valores, dtype=float), A_ub, np.array([float(capacidad)]),
+                         bounds=(0, 1), inicio=inicio)
+
+
+def resolver_modelo(modelo, metodo='highs'):
+    """
+    Resuelve un modelo con scipy.optimize.linprog y registra el tiempo de
+    resolución en `modelo['tiempo_resolucion']`.
+
+    Returns:
+        Resultado de linprog
+    """
+    inicio = time.perf_counter()
+    resultado = linprog(modelo['c'], A_ub=modelo['A_ub'], b_ub=modelo['b_ub'],
+                        A_eq=modelo['A_eq'], b_eq=modelo['b_eq'],
+                        bounds=modelo['bounds'], method=metodo)
+    modelo['tiempo_resolucion'] = time.perf_counter() - inicio
+    return resultado
+
+
+def imprimir_estadisticas(modelo):
+    """Imprime tamaño, construcción y resolución del modelo por separado."""
+    restricciones = sum(A.shape[0] for A in (modelo['A_ub'], modelo['A_eq']) if A is not None)
+    print(f"\nModelo: {len(modelo['c'])} variables, {restricciones} restricciones, "
+          f"{modelo['no_ceros']} no ceros")
+    print(f"Construcción del modelo: {modelo['tiempo_construccion']:.4f} s, "
+          f"{modelo['memoria_bytes'] / 1024 ** 2:.2f} MB")
+    if 'tiempo_resolucion' in modelo:
+        print(f"Resolución: {modelo['tiempo_resolucion']:.4f} s")
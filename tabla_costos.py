@@ -0,0 +1,393 @@
+"""
+Tabla de costos compacta compartida por los ejercicios de asignación.
+
+Reemplaza los diccionarios {(fila, columna): costo} por un internador de
+nombres (nombre -> índice) y una matriz NumPy densa o scipy.sparse (CSR). Los
+pares sin costo explícito valen `por_defecto`, que se aplica solo al leer: la
+matriz densa lleva una máscara de presencia aparte, de modo que un costo
+explícito igual a `por_defecto` sigue contando como par explícito.
+
+A 1 000 revisores × 100 000 PRs el diccionario necesita ~100 M tuplas (varios
+GB); la matriz densa int32 ocupa 400 MB (más 100 MB de máscara) y la
+dispersa solo crece con los pares explícitos (20 por PR: ~25 MB).
+
+Uso desde un ejercicio:
+    tabla = TablaCostos.desde_diccionario(costos, por_defecto=999)
+    filas, columnas, valores = tabla.pares(revisores, pull_requests)
+    matriz = tabla.matriz(revisores, pull_requests)
+
+Los solvers aceptan indistintamente el diccionario o la tabla a través de
+`pares_explicitos` (tres vectores de índices y costos), `agrupar_por_columna`
+y `matriz_costos`, y arman sus modelos con operaciones de NumPy.
+"""
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from scipy.sparse import coo_matrix, issparse
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+DENSIDAD_DISPERSA = 0.1  # por debajo de esta fracción de pares explícitos se usa CSR
+
+
+class Internador:
+    """
+    Asigna un índice entero estable a cada nombre (revisor, PR, tarea).
+
+    Ejemplo:
+        revisores = Internador(['Alice', 'Bob'])
+        revisores['Bob']          # 1
+        revisores.agregar('Eve')  # 2
+        revisores.nombres         # ['Alice', 'Bob', 'Eve']
+    """
+
+    def __init__(self, nombres=()):
+        self.nombres = []
+        self.indice = {}
+        for nombre in nombres:
+            self.agregar(nombre)
+
+    def agregar(self, nombre):
+        """Devuelve el índice de `nombre`, agregándolo si es nuevo."""
+        k = self.indice.get(nombre)
+        if k is None:
+            k = self.indice[nombre] = len(self.nombres)
+            self.nombres.append(nombre)
+        return k
+
+    def posiciones(self, nombres):
+        """
+        Vector que lleva cada índice interno a su posición en `nombres`.
+
+        Returns:
+            Arreglo de largo len(self) con la posición de cada nombre en
+            `nombres`, o -1 si no aparece
+        """
+        posicion = np.full(len(self.nombres), -1, dtype=np.int64)
+        for k, nombre in enumerate(nombres):
+            i = self.indice.get(nombre)
+            if i is not None:
+                posicion[i] = k
+        return posicion
+
+    def __getitem__(self, nombre):
+        return self.indice[nombre]
+
+    def __contains__(self, nombre):
+        return nombre in self.indice
+
+    def __len__(self):
+        return len(self.nombres)
+
+    def __iter__(self):
+        return iter(self.nombres)
+
+
+class TablaCostos:
+    """
+    Costos (fila, columna) sobre una matriz densa NumPy o dispersa CSR.
+
+    Se comporta como el diccionario que reemplaza en las operaciones que usan
+    los ejercicios (`get`, `[]`, `in`, `items`, `len`), de modo que el código
+    existente sigue funcionando, pero los solvers la recorren con operaciones
+    vectorizadas (`pares`, `matriz`) en lugar de consultar par por par.
+
+    Con `por_defecto=None` no hay penalización por defecto: consultar un par
+    ausente con `[]` lanza KeyError.
+
+    Ejemplo:
+        tabla = TablaCostos.desde_diccionario(costos, por_defecto=999)
+        tabla.get(('Alice', 'PR-001'))        # costo explícito o 999
+        i, j, c = tabla.pares(revisores, pull_requests)
+        print(tabla.memoria_bytes())
+    """
+
+    def __init__(self, filas, columnas, valores, por_defecto=None, presentes=None):
+        """
+        Args:
+            filas: Internador o lista de nombres de fila
+            columnas: Internador o lista de nombres de columna
+            valores: Matriz NumPy (len(filas), len(columnas)), o matriz
+                     scipy.sparse con solo los pares explícitos
+            por_defecto: Costo de los pares ausentes (None = sin valor)
+            presentes: Máscara booleana de los pares explícitos de la matriz
+                       densa; por defecto, las celdas que no son NaN
+        """
+        self.filas = filas if isinstance(filas, Internador) else Internador(filas)
+        self.columnas = columnas if isinstance(columnas, Internador) else Internador(columnas)
+        self.por_defecto = por_defecto
+        self.dispersa = SCIPY_AVAILABLE and issparse(valores)
+        if self.dispersa:
+            valores = valores.tocsr()
+            valores.sum_duplicates()
+        else:
+            valores = np.asarray(valores)
+        if valores.shape != (len(self.filas), len(self.columnas)):
+            raise ValueError("La matriz de costos no coincide con las filas y columnas")
+        self.valores = valores
+        self.presentes = None
+        if not self.dispersa:
+            if presentes is None:
+                presentes = (~np.isnan(valores) if np.issubdtype(valores.dtype, np.floating)
+                             else np.ones(valores.shape, dtype=bool))
+            presentes = np.asarray(presentes, dtype=bool)
+            if presentes.shape != valores.shape:
+                raise ValueError("La máscara de presencia no coincide con la matriz de costos")
+            self.presentes = presentes
+
+    @classmethod
+    def desde_pares(cls, filas, columnas, indices_fila, indices_columna, costos,
+                    por_defecto=None, dispersa=None):
+        """
+        Construye la tabla a partir de vectores de índices (sin tuplas).
+
+        Args:
+            filas, columnas: Internador o lista de nombres
+            indices_fila, indices_columna: Índices de cada par explícito
+            costos: Costo de cada par explícito
+            por_defecto: Costo de los pares ausentes (None = sin valor)
+            dispersa: True = CSR, False = densa, None = según la densidad
+
+        Returns:
+            TablaCostos
+        """
+        filas = filas if isinstance(filas, Internador) else Internador(filas)
+        columnas = columnas if isinstance(columnas, Internador) else Internador(columnas)
+        indices_fila = np.asarray(indices_fila, dtype=np.int64)
+        indices_columna = np.asarray(indices_columna, dtype=np.int64)
+        costos = np.asarray(costos)
+        forma = (len(filas), len(columnas))
+
+        if dispersa is None:
+            celdas = forma[0] * forma[1]
+            dispersa = SCIPY_AVAILABLE and len(costos) < DENSIDAD_DISPERSA * celdas
+        if dispersa:
+            valores = coo_matrix((costos, (indices_fila, indices_columna)), shape=forma)
+            return cls(filas, columnas, valores, por_defecto)
+
+        if por_defecto is None:
+            tipo, relleno = np.result_type(costos, np.float64), np.nan
+        else:
+            tipo, relleno = np.result_type(costos, np.asarray(por_defecto)), por_defecto
+        if np.issubdtype(tipo, np.integer):
+            extremos = np.append(costos, relleno)
+            limites = np.iinfo(np.int32)
+            if limites.min <= extremos.min() and extremos.max() <= limites.max:
+                tipo = np.int32
+        valores = np.full(forma, relleno, dtype=tipo)
+        valores[indices_fila, indices_columna] = costos
+        presentes = np.zeros(forma, dtype=bool)
+        presentes[indices_fila, indices_columna] = True
+        return cls(filas, columnas, valores, por_defecto, presentes)
+
+    @classmethod
+    def desde_diccionario(cls, costos, filas=None, columnas=None, por_defecto=None,
+                          dispersa=None):
+        """
+        Convierte un diccionario {(fila, columna): costo} en tabla.
+
+        Args:
+            costos: Diccionario {(fila, columna): costo}
+            filas, columnas: Orden de los nombres (por defecto, el de aparición
+                             en `costos`); los pares fuera de ellas se ignoran
+            por_defecto: Costo de los pares ausentes (None = sin valor)
+            dispersa: True = CSR, False = densa, None = según la densidad
+
+        Returns:
+            TablaCostos
+        """
+        filas = Internador(filas if filas is not None else (f for f, _ in costos))
+        columnas = Internador(columnas if columnas is not None else (c for _, c in costos))
+        pares = [(filas.indice[f], columnas.indice[c], v) for (f, c), v in costos.items()
+                 if f in filas.indice and c in columnas.indice]
+        indices_fila, indices_columna, valores = zip(*pares) if pares else ((), (), ())
+        return cls.desde_pares(filas, columnas, indices_fila, indices_columna, valores,
+                               por_defecto, dispersa)
+
+    def _buscar(self, i, j):
+        """Costo explícito en la celda (i, j) o None."""
+        if self.dispersa:
+            inicio, fin = self.valores.indptr[i], self.valores.indptr[i + 1]
+            columnas = self.valores.indices[inicio:fin]
+            k = np.searchsorted(columnas, j)
+            if k < len(columnas) and columnas[k] == j:
+                return self.valores.data[inicio + k].item()
+            return None
+        return self.valores[i, j].item() if self.presentes[i, j] else None
+
+    def get(self, par, defecto=None):
+        """Costo del par (fila, columna); `defecto` o `por_defecto` si no existe."""
+        fila, columna = par
+        i, j = self.filas.indice.get(fila), self.columnas.indice.get(columna)
+        valor = None if i is None or j is None else self._buscar(i, j)
+        if valor is not None:
+            return valor
+        return defecto if defecto is not None else self.por_defecto
+
+    def __getitem__(self, par):
+        valor = self.get(par)
+        if valor is None:
+            raise KeyError(par)
+        return valor
+
+    def __contains__(self, par):
+        fila, columna = par
+        i, j = self.filas.indice.get(fila), self.columnas.indice.get(columna)
+        return i is not None and j is not None and self._buscar(i, j) is not None
+
+    def __len__(self):
+        if self.dispersa:
+            return self.valores.nnz
+        return int(self.presentes.sum())
+
+    def items(self):
+        """Itera los pares explícitos como ((fila, columna), costo)."""
+        i, j, valores = self.pares()
+        filas, columnas = self.filas.nombres, self.columnas.nombres
+        for a, b, v in zip(i.tolist(), j.tolist(), valores.tolist()):
+            yield (filas[a], columnas[b]), v
+
+    def pares(self, filas=None, columnas=None):
+        """
+        Pares explícitos como tres vectores, sin recorrer celda por celda.
+
+        Args:
+            filas, columnas: Listas de nombres; los índices devueltos son
+                             posiciones en ellas y se descartan los pares que
+                             no aparecen (por defecto, el orden interno)
+
+        Returns:
+            indices_fila, indices_columna, costos (arreglos NumPy)
+        """
+        if self.dispersa:
+            coo = self.valores.tocoo()
+            i, j, valores = coo.row.astype(np.int64), coo.col.astype(np.int64), coo.data
+        else:
+            i, j = np.nonzero(self.presentes)
+            valores = self.valores[i, j]
+        if filas is not None:
+            i = self.filas.posiciones(filas)[i]
+        if columnas is not None:
+            j = self.columnas.posiciones(columnas)[j]
+        if filas is not None or columnas is not None:
+            validos = (i >= 0) & (j >= 0)
+            i, j, valores = i[validos], j[validos], valores[validos]
+        return i, j, valores
+
+    def matriz(self, filas=None, columnas=None, defecto=None):
+        """
+        Submatriz densa en el orden de `filas` y `columnas`.
+
+        Args:
+            filas, columnas: Listas de nombres (por defecto, el orden interno)
+            defecto: Valor de los pares ausentes (por defecto `por_defecto`)
+
+        Returns:
+            Matriz NumPy (len(filas), len(columnas))
+
+        Raises:
+            KeyError: Si falta algún par y no hay valor por defecto
+        """
+        defecto = self.por_defecto if defecto is None else defecto
+        forma = (len(self.filas) if filas is None else len(filas),
+                 len(self.columnas) if columnas is None else len(columnas))
+        i, j, valores = self.pares(filas, columnas)
+        if defecto is not None:
+            resultado = np.full(forma, defecto, dtype=np.result_type(valores, np.asarray(defecto)))
+            resultado[i, j] = valores
+            return resultado
+
+        resultado = np.full(forma, np.nan)
+        resultado[i, j] = valores
+        faltantes = np.argwhere(np.isnan(resultado))
+        if len(faltantes):
+            f, c = faltantes[0]
+            nombres_f = self.filas.nombres if filas is None else filas
+            nombres_c = self.columnas.nombres if columnas is None else columnas
+            raise KeyError((nombres_f[f], nombres_c[c]))
+        return resultado.astype(valores.dtype)
+
+    def memoria_bytes(self):
+        """Bytes ocupados por la matriz (datos + índices + punteros)."""
+        if self.dispersa:
+            return self.valores.data.nbytes + self.valores.indices.nbytes + self.valores.indptr.nbytes
+        return self.valores.nbytes + self.presentes.nbytes
+
+
+def pares_explicitos(costos, filas, columnas):
+    """
+    Pares con costo explícito de un diccionario o de una TablaCostos, como
+    tres vectores NumPy paralelos (sin una tupla por par). Con una tabla se
+    extraen de forma vectorizada con `TablaCostos.pares`.
+
+    Args:
+        costos: Diccionario {(fila, columna): costo} o TablaCostos
+        filas, columnas: Listas de nombres
+
+    Returns:
+        indices_fila, indices_columna, valores (posiciones en `filas` y
+        `columnas`)
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError("NumPy no está instalado. Instálalo con: pip install numpy")
+    if isinstance(costos, TablaCostos):
+        return costos.pares(filas, columnas)
+    indice_fila = {f: k for k, f in enumerate(filas)}
+    indice_columna = {c: k for k, c in enumerate(columnas)}
+    pares = [(indice_fila[f], indice_columna[c], v) for (f, c), v in costos.items()
+             if f in indice_fila and c in indice_columna]
+    if not pares:
+        vacio = np.zeros(0, dtype=np.int64)
+        return vacio, vacio.copy(), vacio.copy()
+    i, j, valores = zip(*pares)
+    return np.array(i, dtype=np.int64), np.array(j, dtype=np.int64), np.array(valores)
+
+
+def agrupar_por_columna(indices_fila, indices_columna, valores, n_columnas):
+    """
+    Ordena los pares por columna y, dentro de cada columna, por costo y fila
+    (formato CSR por columnas): los pares de la columna j ocupan
+    inicio[j]:inicio[j + 1].
+
+    Returns:
+        inicio (n_columnas + 1), indices_fila, valores (arreglos NumPy)
+    """
+    orden = np.lexsort((indices_fila, valores, indices_columna))
+    inicio = np.zeros(n_columnas + 1, dtype=np.int64)
+    np.cumsum(np.bincount(indices_columna, minlength=n_columnas), out=inicio[1:])
+    return inicio, indices_fila[orden], valores[orden]
+
+
+def matriz_costos(costos, filas, columnas, por_defecto=None):
+    """
+    Costos de todos los pares filas × columnas como matriz NumPy.
+
+    Con una TablaCostos la matriz se arma de forma vectorizada a partir de
+    los pares explícitos, sin pasar por listas de Python.
+
+    Args:
+        costos: Diccionario {(fila, columna): costo} o TablaCostos
+        filas, columnas: Listas de nombres
+        por_defecto: Valor de los pares ausentes (None = deben existir todos)
+
+    Returns:
+        Matriz NumPy (len(filas), len(columnas))
+
+    Raises:
+        KeyError: Si falta algún par y no hay valor por defecto
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError("NumPy no está instalado. Instálalo con: pip install numpy")
+    if isinstance(costos, TablaCostos):
+        return costos.matriz(filas, columnas, por_defecto)
+    if por_defecto is None:
+        filas_costo = [[costos[(f, c)] for c in columnas] for f in filas]
+    else:
+        filas_costo = [[costos.get((f, c), por_defecto) for c in columnas] for f in filas]
+    return np.array(filas_costo).reshape(len(filas), len(columnas))